@@ -0,0 +1,62 @@
+"""Measure bulk replay export throughput per format and worker count.
+
+Records seeded games from H1 against C3, then exports every game in each format
+with one worker and with ``--workers`` workers, printing games per second and the
+average file size::
+
+    PYTHONPATH=src python benchmarks/replay_export.py --games 500 --workers 8
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+from chess.game import Game
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.replay import ReplayFormat, export_replays, record_game
+
+
+def main() -> None:
+    """Record games, export them in every format and report the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sink = logging.Logger("replay_export", level=logging.WARNING)
+    games = [
+        record_game(
+            Game(
+                rook=Rook(Coordinate("H", 1), PieceColor.WHITE),
+                bishop=Bishop(Coordinate("C", 3), PieceColor.BLACK),
+                logger=sink,
+                metrics=None,
+                rng=rng,
+            ),
+            15,
+        )
+        for _ in range(args.games)
+    ]
+    frames = sum(len(list(game.frames())) for game in games)
+    print(f"{args.games} games, {frames / args.games:.1f} frames per game")
+
+    for replay_format in ReplayFormat:
+        for workers in sorted({1, args.workers}):
+            with tempfile.TemporaryDirectory() as directory:
+                start = time.perf_counter()
+                paths = export_replays(games, directory, replay_format, workers)
+                elapsed = time.perf_counter() - start
+                size = sum(os.path.getsize(path) for path in paths) / len(paths)
+            print(
+                f"{replay_format.value:<4} workers={workers:<3} "
+                f"{len(paths) / elapsed:>9,.0f} games/s  {size / 1024:>7.1f} KiB/game",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare splitting with plain sampling on a rare bishop win.
+
+The exact probability comes from the absorbing Markov chain, so both estimators
+can be checked for bias as well as cost::
+
+    PYTHONPATH=src python benchmarks/splitting_efficiency.py --board-size 200
+"""
+
+import argparse
+import time
+
+from chess.markov import RookBishopChain
+from chess.splitting import BishopWinSplitter
+
+
+def main() -> None:
+    """Estimate one rare probability with several settings and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--board-size", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=15)
+    parser.add_argument("--roots", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    centre = args.board_size // 2
+    bishop, rook = (centre, centre), (centre * 3 // 4, centre // 4)
+    exact = RookBishopChain(args.board_size, bishop).horizon(rook, args.turns)
+    print(f"exact bishop-win probability: {exact.bishop_wins:.3e}")
+    print(
+        f"{'splits':>6} {'population':>10} {'estimate':>10} {'95% interval':>22} "
+        f"{'turns':>10} {'speedup':>8} {'seconds':>8}",
+    )
+    for splits, population in ((1, 1), (2, 16), (2, 64), (3, 64)):
+        started = time.perf_counter()
+        estimate = BishopWinSplitter(
+            args.board_size,
+            bishop,
+            splits=splits,
+            max_population=population,
+        ).estimate(rook, args.turns, roots=args.roots, seed=args.seed)
+        interval = f"[{estimate.low:.2e}, {estimate.high:.2e}]"
+        print(
+            f"{splits:>6} {population:>10} {estimate.probability:>10.3e} {interval:>22} "
+            f"{estimate.turns_simulated:>10} {estimate.speedup:>8.1f} "
+            f"{time.perf_counter() - started:>8.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
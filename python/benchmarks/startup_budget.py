@@ -0,0 +1,73 @@
+"""Check the import time of the command-line entry point against a budget.
+
+Runs ``python -X importtime`` on the modules a single game needs, keeps the best of
+a few runs, and exits non-zero if the cumulative import time exceeds the budget or
+if any module reserved for the heavier commands was imported::
+
+    PYTHONPATH=src python benchmarks/startup_budget.py --budget-ms 60
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("numpy", "scipy", "asyncio", "http.server", "chess.markov")
+
+
+def import_times(modules: list[str]) -> dict[str, int]:
+    """Import modules in a fresh interpreter and collect ``-X importtime`` output.
+
+    Args:
+        modules (list[str]): Modules to import.
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds per imported module.
+    """
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        check=True,
+        env=os.environ,
+        text=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    """Measure startup and fail when it is over budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=60.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=["main", "chess.game"])
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(args.runs):
+        times = import_times(args.modules)
+        total = sum(times[module] for module in args.modules if module in times)
+        if best is None or total < best[0]:
+            best = (total, times)
+    assert best is not None
+    total, times = best
+
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    for name, cumulative in slowest:
+        print(f"{cumulative / 1000:>8.1f} ms  {name}")
+    print(f"startup: {total / 1000:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    heavy = sorted(name for name in times if name.startswith(HEAVY_MODULES))
+    if heavy:
+        print(f"heavy modules imported at startup: {', '.join(heavy)}")
+    if heavy or total / 1000 > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
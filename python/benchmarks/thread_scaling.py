@@ -0,0 +1,48 @@
+"""Measure batch throughput against thread count.
+
+Run with ``PYTHONPATH=src python benchmarks/thread_scaling.py`` on both a GIL build
+and a free-threaded build (e.g. ``python3.13t``) to compare how far threads scale.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from chess.batch import BatchJob, run_batch
+
+
+def gil_enabled() -> bool:
+    """Report whether the running interpreter holds a global interpreter lock."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def main() -> None:
+    """Time the same batch for every thread count and print a scaling table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, os.cpu_count() or 1],
+    )
+    args = parser.parse_args()
+
+    jobs = [BatchJob("H1", "C3", games=args.games)]
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil_enabled() else 'off'}")
+    print(f"{'threads':>8} {'games/s':>12} {'speedup':>8}")
+
+    baseline = None
+    for threads in sorted(set(args.threads)):
+        started = time.perf_counter()
+        run_batch(jobs, workers=threads, chunk_size=args.chunk_size)
+        throughput = args.games / (time.perf_counter() - started)
+        baseline = baseline or throughput
+        print(f"{threads:>8} {throughput:>12.0f} {throughput / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
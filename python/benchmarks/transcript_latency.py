@@ -0,0 +1,115 @@
+"""Compare game latency when transcripts go through a file handler or the sink.
+
+Plays the same seeded games with full INFO transcripts, once through a plain
+``logging.FileHandler`` that writes every record from the game loop and once
+through ``TranscriptHandler``, and prints per-game latency percentiles. A slow
+disk is simulated by sleeping for ``--write-delay-ms`` on every write to the
+file::
+
+    PYTHONPATH=src python benchmarks/transcript_latency.py --write-delay-ms 1
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import time
+
+from chess.game import Game
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.transcripts import Compression, TranscriptHandler
+
+
+class SlowFileHandler(logging.FileHandler):
+    """File handler whose every write to disk takes extra time."""
+
+    write_delay = 0.0
+
+    def flush(self) -> None:
+        """Flush the record just written, then wait like a slow disk would."""
+        super().flush()
+        time.sleep(self.write_delay)
+
+
+class SlowTranscriptHandler(TranscriptHandler):
+    """Transcript sink whose every batch write takes extra time."""
+
+    write_delay = 0.0
+
+    def _write_batch(self, batch: list[str]) -> None:
+        """Write a batch, then wait like a slow disk would."""
+        super()._write_batch(batch)
+        time.sleep(self.write_delay)
+
+
+def play(handler: logging.Handler, games: int, seed: int) -> list[float]:
+    """Play games logging through a handler and time each one.
+
+    Args:
+        handler (logging.Handler): Where the transcript goes.
+        games (int): Number of games.
+        seed (int): Seed of the dice.
+
+    Returns:
+        list[float]: Seconds per game.
+    """
+    logger = logging.Logger("transcript-benchmark", level=logging.INFO)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(handler)
+    rng = random.Random(seed)
+    timings = []
+    for _ in range(games):
+        game = Game(
+            rook=Rook(Coordinate("H", 1), PieceColor.WHITE),
+            bishop=Bishop(Coordinate("C", 3), PieceColor.BLACK),
+            logger=logger,
+            metrics=None,
+            rng=rng,
+        )
+        started = time.perf_counter()
+        game.play_game(15)
+        timings.append(time.perf_counter() - started)
+    handler.close()
+    return timings
+
+
+def main() -> None:
+    """Time both handlers and print a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--directory", default=".")
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    SlowFileHandler.write_delay = SlowTranscriptHandler.write_delay = (
+        args.write_delay_ms / 1000
+    )
+
+    path = os.path.join(args.directory, "transcript-benchmark.log")
+    handlers = {
+        "FileHandler": lambda: SlowFileHandler(path),
+        "TranscriptHandler": lambda: SlowTranscriptHandler(path),
+        "TranscriptHandler+gzip": lambda: SlowTranscriptHandler(
+            path,
+            compression=Compression.GZIP,
+        ),
+    }
+    print(f"{'handler':<24} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'games/s':>9}")
+    for name, create in handlers.items():
+        if os.path.exists(path):
+            os.remove(path)
+        started = time.perf_counter()
+        timings = sorted(play(create(), args.games, args.seed))
+        elapsed = time.perf_counter() - started
+        p50 = statistics.median(timings) * 1e6
+        p99 = timings[int(0.99 * (len(timings) - 1))] * 1e6
+        print(
+            f"{name:<24} {p50:>8.0f} {p99:>8.0f} {timings[-1] * 1e6:>8.0f} "
+            f"{args.games / elapsed:>9.0f}",
+        )
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare specialized variant kernels with the generic ways of playing a game.
+
+For the default rules, games are played through ``Game.play_game`` with metrics and
+logging off, through ``play_variant`` which interprets the rules every turn, and
+through the kernel ``build_kernel`` specializes; the other variants have no
+``Game`` path. Every path plays the same seeds::
+
+    PYTHONPATH=src python benchmarks/variant_kernels.py --games 100000
+"""
+
+import argparse
+import logging
+import random
+import time
+from collections.abc import Callable
+
+from chess.game import Game
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.rules import ORTHOGONAL
+from chess.variants import Variant, build_kernel, play_variant
+
+VARIANTS = {
+    "default": Variant(),
+    "four directions, 3d4": Variant(
+        board_size=10,
+        dice=3,
+        sides=4,
+        directions=ORTHOGONAL,
+    ),
+    "bishop first, 30 turns": Variant(rook_captures_first=False, number_of_turns=30),
+}
+
+
+def games_per_second(play: Callable[[random.Random], object], games: int) -> float:
+    """Play seeded games and return how many were played per second.
+
+    Args:
+        play (Callable[[random.Random], object]): Plays one game with a generator.
+        games (int): Games to play.
+
+    Returns:
+        float: Games per second.
+    """
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(games):
+        play(rng)
+    return games / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Time every path and print the speedup of the kernels."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=100_000)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("variant_kernels")
+    logger.disabled = True
+
+    def play_generic_game(rng: random.Random) -> object:
+        return Game(
+            rook=Rook(Coordinate("h", 1), PieceColor.WHITE),
+            bishop=Bishop(Coordinate("c", 3), PieceColor.BLACK),
+            logger=logger,
+            metrics=None,
+            rng=rng,
+        ).play_game(15)
+
+    start = time.perf_counter()
+    for variant in VARIANTS.values():
+        build_kernel(variant)
+    print(f"built {len(VARIANTS)} kernels in {time.perf_counter() - start:.3f} s")
+
+    for name, variant in VARIANTS.items():
+        size = variant.board_size
+        rook, bishop = size * size - 1, size * (size - 3) + 2
+        kernel = build_kernel(variant)
+        rates = {
+            "play_variant": games_per_second(
+                lambda rng, v=variant, r=rook, b=bishop: play_variant(v, r, b, rng),
+                args.games,
+            ),
+            "kernel": games_per_second(
+                lambda rng, k=kernel, r=rook, b=bishop: k(r, b, rng),
+                args.games,
+            ),
+        }
+        if variant == Variant():
+            rates["Game"] = games_per_second(play_generic_game, args.games)
+        print(f"{name}:")
+        for path, rate in rates.items():
+            speedup = rates["kernel"] / rate
+            print(f"  {path:<13} {rate:>12,.0f} games/s  kernel {speedup:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+import json
+import logging
+import os
+import random
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import NamedTuple
+
+from chess.files import write_atomically
+from chess.game import Game
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+
+
+class BatchJob(NamedTuple):
+    """A start configuration to play many games from.
+
+    Attributes:
+        rook (str): Starting square of the white rook.
+        bishop (str): Starting square of the black bishop.
+        number_of_turns (int): Maximum number of turns per game.
+        board_size (int): Size of the board.
+        games (int): Number of games to play.
+    """
+
+    rook: str
+    bishop: str
+    number_of_turns: int = 15
+    board_size: int = 8
+    games: int = 1000
+
+
+class Chunk(NamedTuple):
+    """A slice of a job played by one worker with its own generator.
+
+    Attributes:
+        job_index (int): Position of the job in the batch.
+        chunk_index (int): Position of the chunk within its job.
+        games (int): Number of games in the chunk.
+    """
+
+    job_index: int
+    chunk_index: int
+    games: int
+
+
+@dataclass
+class JobResult:
+    """Aggregated outcome of the games played for a job.
+
+    Attributes:
+        games (int): Games played.
+        rook_wins (int): Games won by the rook, including wins by timeout.
+        bishop_wins (int): Games won by the bishop.
+        timeouts (int): Games that reached the turn limit without a capture.
+        total_turns (int): Sum of the turn counts reported by every game.
+    """
+
+    games: int = 0
+    rook_wins: int = 0
+    bishop_wins: int = 0
+    timeouts: int = 0
+    total_turns: int = 0
+
+    @property
+    def mean_turns(self) -> float:
+        """Average turn count reported per game."""
+        return self.total_turns / self.games if self.games else 0.0
+
+    def merge(self, other: "JobResult") -> None:
+        """Add another result's aggregates into this one.
+
+        Args:
+            other (JobResult): The result to add.
+        """
+        self.games += other.games
+        self.rook_wins += other.rook_wins
+        self.bishop_wins += other.bishop_wins
+        self.timeouts += other.timeouts
+        self.total_turns += other.total_turns
+
+
+def split_into_chunks(jobs: Sequence[BatchJob], chunk_size: int) -> list[Chunk]:
+    """Split every job into chunks of at most `chunk_size` games.
+
+    Args:
+        jobs (Sequence[BatchJob]): The jobs of the batch.
+        chunk_size (int): Maximum number of games per chunk.
+
+    Returns:
+        list[Chunk]: The chunks, in job and chunk order.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size: {chunk_size} must be positive")
+    return [
+        Chunk(job_index, chunk_index, min(chunk_size, job.games - start))
+        for job_index, job in enumerate(jobs)
+        for chunk_index, start in enumerate(range(0, job.games, chunk_size))
+    ]
+
+
+def chunk_rng(seed: int, chunk: Chunk) -> random.Random:
+    """Create the generator for a chunk.
+
+    The generator depends only on the batch seed and the chunk's position, so a
+    chunk replays identically whichever thread runs it, and in whatever order.
+
+    Args:
+        seed (int): Seed of the whole batch.
+        chunk (Chunk): The chunk to seed for.
+
+    Returns:
+        random.Random: A generator owned by the chunk.
+    """
+    return random.Random(f"{seed}:{chunk.job_index}:{chunk.chunk_index}")
+
+
+def play_chunk(job: BatchJob, chunk: Chunk, seed: int) -> JobResult:
+    """Play the games of one chunk without touching any shared mutable state.
+
+    Every game gets fresh pieces and board, draws from the chunk's own generator,
+    logs to a private logger that is not registered with the logging module, and
+    leaves the process-wide metrics alone.
+
+    Args:
+        job (BatchJob): The job the chunk belongs to.
+        chunk (Chunk): The chunk to play.
+        seed (int): Seed of the whole batch.
+
+    Returns:
+        JobResult: Aggregates of the chunk's games.
+    """
+    rng = chunk_rng(seed, chunk)
+    sink = logging.Logger(f"{__name__}.chunk", level=logging.WARNING)
+    rook_start = Coordinate(job.rook[:1], int(job.rook[1:]), job.board_size)
+    bishop_start = Coordinate(job.bishop[:1], int(job.bishop[1:]), job.board_size)
+
+    result = JobResult()
+    for _ in range(chunk.games):
+        game = Game(
+            rook=Rook(rook_start, PieceColor.WHITE),
+            bishop=Bishop(bishop_start, PieceColor.BLACK),
+            logger=sink,
+            board_size=job.board_size,
+            metrics=None,
+            rng=rng,
+        )
+        winner, turns = game.play_game(job.number_of_turns)
+        result.games += 1
+        result.total_turns += turns
+        if winner is game.rook:
+            result.rook_wins += 1
+        else:
+            result.bishop_wins += 1
+        if turns > job.number_of_turns:
+            result.timeouts += 1
+    return result
+
+
+class BatchCheckpoint:
+    """Progress of a batch run that can be saved and resumed.
+
+    Chunk generators are derived from the batch seed and the chunk's position, so
+    the seed and the pending work list fully determine the random draws still to
+    come; no generator state has to be stored.
+
+    Attributes:
+        jobs (list[BatchJob]): The jobs of the batch.
+        chunk_size (int): Maximum games per chunk.
+        seed (int): Seed of the whole batch.
+        results (list[JobResult]): Aggregates of the completed chunks, per job.
+        pending (dict[Chunk, None]): Chunks still to play, in insertion order.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        jobs: Sequence[BatchJob],
+        chunk_size: int,
+        seed: int,
+        results: list[JobResult] | None = None,
+        pending: Sequence[Chunk] | None = None,
+    ) -> None:
+        """Initialize progress, by default with no chunk completed.
+
+        Args:
+            jobs (Sequence[BatchJob]): The jobs of the batch.
+            chunk_size (int): Maximum games per chunk.
+            seed (int): Seed of the whole batch.
+            results (list[JobResult] | None, optional): Aggregates of the completed
+                chunks. Defaults to empty results.
+            pending (Sequence[Chunk] | None, optional): Chunks still to play.
+                Defaults to every chunk of the batch.
+        """
+        self.jobs = list(jobs)
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.results = results or [JobResult() for _ in self.jobs]
+        self.pending = dict.fromkeys(
+            split_into_chunks(self.jobs, chunk_size) if pending is None else pending,
+        )
+
+    def complete(self, chunk: Chunk, result: JobResult) -> None:
+        """Record a finished chunk.
+
+        Args:
+            chunk (Chunk): The chunk that was played.
+            result (JobResult): Its aggregates.
+        """
+        self.results[chunk.job_index].merge(result)
+        del self.pending[chunk]
+
+    def matches(self, jobs: Sequence[BatchJob], chunk_size: int, seed: int) -> bool:
+        """Check whether this progress belongs to a run with the given settings.
+
+        Args:
+            jobs (Sequence[BatchJob]): The jobs of the run.
+            chunk_size (int): Maximum games per chunk of the run.
+            seed (int): Seed of the run.
+
+        Returns:
+            bool: True if resuming from this progress continues that run.
+        """
+        return (self.jobs, self.chunk_size, self.seed) == (
+            [BatchJob(*job) for job in jobs],
+            chunk_size,
+            seed,
+        )
+
+    def save(self, path: str) -> None:
+        """Write the progress to a file, atomically replacing any earlier save.
+
+        Args:
+            path (str): Checkpoint file.
+        """
+        state = {
+            "version": self.VERSION,
+            "jobs": [list(job) for job in self.jobs],
+            "chunk_size": self.chunk_size,
+            "seed": self.seed,
+            "results": [asdict(result) for result in self.results],
+            "pending": [list(chunk) for chunk in self.pending],
+        }
+        write_atomically(path, json.dumps(state), durable=True)
+
+    @classmethod
+    def load(cls, path: str) -> "BatchCheckpoint":
+        """Read progress saved by `save`.
+
+        Args:
+            path (str): Checkpoint file.
+
+        Returns:
+            BatchCheckpoint: The saved progress.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path) as checkpoint_file:
+            state = json.load(checkpoint_file)
+        if state.get("version") != cls.VERSION:
+            raise ValueError(f"unsupported checkpoint version in {path}")
+        return cls(
+            jobs=[BatchJob(*job) for job in state["jobs"]],
+            chunk_size=state["chunk_size"],
+            seed=state["seed"],
+            results=[JobResult(**result) for result in state["results"]],
+            pending=[Chunk(*chunk) for chunk in state["pending"]],
+        )
+
+
+def run_batch(
+    jobs: Sequence[BatchJob],
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    seed: int = 0,
+    checkpoint_path: str | None = None,
+    checkpoint_interval: float = 60.0,
+    resume: bool = False,
+) -> list[JobResult]:
+    """Play every job of a batch on a pool of threads.
+
+    Results are identical for any number of workers, because each chunk owns its
+    generator. On free-threaded builds the chunks run truly in parallel.
+
+    With a checkpoint path, progress is saved at most every `checkpoint_interval`
+    seconds, when the run is interrupted, and when it completes. Resuming replays
+    only the pending chunks, so the results are identical to an uninterrupted run.
+
+    Args:
+        jobs (Sequence[BatchJob]): The jobs to play.
+        workers (int | None, optional): Number of threads. Defaults to the CPU count.
+        chunk_size (int, optional): Maximum games per chunk. Defaults to 1000.
+        seed (int, optional): Seed of the whole batch. Defaults to 0.
+        checkpoint_path (str | None, optional): File to save progress to. Defaults
+            to None, which disables checkpointing.
+        checkpoint_interval (float, optional): Minimum seconds between periodic
+            saves. Defaults to 60.0.
+        resume (bool, optional): Whether to continue from the checkpoint file if
+            it exists. Defaults to False.
+
+    Returns:
+        list[JobResult]: One aggregated result per job, in job order.
+
+    Raises:
+        ValueError: If the checkpoint being resumed belongs to a different run.
+    """
+    if resume and checkpoint_path and os.path.exists(checkpoint_path):
+        progress = BatchCheckpoint.load(checkpoint_path)
+        if not progress.matches(jobs, chunk_size, seed):
+            raise ValueError(
+                f"checkpoint {checkpoint_path} was written by a different batch",
+            )
+    else:
+        progress = BatchCheckpoint(jobs, chunk_size, seed)
+
+    last_saved = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        futures = {
+            pool.submit(play_chunk, progress.jobs[chunk.job_index], chunk, seed): chunk
+            for chunk in progress.pending
+        }
+        for future in as_completed(futures):
+            progress.complete(futures[future], future.result())
+            if checkpoint_path and (
+                time.monotonic() - last_saved >= checkpoint_interval
+            ):
+                progress.save(checkpoint_path)
+                last_saved = time.monotonic()
+    finally:
+        pool.shutdown(cancel_futures=True)
+        if checkpoint_path:
+            progress.save(checkpoint_path)
+    return progress.results
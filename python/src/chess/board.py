@@ -1,4 +1,5 @@
 import copy
+import logging
 from functools import cached_property
 from logging import Logger
 
@@ -87,7 +88,11 @@ class ChessBoard:
         Render the current state of the board via the logger.
 
         Logs the board with rows joined by two spaces, preceded by a rendering message.
+        Nothing is built when the logger would discard INFO messages.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.logger.info("Rendering the current state of board")
 
         formatted = ""
@@ -0,0 +1,29 @@
+import os
+
+
+def write_atomically(path: str, data: str, durable: bool = False) -> None:
+    """Write a text file so readers only ever see the old or the new content.
+
+    The data goes to a temporary file in the same directory, which then replaces
+    the destination with a single rename.
+
+    Args:
+        path (str): Destination file.
+        data (str): Text to write.
+        durable (bool, optional): Whether to fsync before the rename, so the new
+            content survives a crash of the machine. Defaults to False.
+    """
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(data)
+            if durable:
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,8 +1,11 @@
+import random
+import time
+from collections.abc import Iterator
 from logging import Logger
-from typing import Optional
 
 from chess.board import ChessBoard
-from chess.move import roll_dice, toss_coin
+from chess.metrics import GAME_METRICS, GameMetrics
+from chess.move import MoveDirection, roll_dice, toss_coin
 from chess.pieces import Bishop, ChessPiece, Rook
 
 
@@ -17,6 +20,10 @@ class Game:
         logger (Logger): Logger for game events.
         board_size (int): The size of the chessboard.
         board (ChessBoard): The chessboard instance containing the pieces.
+        metrics (GameMetrics | None): Metrics updated as the game is played.
+        rng (random.Random | None): Generator for coin tosses and dice rolls.
+        last_move (tuple[MoveDirection, int] | None): Direction and spaces of the
+            rook's move in the latest turn, or None if it did not move.
     """
 
     def __init__(
@@ -25,6 +32,8 @@ class Game:
         bishop: Bishop,
         logger: Logger,
         board_size: int = 8,
+        metrics: GameMetrics | None = GAME_METRICS,
+        rng: random.Random | None = None,
     ) -> None:
         """
         Initialize the game with a rook, bishop, logger, and board size.
@@ -35,11 +44,18 @@ class Game:
             bishop (Bishop): The bishop piece.
             logger (Logger): Logger for game events.
             board_size (int, optional): Size of the chessboard. Defaults to 8.
+            metrics (GameMetrics | None, optional): Metrics to update, or None to
+                disable them. Defaults to the process-wide game metrics.
+            rng (random.Random | None, optional): Generator owned by this game.
+                Defaults to the module-level generator shared by the process.
         """
         self.rook = rook
         self.bishop = bishop
         self.logger = logger
         self.board_size = board_size
+        self.metrics = metrics
+        self.rng = rng
+        self.last_move: tuple[MoveDirection, int] | None = None
         self.board = ChessBoard(
             pieces=[rook, bishop],
             board_size=self.board_size,
@@ -53,6 +69,23 @@ class Game:
         The rook attempts to capture the bishop first; if it fails, it moves based on
         a coin toss and two dice rolls. Then the bishop attempts to capture the rook.
 
+        Returns:
+        -------
+            ChessPiece | None: The piece that captured its opponent this turn,
+            or None if no capture occurred.
+        """
+        if self.metrics is None:
+            return self._resolve_turn()
+
+        started = time.perf_counter()
+        maybe_winner = self._resolve_turn()
+        self.metrics.record_turn(time.perf_counter() - started)
+        return maybe_winner
+
+    def _resolve_turn(self) -> ChessPiece | None:
+        """
+        Play out the captures and the rook move of a single turn.
+
         Returns:
         -------
             ChessPiece | None: The piece that captured its opponent this turn,
@@ -60,13 +93,15 @@ class Game:
         """
         # if the rook can capture the bishop it does and wins the game, if not then move the rook
         if self.rook.can_capture(self.bishop.coordinate):
+            self.last_move = None
             self.logger.info(
                 f"The rook on {self.rook.coordinate} can capture the bishop on {self.bishop.coordinate}.",
             )
             return self.rook
         else:
-            rook_direction = toss_coin()
-            rook_move_spaces = roll_dice() + roll_dice()
+            rook_direction = toss_coin(self.rng)
+            rook_move_spaces = roll_dice(self.rng) + roll_dice(self.rng)
+            self.last_move = (rook_direction, rook_move_spaces)
             current_position = self.rook.coordinate
             self.logger.info(
                 f"The rook on {current_position} cannot capture the bishop on {self.bishop.coordinate}.",
@@ -92,6 +127,32 @@ class Game:
             )
             return None
 
+    def turns(
+        self,
+        number_of_turns: int,
+    ) -> Iterator[tuple[int, ChessPiece | None]]:
+        """
+        Play the game one turn at a time, yielding after every turn.
+
+        Stops after a capture occurs or once the maximum number of turns is reached,
+        allowing callers to advance the game on their own schedule.
+
+        Args:
+        ----
+            number_of_turns (int): Maximum number of turns to play.
+
+        Yields:
+        ------
+            tuple[int, ChessPiece | None]: The turn just played and the piece that
+            captured its opponent on that turn, or None if no capture occurred.
+        """
+        for current_turn in range(1, number_of_turns + 1):
+            self.logger.info(f"Playing turn {current_turn}")
+            maybe_winner = self._play_turn()
+            yield current_turn, maybe_winner
+            if maybe_winner:
+                return
+
     def play_game(self, number_of_turns: int) -> tuple[ChessPiece, int]:
         """
         Play the game up to a maximum number of turns.
@@ -108,16 +169,30 @@ class Game:
             if no capture occurred) and the turn count at which the game ended.
         """
         self.logger.info("Starting game")
-        current_turn = 1
         self.board.render()
 
-        maybe_winner: Optional[ChessPiece] = None
-
-        while not maybe_winner and current_turn <= number_of_turns:
-            self.logger.info(f"Playing turn {current_turn}")
-            maybe_winner = self._play_turn()
+        for current_turn, maybe_winner in self.turns(number_of_turns):
             self.board.render()
-            if not maybe_winner:
-                current_turn += 1
+            if maybe_winner:
+                self._record_game(maybe_winner, current_turn, timed_out=False)
+                return maybe_winner, current_turn
 
-        return self.rook if not maybe_winner else maybe_winner, current_turn
+        self._record_game(self.rook, number_of_turns + 1, timed_out=True)
+        return self.rook, number_of_turns + 1
+
+    def _record_game(self, winner: ChessPiece, turns: int, timed_out: bool) -> None:
+        """
+        Update the game metrics, if enabled, with the outcome of a finished game.
+
+        Args:
+        ----
+            winner (ChessPiece): The winning piece.
+            turns (int): The turn count reported for the game.
+            timed_out (bool): Whether the game hit the turn limit without a capture.
+        """
+        if self.metrics is not None:
+            self.metrics.record_game(
+                rook_won=winner is self.rook,
+                turns=turns,
+                timed_out=timed_out,
+            )
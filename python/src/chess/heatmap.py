@@ -0,0 +1,338 @@
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+from chess.move import MoveDirection, dice_sum_distribution
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.tables import cached_arrays
+
+FloatGrid = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+_ASCII_SHADES = " .:-=+*#%@"
+
+
+def _build_rook_move_table(board_size: int) -> dict[str, IntArray | FloatGrid]:
+    """Replay `Rook.move` from every square for every outcome of a turn."""
+    dice = dice_sum_distribution()
+    destinations = []
+    probabilities = []
+    for direction in MoveDirection:
+        for spaces, probability in dice.items():
+            row = []
+            for square in range(board_size * board_size):
+                rook = Rook(
+                    Coordinate.from_square_id(square, board_size),
+                    PieceColor.WHITE,
+                )
+                rook.move(direction=direction, spaces=spaces, board_size=board_size)
+                row.append(rook.coordinate.square_id())
+            destinations.append(row)
+            probabilities.append(probability / len(MoveDirection))
+    return {
+        "destinations": np.array(destinations, dtype=np.int64),
+        "weights": np.array(probabilities, dtype=np.float64),
+    }
+
+
+@lru_cache(maxsize=32)
+def rook_move_table(board_size: int) -> tuple[IntArray, FloatGrid]:
+    """Tabulate every rook move of a turn by replaying `Rook.move` once per square.
+
+    The table is cached on disk by `chess.tables`, so only the first process to
+    ask for a board size pays for the replay; later ones memory-map it.
+
+    Args:
+        board_size (int): Size of the board.
+
+    Returns:
+        tuple[IntArray, FloatGrid]: Destination square ids of shape
+        (moves, squares), where each row is one (direction, spaces) outcome, and the
+        probability of each outcome under a coin toss and two dice rolls. Both are
+        read-only.
+    """
+    arrays = cached_arrays(
+        f"rook_moves_{board_size}",
+        lambda: _build_rook_move_table(board_size),
+    )
+    table = np.asarray(arrays["destinations"], dtype=np.int64)
+    weights = np.asarray(arrays["weights"], dtype=np.float64)
+    table.setflags(write=False)
+    weights.setflags(write=False)
+    return table, weights
+
+
+def capture_masks(
+    bishop: Coordinate,
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Find the rook squares from which either piece can capture the other.
+
+    Args:
+        bishop (Coordinate): Position of the bishop, which never moves.
+
+    Returns:
+        tuple[NDArray[bool], NDArray[bool]]: Flat masks over square ids of the
+        squares where the rook can capture the bishop and where the bishop can
+        capture the rook.
+    """
+    board_size = bishop.board_size
+    bishop_piece = Bishop(bishop, PieceColor.BLACK)
+    rook_mask = np.zeros(board_size * board_size, dtype=np.bool_)
+    bishop_mask = np.zeros(board_size * board_size, dtype=np.bool_)
+    for square in range(board_size * board_size):
+        coordinate = Coordinate.from_square_id(square, board_size)
+        rook_mask[square] = Rook(coordinate, PieceColor.WHITE).can_capture(bishop)
+        bishop_mask[square] = bishop_piece.can_capture(coordinate)
+    return rook_mask, bishop_mask
+
+
+class Heatmaps:
+    """Per-turn rook occupancy and capture-location grids.
+
+    Every grid has shape (turns + 1, board_size, board_size) and is indexed by
+    [turn, rank_index, file_index], so row 0 is the top rank as on the rendered
+    board. Turn 0 holds the starting position.
+
+    Attributes:
+        occupancy (FloatGrid): Probability that the rook ends each turn on a square,
+            counting games that end during that turn.
+        rook_captures (FloatGrid): Probability that the rook captures the bishop on
+            a square during each turn.
+        bishop_captures (FloatGrid): Probability that the bishop captures the rook
+            on a square during each turn.
+    """
+
+    def __init__(
+        self,
+        occupancy: FloatGrid,
+        rook_captures: FloatGrid,
+        bishop_captures: FloatGrid,
+    ) -> None:
+        """Initialize from precomputed grids."""
+        self.occupancy = occupancy
+        self.rook_captures = rook_captures
+        self.bishop_captures = bishop_captures
+
+    @property
+    def timeout_probability(self) -> float:
+        """Probability that no capture happens before the turn limit."""
+        captured = self.rook_captures.sum() + self.bishop_captures.sum()
+        return float(max(0.0, 1.0 - captured))
+
+    def _grid(self, name: str, turn: int | None) -> FloatGrid:
+        """Select a grid by name, summed over turns when `turn` is None.
+
+        Raises:
+            ValueError: If the grid name is unknown.
+        """
+        grids = {
+            "occupancy": self.occupancy,
+            "rook_captures": self.rook_captures,
+            "bishop_captures": self.bishop_captures,
+        }
+        if name not in grids:
+            raise ValueError(f"grid must be one of {sorted(grids)}, got {name!r}")
+        selected: FloatGrid = (
+            grids[name].sum(axis=0) if turn is None else grids[name][turn]
+        )
+        return selected
+
+    def render_ascii(self, grid: str = "occupancy", turn: int | None = None) -> str:
+        """Render a grid as ASCII shades, darkest for the most likely squares.
+
+        Args:
+            grid (str, optional): 'occupancy', 'rook_captures' or 'bishop_captures'.
+                Defaults to 'occupancy'.
+            turn (int | None, optional): Turn to render, or None for all turns
+                combined. Defaults to None.
+
+        Returns:
+            str: One line per rank, two characters per square.
+        """
+        values = self._grid(grid, turn)
+        peak = values.max()
+        scaled = values / peak if peak > 0 else values
+        levels = np.minimum(
+            (scaled * len(_ASCII_SHADES)).astype(np.int64),
+            len(_ASCII_SHADES) - 1,
+        )
+        return (
+            "\n".join(
+                "".join(_ASCII_SHADES[level] * 2 for level in row) for row in levels
+            )
+            + "\n"
+        )
+
+    def to_png(
+        self,
+        grid: str = "occupancy",
+        turn: int | None = None,
+        cell_size: int = 32,
+    ) -> bytes:
+        """Render a grid as a PNG image, from black through red and yellow to white.
+
+        Args:
+            grid (str, optional): 'occupancy', 'rook_captures' or 'bishop_captures'.
+                Defaults to 'occupancy'.
+            turn (int | None, optional): Turn to render, or None for all turns
+                combined. Defaults to None.
+            cell_size (int, optional): Pixels per square side. Defaults to 32.
+
+        Returns:
+            bytes: The encoded PNG file.
+        """
+        values = self._grid(grid, turn)
+        peak = values.max()
+        scaled = values / peak if peak > 0 else values
+        red = np.clip(scaled * 3, 0, 1)
+        green = np.clip(scaled * 3 - 1, 0, 1)
+        blue = np.clip(scaled * 3 - 2, 0, 1)
+        pixels = (np.stack([red, green, blue], axis=-1) * 255).astype(np.uint8)
+        pixels = pixels.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+        return _encode_png(pixels)
+
+    def write_png(
+        self,
+        path: str,
+        grid: str = "occupancy",
+        turn: int | None = None,
+        cell_size: int = 32,
+    ) -> None:
+        """Write a grid to a PNG file; see `to_png` for the arguments."""
+        with open(path, "wb") as png_file:
+            png_file.write(self.to_png(grid, turn, cell_size))
+
+
+def _encode_png(pixels: npt.NDArray[np.uint8]) -> bytes:
+    """Encode an (height, width, 3) RGB array as a PNG file."""
+    height, width, _ = pixels.shape
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    filtered = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    filtered[:, 1:] = pixels.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(filtered.tobytes()))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _empty_grids(number_of_turns: int, board_size: int) -> tuple[FloatGrid, ...]:
+    """Allocate zeroed occupancy, rook capture and bishop capture grids."""
+    shape = (number_of_turns + 1, board_size * board_size)
+    return tuple(np.zeros(shape, dtype=np.float64) for _ in range(3))
+
+
+def exact_heatmaps(
+    rook: Coordinate,
+    bishop: Coordinate,
+    number_of_turns: int,
+) -> Heatmaps:
+    """Compute heatmaps exactly by propagating the rook's position distribution.
+
+    Each turn removes the probability mass the rook captures from, pushes the rest
+    through every `Rook.move` outcome, and removes the mass the bishop captures.
+
+    Args:
+        rook (Coordinate): Starting position of the rook.
+        bishop (Coordinate): Position of the bishop.
+        number_of_turns (int): Maximum number of turns, as in `Game.play_game`.
+
+    Returns:
+        Heatmaps: Exact per-turn probabilities.
+    """
+    board_size = bishop.board_size
+    moves, weights = rook_move_table(board_size)
+    rook_mask, bishop_mask = capture_masks(bishop)
+    occupancy, rook_captures, bishop_captures = _empty_grids(
+        number_of_turns,
+        board_size,
+    )
+    bishop_square = bishop.square_id()
+
+    alive = np.zeros(board_size * board_size, dtype=np.float64)
+    alive[rook.square_id()] = 1.0
+    occupancy[0] = alive
+    for turn in range(1, number_of_turns + 1):
+        captured = alive[rook_mask]
+        rook_captures[turn, bishop_square] = captured.sum()
+        occupancy[turn, rook_mask] = captured
+        alive[rook_mask] = 0.0
+
+        moved = np.zeros_like(alive)
+        for destinations, weight in zip(moves, weights, strict=True):
+            np.add.at(moved, destinations, alive * weight)
+
+        bishop_captures[turn, bishop_mask] = moved[bishop_mask]
+        occupancy[turn] += moved
+        moved[bishop_mask] = 0.0
+        alive = moved
+
+    shape = (number_of_turns + 1, board_size, board_size)
+    return Heatmaps(
+        occupancy.reshape(shape),
+        rook_captures.reshape(shape),
+        bishop_captures.reshape(shape),
+    )
+
+
+def sampled_heatmaps(
+    rook: Coordinate,
+    bishop: Coordinate,
+    number_of_turns: int,
+    samples: int,
+    seed: int | None = None,
+) -> Heatmaps:
+    """Estimate heatmaps by simulating many games at once as arrays.
+
+    Args:
+        rook (Coordinate): Starting position of the rook.
+        bishop (Coordinate): Position of the bishop.
+        number_of_turns (int): Maximum number of turns, as in `Game.play_game`.
+        samples (int): Number of games to simulate.
+        seed (int | None, optional): Seed for reproducible sampling. Defaults to None.
+
+    Returns:
+        Heatmaps: Empirical per-turn frequencies.
+    """
+    board_size = bishop.board_size
+    squares = board_size * board_size
+    moves, weights = rook_move_table(board_size)
+    rook_mask, bishop_mask = capture_masks(bishop)
+    occupancy, rook_captures, bishop_captures = _empty_grids(
+        number_of_turns,
+        board_size,
+    )
+    bishop_square = bishop.square_id()
+    rng = np.random.default_rng(seed)
+
+    positions = np.full(samples, rook.square_id(), dtype=np.int64)
+    occupancy[0] = np.bincount(positions, minlength=squares)
+    for turn in range(1, number_of_turns + 1):
+        rook_wins = rook_mask[positions]
+        rook_captures[turn, bishop_square] = np.count_nonzero(rook_wins)
+        occupancy[turn] += np.bincount(positions[rook_wins], minlength=squares)
+        positions = positions[~rook_wins]
+
+        outcomes = rng.choice(len(weights), size=len(positions), p=weights)
+        positions = moves[outcomes, positions]
+        occupancy[turn] += np.bincount(positions, minlength=squares)
+
+        bishop_wins = bishop_mask[positions]
+        bishop_captures[turn] = np.bincount(positions[bishop_wins], minlength=squares)
+        positions = positions[~bishop_wins]
+
+    shape = (number_of_turns + 1, board_size, board_size)
+    return Heatmaps(
+        (occupancy / samples).reshape(shape),
+        (rook_captures / samples).reshape(shape),
+        (bishop_captures / samples).reshape(shape),
+    )
@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+Message = dict[str, Any]
+
+
+class LoadReport:
+    """Summary of a load-generation run against a game server.
+
+    Attributes:
+        sessions (int): Number of sessions played to completion.
+        turns (int): Total number of turns stepped.
+        elapsed (float): Wall-clock duration of the run in seconds.
+        latencies (list[float]): Round-trip time of every step request in seconds.
+    """
+
+    def __init__(
+        self,
+        sessions: int,
+        turns: int,
+        elapsed: float,
+        latencies: list[float],
+    ) -> None:
+        """Initialize a report from raw measurements."""
+        self.sessions = sessions
+        self.turns = turns
+        self.elapsed = elapsed
+        self.latencies = latencies
+
+    def percentile(self, fraction: float) -> float:
+        """Return a step latency percentile in seconds.
+
+        Args:
+            fraction (float): Percentile as a fraction between 0 and 1.
+
+        Returns:
+            float: The latency at that percentile, or 0.0 without measurements.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def __str__(self) -> str:
+        """Return a one-line human readable summary."""
+        mean = statistics.fmean(self.latencies) if self.latencies else 0.0
+        return (
+            f"{self.sessions} sessions, {self.turns} turns in {self.elapsed:.2f}s "
+            f"({self.turns / max(self.elapsed, 1e-9):.0f} turns/s), step latency "
+            f"mean {mean * 1e3:.2f}ms p50 {self.percentile(0.5) * 1e3:.2f}ms "
+            f"p99 {self.percentile(0.99) * 1e3:.2f}ms"
+        )
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    message: Message,
+) -> Message:
+    """Send one request and wait for its response.
+
+    Raises:
+        RuntimeError: If the server reports an error.
+    """
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    response: Message = json.loads(await reader.readline())
+    if not response.get("ok"):
+        raise RuntimeError(f"server error: {response.get('error')}")
+    return response
+
+
+async def _drive_connection(
+    host: str,
+    port: int,
+    sessions: int,
+    turns: int,
+    latencies: list[float],
+) -> int:
+    """Open one connection and play a batch of sessions over it, round-robin.
+
+    Returns:
+        int: Number of turns stepped.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    stepped = 0
+    try:
+        live: list[int] = []
+        for _ in range(sessions):
+            created = await _request(
+                reader,
+                writer,
+                {"op": "create", "rook": "H1", "bishop": "C3", "turns": turns},
+            )
+            live.append(created["state"]["session"])
+
+        while live:
+            still_live = []
+            for session_id in live:
+                started = time.perf_counter()
+                response = await _request(
+                    reader,
+                    writer,
+                    {"op": "step", "session": session_id},
+                )
+                latencies.append(time.perf_counter() - started)
+                stepped += 1
+                if response["state"]["finished"]:
+                    await _request(
+                        reader,
+                        writer,
+                        {"op": "close", "session": session_id},
+                    )
+                else:
+                    still_live.append(session_id)
+            live = still_live
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return stepped
+
+
+async def run_load(
+    host: str,
+    port: int,
+    sessions: int,
+    connections: int,
+    turns: int = 15,
+) -> LoadReport:
+    """Play many concurrent sessions against a running server.
+
+    Sessions are spread evenly across the connections, and every connection steps
+    its sessions round-robin so they are all in progress at the same time.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+        sessions (int): Total number of sessions to play.
+        connections (int): Number of concurrent client connections.
+        turns (int, optional): Turn limit of every session. Defaults to 15.
+
+    Returns:
+        LoadReport: Throughput and latency measurements.
+    """
+    connections = max(1, min(connections, sessions))
+    share, extra = divmod(sessions, connections)
+    latencies: list[float] = []
+    started = time.perf_counter()
+    stepped = await asyncio.gather(
+        *(
+            _drive_connection(
+                host,
+                port,
+                share + (1 if index < extra else 0),
+                turns,
+                latencies,
+            )
+            for index in range(connections)
+        ),
+    )
+    return LoadReport(sessions, sum(stepped), time.perf_counter() - started, latencies)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point for ``python -m chess.loadgen``.
+
+    Args:
+        argv (list[str] | None, optional): Arguments to parse. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Generate load on a game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_load(args.host, args.port, args.sessions, args.connections, args.turns),
+    )
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
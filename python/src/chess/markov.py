@@ -0,0 +1,342 @@
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from chess.move import MoveDirection, dice_sum_distribution
+from chess.pieces import Coordinate
+from chess.tables import cached_arrays
+
+FloatArray = npt.NDArray[np.float64]
+
+SQUARING_STATE_LIMIT = 2048
+"""Largest chain, in states, whose transition matrix is raised to a power."""
+
+
+class Absorption(NamedTuple):
+    """Outcome of a game with no turn limit, for every rook starting square.
+
+    Arrays are indexed by square id, `rank_index * board_size + file_index`.
+
+    Attributes:
+        rook_wins (FloatArray): Probability that the rook eventually captures.
+        bishop_wins (FloatArray): Probability that the bishop eventually captures.
+        expected_turns (FloatArray): Expected turn on which the capture happens, as
+            `Game.play_game` counts turns.
+    """
+
+    rook_wins: FloatArray
+    bishop_wins: FloatArray
+    expected_turns: FloatArray
+
+
+class HorizonOutcome(NamedTuple):
+    """Outcome of a game from one starting square with a finite turn limit.
+
+    Attributes:
+        rook_wins (float): Probability that the rook captures within the limit.
+        bishop_wins (float): Probability that the bishop captures within the limit.
+        timeouts (float): Probability that no capture happens within the limit.
+    """
+
+    rook_wins: float
+    bishop_wins: float
+    timeouts: float
+
+
+class RookBishopChain:
+    """Absorbing Markov chain of the rook moving against a fixed bishop.
+
+    Transient states are the squares from which the rook cannot capture at the
+    start of a turn. Each turn the rook makes a `Rook.move` wrap-around move; it is
+    absorbed by the bishop if it lands on one of the bishop's diagonals, and will
+    capture on the next turn if it lands on the bishop's rank or file.
+
+    The chain works on square ids rather than `Coordinate` objects, so board sizes
+    are not limited by the number of file letters.
+
+    Attributes:
+        board_size (int): Size of the board.
+        bishop (tuple[int, int]): Bishop position as (file_index, rank_index).
+        transient (npt.NDArray[np.int64]): Square id of every transient state.
+        transitions (sp.csr_matrix): Transient-to-transient transition matrix Q.
+        to_bishop (FloatArray): Per transient state, probability of being captured
+            by the bishop during the turn.
+        to_rook (FloatArray): Per transient state, probability of landing where the
+            rook captures on the next turn.
+    """
+
+    def __init__(
+        self,
+        board_size: int,
+        bishop: tuple[int, int],
+        cache: bool = False,
+    ) -> None:
+        """Build the sparse transition structure.
+
+        Args:
+            board_size (int): Size of the board.
+            bishop (tuple[int, int]): Bishop position as (file_index, rank_index).
+            cache (bool, optional): Whether to keep the structure in the on-disk
+                table cache and memory-map it from there, which makes rebuilding a
+                chain for a large board almost free. Defaults to False.
+
+        Raises:
+            ValueError: If the bishop is off the board.
+        """
+        file_index, rank_index = bishop
+        if not (0 <= file_index < board_size and 0 <= rank_index < board_size):
+            raise ValueError(f"bishop: {bishop} is not on a {board_size} board")
+        self.board_size = board_size
+        self.bishop = bishop
+
+        if cache:
+            arrays = cached_arrays(
+                f"rook_bishop_chain_{board_size}_{file_index}_{rank_index}",
+                lambda: _chain_arrays(board_size, bishop),
+            )
+        else:
+            arrays = _chain_arrays(board_size, bishop)
+        self.transient = np.asarray(arrays["transient"], dtype=np.int64)
+        self.to_bishop = np.asarray(arrays["to_bishop"], dtype=np.float64)
+        self.to_rook = np.asarray(arrays["to_rook"], dtype=np.float64)
+        self._state_of = np.asarray(arrays["state_of"], dtype=np.int64)
+        states = len(self.transient)
+        self.transitions = sp.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=(states, states),
+        )
+
+    @classmethod
+    def for_bishop(cls, bishop: Coordinate, cache: bool = False) -> "RookBishopChain":
+        """Build the chain for a bishop standing on a coordinate.
+
+        Args:
+            bishop (Coordinate): Position of the bishop.
+            cache (bool, optional): Whether to use the on-disk table cache.
+                Defaults to False.
+
+        Returns:
+            RookBishopChain: The chain on the bishop's board.
+        """
+        return cls(
+            bishop.board_size,
+            (bishop.file_index(), bishop.rank_index()),
+            cache=cache,
+        )
+
+    def _solve(self, rhs: FloatArray, tolerance: float) -> FloatArray:
+        """Solve (I - Q) x = rhs.
+
+        BiCGSTAB needs only sparse products and converges in a few hundred
+        iterations even for a million squares; a sparse LU factorization is the
+        fallback if it stalls.
+
+        Raises:
+            RuntimeError: If neither method produces a solution.
+        """
+        system = sp.identity(len(rhs), format="csr") - self.transitions
+        solution, info = spla.bicgstab(
+            system,
+            rhs,
+            rtol=tolerance,
+            atol=0.0,
+            maxiter=20 * self.board_size + 1000,
+        )
+        if info != 0:
+            solution = spla.spsolve(system.tocsc(), rhs)
+            if not np.all(np.isfinite(solution)):
+                raise RuntimeError("the absorption equations could not be solved")
+        return np.asarray(solution, dtype=np.float64)
+
+    def absorption(self, tolerance: float = 1e-10) -> Absorption:
+        """Solve for eventual capture probabilities and expected game length.
+
+        With N = (I - Q)^-1 the fundamental matrix, the bishop wins with
+        probability N b and the capture happens on turn N (1 + r) on average,
+        where b and r are the per-turn probabilities of reaching a bishop or a
+        rook capture. Every game ends in a capture, so the rook wins otherwise.
+
+        Args:
+            tolerance (float, optional): Relative residual of the iterative solver.
+                Defaults to 1e-10.
+
+        Returns:
+            Absorption: Results for every starting square of the rook.
+        """
+        squares = self.board_size * self.board_size
+        bishop_wins = np.zeros(squares)
+        expected_turns = np.ones(squares)
+        if len(self.transient):
+            bishop_wins[self.transient] = self._solve(self.to_bishop, tolerance)
+            expected_turns[self.transient] = self._solve(1 + self.to_rook, tolerance)
+        bishop_wins = np.clip(bishop_wins, 0.0, 1.0)
+        return Absorption(1.0 - bishop_wins, bishop_wins, expected_turns)
+
+    def _augmented(self) -> sp.csr_matrix:
+        """Transition matrix over transient states plus three extra states.
+
+        The extra states, in order, are: on a rook line (the rook captures next
+        turn), rook captured, and bishop captured.
+        """
+        states = len(self.transient)
+        rook_captured, bishop_captured = states + 1, states + 2
+        absorbing = sp.csr_matrix(
+            (
+                [1.0, 1.0, 1.0],
+                ([0, 1, 2], [rook_captured, rook_captured, bishop_captured]),
+            ),
+            shape=(3, states + 3),
+        )
+        exits = sp.csr_matrix(
+            np.stack([self.to_rook, np.zeros(states), self.to_bishop], axis=1),
+        )
+        return sp.vstack(
+            [sp.hstack([self.transitions, exits]), absorbing],
+            format="csr",
+        )
+
+    def horizon(
+        self,
+        rook: tuple[int, int],
+        number_of_turns: int,
+        tolerance: float = 1e-15,
+    ) -> HorizonOutcome:
+        """Compute the outcome of a game with a finite turn limit.
+
+        Small chains raise the transition matrix to the power of the turn limit
+        by repeated squaring, so even astronomically large limits take a few dozen
+        matrix products. Larger chains push the rook's distribution forward one
+        turn at a time, stopping early once the mass still in play drops below
+        `tolerance`.
+
+        Args:
+            rook (tuple[int, int]): Rook start as (file_index, rank_index).
+            number_of_turns (int): Maximum number of turns, as in `Game.play_game`.
+            tolerance (float, optional): Mass in play below which propagation
+                stops. Defaults to 1e-15.
+
+        Returns:
+            HorizonOutcome: Win and timeout probabilities.
+
+        Raises:
+            ValueError: If the rook is off the board or the turn limit is negative.
+        """
+        file_index, rank_index = rook
+        if not (
+            0 <= file_index < self.board_size and 0 <= rank_index < self.board_size
+        ):
+            raise ValueError(f"rook: {rook} is not on a {self.board_size} board")
+        if number_of_turns < 0:
+            raise ValueError(f"number_of_turns: {number_of_turns} must not be negative")
+
+        states = len(self.transient)
+        distribution = np.zeros(states + 3)
+        state = self._state_of[rank_index * self.board_size + file_index]
+        distribution[state if state >= 0 else states] = 1.0
+
+        matrix = self._augmented()
+        if states + 3 <= SQUARING_STATE_LIMIT:
+            distribution = _power_times(distribution, matrix.toarray(), number_of_turns)
+        else:
+            transposed = matrix.T.tocsr()
+            for _ in range(number_of_turns):
+                distribution = transposed @ distribution
+                if distribution[: states + 1].sum() < tolerance:
+                    break
+
+        rook_wins, bishop_wins = distribution[states + 1], distribution[states + 2]
+        return HorizonOutcome(
+            float(rook_wins),
+            float(bishop_wins),
+            float(max(0.0, 1.0 - rook_wins - bishop_wins)),
+        )
+
+
+def _chain_arrays(
+    board_size: int,
+    bishop: tuple[int, int],
+) -> dict[str, npt.NDArray[np.generic]]:
+    """Compute the arrays a `RookBishopChain` is made of.
+
+    Args:
+        board_size (int): Size of the board.
+        bishop (tuple[int, int]): Bishop position as (file_index, rank_index).
+
+    Returns:
+        dict[str, NDArray]: Transient square ids, the square-to-state index, the
+        exit probabilities, and the CSR arrays of the transition matrix.
+    """
+    file_index, rank_index = bishop
+    squares = np.arange(board_size * board_size, dtype=np.int64)
+    files, ranks = squares % board_size, squares // board_size
+    rook_line = (files == file_index) | (ranks == rank_index)
+    diagonal = np.abs(files - file_index) == np.abs(ranks - rank_index)
+
+    transient = np.flatnonzero(~rook_line)
+    states = len(transient)
+    state_of = np.full(len(squares), -1, dtype=np.int64)
+    state_of[transient] = np.arange(states)
+
+    to_bishop = np.zeros(states)
+    to_rook = np.zeros(states)
+    rows, cols, weights = [], [], []
+    transient_files = files[transient]
+    transient_ranks = ranks[transient]
+    for direction in MoveDirection:
+        step_file, step_rank = direction.vector
+        for spaces, probability in dice_sum_distribution().items():
+            weight = probability / len(MoveDirection)
+            new_ranks = (transient_ranks - step_rank * spaces) % board_size
+            new_files = (transient_files + step_file * spaces) % board_size
+            destination = new_ranks * board_size + new_files
+            captured = diagonal[destination]
+            capturing = rook_line[destination] & ~captured
+            staying = ~(captured | capturing)
+            to_bishop += weight * captured
+            to_rook += weight * capturing
+            rows.append(np.flatnonzero(staying))
+            cols.append(state_of[destination[staying]])
+            weights.append(np.full(np.count_nonzero(staying), weight))
+
+    transitions = sp.csr_matrix(
+        (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(states, states),
+    )
+    return {
+        "transient": transient,
+        "state_of": state_of,
+        "to_bishop": to_bishop,
+        "to_rook": to_rook,
+        "data": transitions.data,
+        "indices": transitions.indices,
+        "indptr": transitions.indptr,
+    }
+
+
+def _power_times(
+    vector: FloatArray,
+    matrix: FloatArray,
+    exponent: int,
+) -> FloatArray:
+    """Compute `vector @ matrix ** exponent` by exponentiation by squaring.
+
+    Args:
+        vector (FloatArray): Row vector.
+        matrix (FloatArray): Square matrix.
+        exponent (int): Non-negative power.
+
+    Returns:
+        FloatArray: The product, using O(log exponent) matrix squarings.
+    """
+    result = vector
+    power = matrix
+    while exponent:
+        if exponent & 1:
+            result = result @ power
+        exponent >>= 1
+        if exponent:
+            power = power @ power
+    return result
@@ -0,0 +1,377 @@
+import json
+import logging
+import random
+import sys
+import tracemalloc
+from collections.abc import Iterable
+from enum import Enum
+from types import FunctionType, ModuleType
+from typing import NamedTuple
+
+from chess.board import ChessBoard
+from chess.game import Game
+from chess.metrics import GameMetrics, MetricsRegistry
+from chess.pieces import Bishop, ChessPiece, Coordinate, PieceColor, Rook
+
+CATEGORIES: tuple[type, ...] = (Game, ChessBoard, ChessPiece, Coordinate)
+"""Types that bytes are attributed to, each owning the objects beneath it."""
+
+OTHER = "other"
+"""Category of objects reached before any of `CATEGORIES`."""
+
+SHARED_TYPES: tuple[type, ...] = (
+    logging.Logger,
+    random.Random,
+    Enum,
+    GameMetrics,
+    MetricsRegistry,
+    type,
+    ModuleType,
+    FunctionType,
+)
+"""Objects shared across games; the traversal neither counts nor enters them."""
+
+
+class Footprint(NamedTuple):
+    """Objects and bytes attributed to one category.
+
+    Attributes:
+        objects (int): Instances of the category that were reached.
+        bytes (int): `sys.getsizeof` of those instances plus everything they own.
+    """
+
+    objects: int
+    bytes: int
+
+
+_ATOMIC_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+
+def _slot_names(kind: type) -> tuple[str, ...]:
+    """Names of the `__slots__` declared anywhere in a type's hierarchy."""
+    names: list[str] = []
+    for cls in kind.__mro__:
+        slots = getattr(cls, "__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+def _children(obj: object, slots: tuple[str, ...]) -> list[object]:
+    """Objects directly referenced by `obj` that the traversal follows."""
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, list | tuple | set | frozenset):
+        return list(obj)
+    children: list[object] = [vars(obj)] if hasattr(obj, "__dict__") else []
+    children.extend(getattr(obj, name) for name in slots if hasattr(obj, name))
+    return children
+
+
+def measure_footprint(
+    roots: Iterable[object],
+    shared: tuple[type, ...] = SHARED_TYPES,
+) -> dict[str, Footprint]:
+    """Attribute the memory reachable from some roots to the game's object types.
+
+    Walks references depth first, sizing every object once with `sys.getsizeof`.
+    An instance of one of `CATEGORIES` is charged to its own category, together
+    with its `__dict__` and any uncategorized object first reached through it, such
+    as a coordinate's `available_files` list. Objects reachable from several owners
+    are charged to the first one visited. The walk is iterative, so millions of
+    games can be measured without hitting the recursion limit.
+
+    Args:
+        roots (Iterable[object]): Objects to start from, typically games.
+        shared (tuple[type, ...], optional): Types whose instances are shared
+            across games and excluded. Defaults to `SHARED_TYPES`.
+
+    Returns:
+        dict[str, Footprint]: Footprint per category name, plus `OTHER`.
+    """
+    categories: dict[type, tuple[str, tuple[str, ...]]] = {}
+    objects = dict.fromkeys([*(cls.__name__ for cls in CATEGORIES), OTHER], 0)
+    sizes = dict.fromkeys(objects, 0)
+    seen: set[int] = set()
+    stack = [(root, OTHER) for root in roots]
+    while stack:
+        obj, owner = stack.pop()
+        if id(obj) in seen or isinstance(obj, shared):
+            continue
+        seen.add(id(obj))
+
+        kind = type(obj)
+        if kind not in categories:
+            categories[kind] = (
+                next((cls.__name__ for cls in CATEGORIES if issubclass(kind, cls)), ""),
+                _slot_names(kind),
+            )
+        category, slots = categories[kind]
+        if category:
+            owner = category
+            objects[owner] += 1
+        sizes[owner] += sys.getsizeof(obj)
+        if not isinstance(obj, _ATOMIC_TYPES):
+            stack.extend((child, owner) for child in _children(obj, slots))
+
+    return {name: Footprint(objects[name], sizes[name]) for name in objects}
+
+
+class PeakUsage(NamedTuple):
+    """Memory traced by `tracemalloc` around a call, relative to its start.
+
+    Attributes:
+        peak (int): Highest number of extra bytes allocated during the call.
+        retained (int): Extra bytes still allocated when the call returned.
+    """
+
+    peak: int
+    retained: int
+
+
+def trace_play_game(game: Game, number_of_turns: int) -> PeakUsage:
+    """Play a game while tracing how much memory it allocates.
+
+    Tracing is started for the call and stopped again, unless it was already on.
+
+    Args:
+        game (Game): The game to play.
+        number_of_turns (int): Maximum number of turns.
+
+    Returns:
+        PeakUsage: Peak and retained allocations of `play_game`.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        game.play_game(number_of_turns)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return PeakUsage(peak - before, after - before)
+
+
+class MemoryReport:
+    """Memory used by a set of games, comparable across runs and engine versions.
+
+    Attributes:
+        label (str): Name of the run, such as a version or commit.
+        games (int): Number of games measured.
+        footprint (dict[str, Footprint]): Bytes attributed per category.
+        traced_bytes (int): Bytes `tracemalloc` saw allocated to build the games.
+        peak_bytes (int): Largest peak of a single `play_game` call.
+        top_allocations (list[tuple[str, int]]): Source lines that allocated the
+            most while building the games, as ("file:line", bytes).
+    """
+
+    def __init__(
+        self,
+        label: str,
+        games: int,
+        footprint: dict[str, Footprint],
+        traced_bytes: int,
+        peak_bytes: int,
+        top_allocations: list[tuple[str, int]],
+    ) -> None:
+        """Initialize a report from its measurements.
+
+        Args:
+            label (str): Name of the run.
+            games (int): Number of games measured.
+            footprint (dict[str, Footprint]): Bytes attributed per category.
+            traced_bytes (int): Bytes allocated to build the games.
+            peak_bytes (int): Largest peak of a single `play_game` call.
+            top_allocations (list[tuple[str, int]]): Biggest allocating lines.
+        """
+        self.label = label
+        self.games = games
+        self.footprint = footprint
+        self.traced_bytes = traced_bytes
+        self.peak_bytes = peak_bytes
+        self.top_allocations = top_allocations
+
+    def render(self) -> str:
+        """Format the report as a table.
+
+        Returns:
+            str: Per-category objects and bytes, totals and the top allocations.
+        """
+        games = max(self.games, 1)
+        lines = [
+            f"memory report {self.label!r}: {self.games} games",
+            f"{'category':<12} {'objects':>10} {'bytes':>14} {'bytes/game':>12}",
+        ]
+        for name, (objects, size) in self.footprint.items():
+            lines.append(
+                f"{name:<12} {objects:>10} {size:>14} {size / games:>12.1f}",
+            )
+        lines.append(
+            f"traced while building: {self.traced_bytes} bytes "
+            f"({self.traced_bytes / games:.1f} per game)",
+        )
+        lines.append(f"peak during play_game: {self.peak_bytes} bytes")
+        lines.extend(
+            f"  {size:>12} bytes  {where}" for where, size in self.top_allocations
+        )
+        return "\n".join(lines)
+
+    def compare(self, baseline: "MemoryReport") -> str:
+        """Format the per-game change from a baseline report.
+
+        Args:
+            baseline (MemoryReport): Report of the earlier run.
+
+        Returns:
+            str: Bytes per game in both runs and the difference, per category.
+        """
+        ours, theirs = max(self.games, 1), max(baseline.games, 1)
+        rows = [
+            (name, baseline.footprint.get(name, Footprint(0, 0)).bytes, size)
+            for name, (_, size) in self.footprint.items()
+        ]
+        rows.append(("traced", baseline.traced_bytes, self.traced_bytes))
+        lines = [
+            f"{baseline.label!r} -> {self.label!r}, bytes per game",
+            f"{'category':<12} {'before':>12} {'after':>12} {'change':>12}",
+        ]
+        for name, before, after in rows:
+            before_per_game, after_per_game = before / theirs, after / ours
+            lines.append(
+                f"{name:<12} {before_per_game:>12.1f} {after_per_game:>12.1f} "
+                f"{after_per_game - before_per_game:>+12.1f}",
+            )
+        lines.append(
+            f"{'peak':<12} {baseline.peak_bytes:>12} {self.peak_bytes:>12} "
+            f"{self.peak_bytes - baseline.peak_bytes:>+12}",
+        )
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """Write the report as JSON, for comparison with a later run.
+
+        Args:
+            path (str): Destination file.
+        """
+        state = {
+            "label": self.label,
+            "games": self.games,
+            "footprint": {name: list(value) for name, value in self.footprint.items()},
+            "traced_bytes": self.traced_bytes,
+            "peak_bytes": self.peak_bytes,
+            "top_allocations": self.top_allocations,
+        }
+        with open(path, "w") as report_file:
+            json.dump(state, report_file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "MemoryReport":
+        """Read a report written by `save`.
+
+        Args:
+            path (str): Report file.
+
+        Returns:
+            MemoryReport: The saved report.
+        """
+        with open(path) as report_file:
+            state = json.load(report_file)
+        return cls(
+            label=state["label"],
+            games=state["games"],
+            footprint={
+                name: Footprint(*value) for name, value in state["footprint"].items()
+            },
+            traced_bytes=state["traced_bytes"],
+            peak_bytes=state["peak_bytes"],
+            top_allocations=[tuple(entry) for entry in state["top_allocations"]],
+        )
+
+
+def _build_game(
+    rook: Coordinate,
+    bishop: Coordinate,
+    logger: logging.Logger,
+    rng: random.Random,
+) -> Game:
+    """Create a game with fresh pieces and coordinates and metrics off."""
+    return Game(
+        rook=Rook(Coordinate(rook.file, rook.rank, rook.board_size), PieceColor.WHITE),
+        bishop=Bishop(
+            Coordinate(bishop.file, bishop.rank, bishop.board_size),
+            PieceColor.BLACK,
+        ),
+        logger=logger,
+        board_size=rook.board_size,
+        metrics=None,
+        rng=rng,
+    )
+
+
+def memory_report(
+    games: int = 1000,
+    rook: Coordinate | None = None,
+    bishop: Coordinate | None = None,
+    number_of_turns: int = 15,
+    seed: int = 0,
+    label: str = "",
+    top: int = 5,
+    traced_plays: int = 100,
+) -> MemoryReport:
+    """Build many games, measure what they hold, then play some under tracing.
+
+    Games are built with a silent logger, a shared seeded generator and metrics
+    off, so only the per-game objects are measured. Tracing stops before the
+    footprint walk, which would otherwise be slowed down by tracing its own
+    bookkeeping. One game is played untraced first, so caches filled on first use
+    do not count towards the peak.
+
+    Args:
+        games (int, optional): Number of games to keep alive. Defaults to 1000.
+        rook (Coordinate | None, optional): Rook start. Defaults to H1.
+        bishop (Coordinate | None, optional): Bishop square. Defaults to C3.
+        number_of_turns (int, optional): Turn limit when playing. Defaults to 15.
+        seed (int, optional): Seed of the dice. Defaults to 0.
+        label (str, optional): Name of the run. Defaults to "".
+        top (int, optional): Number of top allocating lines to keep. Defaults to 5.
+        traced_plays (int, optional): Number of games played to find the peak.
+            Defaults to 100.
+
+    Returns:
+        MemoryReport: The measurements.
+    """
+    rook = rook or Coordinate("H", 1)
+    bishop = bishop or Coordinate("C", 3)
+    logger = logging.Logger(f"{__name__}.games", level=logging.WARNING)
+    rng = random.Random(seed)
+    _build_game(rook, bishop, logger, rng).play_game(number_of_turns)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        built_games = [_build_game(rook, bishop, logger, rng) for _ in range(games)]
+        built = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    footprint = measure_footprint(built_games)
+    peak = max(
+        (
+            trace_play_game(game, number_of_turns).peak
+            for game in built_games[:traced_plays]
+        ),
+        default=0,
+    )
+
+    difference = built.compare_to(baseline, "lineno")
+    traced = sum(stat.size_diff for stat in difference)
+    allocations = [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff)
+        for stat in sorted(difference, key=lambda stat: -stat.size_diff)[:top]
+    ]
+    return MemoryReport(label, games, footprint, traced, peak, allocations)
@@ -0,0 +1,367 @@
+import bisect
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from chess.files import write_atomically
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+DEFAULT_LENGTH_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 12, 15, 20, 30, 50, 100)
+DEFAULT_LATENCY_BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way the Prometheus text format expects.
+
+    Args:
+        value (float): The sample value.
+
+    Returns:
+        str: Integers without a trailing '.0', everything else via repr.
+    """
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """A monotonically increasing metric.
+
+    Each counter owns its lock, so concurrent updates to different metrics never
+    contend and an update is a single uncontended acquire in the common case.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): Help text shown in the exposition.
+    """
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Initialize a counter at zero.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text shown in the exposition.
+        """
+        self.name = name
+        self.documentation = documentation
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> float:
+        """Current value of the counter."""
+        return self._value
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter.
+
+        Args:
+            amount (float, optional): Non-negative increment. Defaults to 1.
+
+        Raises:
+            ValueError: If `amount` is negative.
+        """
+        if amount < 0:
+            raise ValueError("counters can only be increased")
+        with self._lock:
+            self._value += amount
+
+    def render(self) -> str:
+        """Render the counter in Prometheus text format.
+
+        Returns:
+            str: HELP, TYPE and sample lines.
+        """
+        return (
+            f"# HELP {self.name} {self.documentation}\n"
+            f"# TYPE {self.name} counter\n"
+            f"{self.name} {_format_value(self._value)}\n"
+        )
+
+
+class Histogram:
+    """A metric counting observations into cumulative buckets.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): Help text shown in the exposition.
+        buckets (tuple[float, ...]): Sorted upper bounds, excluding +Inf.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text shown in the exposition.
+            buckets (Sequence[float]): Upper bounds of the buckets.
+
+        Raises:
+            ValueError: If no buckets are given.
+        """
+        if not buckets:
+            raise ValueError("histograms need at least one bucket")
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Total number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observed values."""
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Record a single observation.
+
+        The bucket is located before taking the lock so the critical section is two
+        additions.
+
+        Args:
+            value (float): The observed value.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def render(self) -> str:
+        """Render the histogram in Prometheus text format.
+
+        Returns:
+            str: HELP, TYPE, cumulative bucket, sum and count lines.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts, strict=False):
+            cumulative += count
+            lines.append(
+                f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}',
+            )
+        cumulative += counts[-1]
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format_value(total)}")
+        lines.append(f"{self.name}_count {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """A named collection of metrics that can be exported together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        """Return the counter with the given name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text used when the counter is created.
+
+        Returns:
+            Counter: The registered counter.
+
+        Raises:
+            ValueError: If the name is registered as a different metric type.
+        """
+        with self._lock:
+            metric = self._metrics.setdefault(name, Counter(name, documentation))
+        if not isinstance(metric, Counter):
+            raise ValueError(f"metric {name} is not a counter")
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+    ) -> Histogram:
+        """Return the histogram with the given name, creating it if needed.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text used when the histogram is created.
+            buckets (Sequence[float]): Bucket bounds used when it is created.
+
+        Returns:
+            Histogram: The registered histogram.
+
+        Raises:
+            ValueError: If the name is registered as a different metric type.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, documentation, buckets)
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"metric {name} is not a histogram")
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in Prometheus text format.
+
+        Returns:
+            str: The exposition of all metrics, ordered by name.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        return "".join(metric.render() for _, metric in metrics)
+
+    def write_textfile(self, path: str) -> None:
+        """Dump all metrics to a file, atomically replacing any previous dump.
+
+        Suitable for the node-exporter textfile collector, which must never see a
+        partially written file.
+
+        Args:
+            path (str): Destination file.
+        """
+        write_atomically(path, self.render())
+
+    def serve(
+        self,
+        port: int = 9464,
+        host: str = "127.0.0.1",
+    ) -> "ThreadingHTTPServer":
+        """Expose the metrics over HTTP from a background daemon thread.
+
+        Args:
+            port (int, optional): Port to bind, 0 picks a free one. Defaults to 9464.
+            host (str, optional): Interface to bind. Defaults to localhost.
+
+        Returns:
+            ThreadingHTTPServer: The running server; call `shutdown` to stop it.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                """Silence per-request logging to stderr."""
+
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class GameMetrics:
+    """The metrics recorded by `Game` while it plays.
+
+    Attributes:
+        games (Counter): Games played to completion.
+        turns (Counter): Turns played.
+        rook_wins (Counter): Games won by the rook, including wins by timeout.
+        bishop_wins (Counter): Games won by the bishop.
+        timeouts (Counter): Games that reached the turn limit without a capture.
+        game_length (Histogram): Turn count at which each game ended.
+        turn_latency (Histogram): Wall-clock duration of each turn in seconds.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Register the game metrics on a registry.
+
+        Args:
+            registry (MetricsRegistry): Registry to create the metrics on.
+        """
+        self.games = registry.counter("chess_games_total", "Games played.")
+        self.turns = registry.counter("chess_turns_total", "Turns played.")
+        self.rook_wins = registry.counter(
+            "chess_rook_wins_total",
+            "Games won by the rook, including wins by timeout.",
+        )
+        self.bishop_wins = registry.counter(
+            "chess_bishop_wins_total",
+            "Games won by the bishop.",
+        )
+        self.timeouts = registry.counter(
+            "chess_timeouts_total",
+            "Games that reached the turn limit without a capture.",
+        )
+        self.game_length = registry.histogram(
+            "chess_game_length_turns",
+            "Turn count at which each game ended.",
+            DEFAULT_LENGTH_BUCKETS,
+        )
+        self.turn_latency = registry.histogram(
+            "chess_turn_latency_seconds",
+            "Wall-clock duration of a single turn.",
+            DEFAULT_LATENCY_BUCKETS,
+        )
+
+    def record_turn(self, seconds: float) -> None:
+        """Record a played turn.
+
+        Args:
+            seconds (float): How long the turn took.
+        """
+        self.turns.inc()
+        self.turn_latency.observe(seconds)
+
+    def record_game(self, rook_won: bool, turns: int, timed_out: bool) -> None:
+        """Record a finished game.
+
+        Args:
+            rook_won (bool): Whether the rook won, by capture or by timeout.
+            turns (int): The turn count reported for the game.
+            timed_out (bool): Whether the turn limit was reached without a capture.
+        """
+        self.games.inc()
+        if rook_won:
+            self.rook_wins.inc()
+        else:
+            self.bishop_wins.inc()
+        if timed_out:
+            self.timeouts.inc()
+        self.game_length.observe(turns)
+
+
+REGISTRY = MetricsRegistry()
+GAME_METRICS = GameMetrics(REGISTRY)
@@ -8,20 +8,57 @@ class MoveDirection(Enum):
     UP = "up"
     RIGHT = "right"
 
+    @property
+    def vector(self) -> tuple[int, int]:
+        """The direction as a (files to the right, ranks up) step."""
+        return (0, 1) if self is MoveDirection.UP else (1, 0)
 
-def toss_coin() -> MoveDirection:
+
+def toss_coin(rng: random.Random | None = None) -> MoveDirection:
     """Simulate a coin toss to choose a move direction.
 
+    Args:
+        rng (random.Random | None, optional): Generator to draw from. Defaults to
+            the module-level generator shared by the whole process.
+
     Returns:
         MoveDirection: UP if the coin toss is heads, otherwise RIGHT.
     """
-    return MoveDirection.UP if random.choice([True, False]) else MoveDirection.RIGHT
+    choice = random.choice if rng is None else rng.choice
+    return MoveDirection.UP if choice([True, False]) else MoveDirection.RIGHT
 
 
-def roll_dice() -> int:
+def roll_dice(rng: random.Random | None = None) -> int:
     """Simulate rolling a six-sided die.
 
+    Args:
+        rng (random.Random | None, optional): Generator to draw from. Defaults to
+            the module-level generator shared by the whole process.
+
     Returns:
         int: A random integer between 1 and 6, inclusive.
     """
-    return random.randint(1, 6)
+    randint = random.randint if rng is None else rng.randint
+    return randint(1, 6)
+
+
+def dice_sum_distribution(dice: int = 2, sides: int = 6) -> dict[int, float]:
+    """Compute the probability of every total when rolling several fair dice.
+
+    Args:
+        dice (int, optional): Number of dice rolled. Defaults to 2.
+        sides (int, optional): Number of sides on each die. Defaults to 6.
+
+    Returns:
+        dict[int, float]: Probability of each attainable total, keyed by total.
+    """
+    ways = {0: 1}
+    for _ in range(dice):
+        next_ways: dict[int, int] = {}
+        for total, count in ways.items():
+            for face in range(1, sides + 1):
+                next_ways[total + face] = next_ways.get(total + face, 0) + count
+        ways = next_ways
+
+    outcomes = sides**dice
+    return {total: count / outcomes for total, count in sorted(ways.items())}
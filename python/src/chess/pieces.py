@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable
 from enum import Enum
+from functools import lru_cache
+from typing import ClassVar, NamedTuple
 
 from chess.move import MoveDirection
+from chess.rules import (
+    BISHOP_SPEC,
+    KNIGHT_SPEC,
+    QUEEN_SPEC,
+    ROOK_SPEC,
+    AttackTable,
+    MoveSpec,
+    compile_spec,
+)
 
 
 def get_available_files(board_size: int) -> list[str]:
@@ -29,6 +42,7 @@ class Coordinate:
         available_files (list[str]): Valid file letters for this board size.
         file (str): The file letter (e.g., 'A').
         rank (int): The rank number (1-based).
+        square (int): Row-major square id, as returned by `square_id`.
     """
 
     def __init__(self, file: str, rank: int, board_size: int = 8) -> None:
@@ -47,14 +61,17 @@ class Coordinate:
         self.file = file.upper()
         self.rank = rank
 
-        if self.file not in self.available_files:
+        try:
+            file_index = self.available_files.index(self.file)
+        except ValueError:
             raise ValueError(
                 f"file: {file} must be between a and {self.available_files[-1]}, inclusive.",
-            )
+            ) from None
         if self.rank < 1 or rank > board_size:
             raise ValueError(
                 f"rank: {rank} must be between 1 and {board_size}, inclusive.",
             )
+        self.square = (board_size - rank) * board_size + file_index
 
     @classmethod
     def from_indexes(
@@ -90,6 +107,30 @@ class Coordinate:
         rank = board_size - rank_index
         return cls(file, rank, board_size=board_size)
 
+    @classmethod
+    def from_square_id(cls, square_id: int, board_size: int = 8) -> "Coordinate":
+        """Create a Coordinate from a row-major square id.
+
+        Args:
+            square_id (int): `rank_index * board_size + file_index`.
+            board_size (int, optional): Size of the board. Defaults to 8.
+
+        Returns:
+            Coordinate: The corresponding Coordinate instance.
+
+        Raises:
+            ValueError: If the square id is off the board.
+        """
+        if not (0 <= square_id < board_size * board_size):
+            raise ValueError(
+                f"square_id: {square_id} must be between 0 and {board_size * board_size - 1}",
+            )
+        return cls.from_indexes(
+            square_id % board_size,
+            square_id // board_size,
+            board_size,
+        )
+
     def __str__(self) -> str:
         """Return the coordinate in standard notation.
 
@@ -129,7 +170,7 @@ class Coordinate:
         Returns:
             int: Index of `self.file` in available_files.
         """
-        return self.available_files.index(self.file)
+        return self.square % self.board_size
 
     def rank_index(self) -> int:
         """Get zero-based index of the rank.
@@ -139,6 +180,139 @@ class Coordinate:
         """
         return self.board_size - self.rank
 
+    def square_id(self) -> int:
+        """Get the row-major square id, matching the rendered board grid.
+
+        The id is computed once, when the coordinate is created, and kept in
+        `square`.
+
+        Returns:
+            int: `rank_index * board_size + file_index`.
+        """
+        return self.square
+
+
+STANDARD_BOARD_SIZES = (8,)
+
+
+def _build_square_tables(board_size: int) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Build the notation-to-square-id and square-id-to-notation tables.
+
+    Args:
+        board_size (int): Size of the board.
+
+    Returns:
+        tuple[dict[str, int], tuple[str, ...]]: Square ids keyed by notation in both
+        upper and lower case, and the upper-case notation of every square id.
+    """
+    files = get_available_files(board_size)
+    names = tuple(
+        f"{files[square % board_size]}{board_size - square // board_size}"
+        for square in range(board_size * board_size)
+    )
+    ids = {name: square for square, name in enumerate(names)}
+    ids.update({name.lower(): square for square, name in enumerate(names)})
+    return ids, names
+
+
+_STANDARD_SQUARE_TABLES = {
+    board_size: _build_square_tables(board_size) for board_size in STANDARD_BOARD_SIZES
+}
+
+
+@lru_cache(maxsize=8)
+def _odd_square_tables(board_size: int) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Build and cache the square tables of a non-standard board size."""
+    return _build_square_tables(board_size)
+
+
+def square_tables(board_size: int) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Get the lookup tables used for bulk square parsing and formatting.
+
+    Standard board sizes are precomputed at import time, other sizes are built on
+    first use and kept in a small LRU cache.
+
+    Args:
+        board_size (int): Size of the board.
+
+    Returns:
+        tuple[dict[str, int], tuple[str, ...]]: Notation-to-id and id-to-notation
+        tables.
+    """
+    tables = _STANDARD_SQUARE_TABLES.get(board_size)
+    return tables if tables is not None else _odd_square_tables(board_size)
+
+
+class ParsedSquares(NamedTuple):
+    """Result of parsing a column of squares in bulk.
+
+    Attributes:
+        square_ids (array[int]): Square id of every entry, -1 where invalid.
+        errors (list[tuple[int, str]]): Row and original value of every invalid
+            entry.
+    """
+
+    square_ids: "array[int]"
+    errors: list[tuple[int, str]]
+
+
+def parse_squares(values: Iterable[str], board_size: int = 8) -> ParsedSquares:
+    """Convert squares in standard notation (e.g. 'C3') to square ids in bulk.
+
+    Parsing is a dictionary lookup per entry; surrounding whitespace and mixed
+    case are accepted. Invalid entries are collected rather than raised.
+
+    Args:
+        values (Iterable[str]): Squares in standard notation.
+        board_size (int, optional): Size of the board. Defaults to 8.
+
+    Returns:
+        ParsedSquares: The square ids and the invalid entries.
+    """
+    ids, _ = square_tables(board_size)
+    square_ids = array("i")
+    errors = []
+    lookup = ids.get
+    for row, value in enumerate(values):
+        square = lookup(value)
+        if square is None:
+            square = lookup(value.strip().upper()) if isinstance(value, str) else None
+            if square is None:
+                errors.append((row, value))
+                square = -1
+        square_ids.append(square)
+    return ParsedSquares(square_ids, errors)
+
+
+def format_squares(square_ids: Iterable[int], board_size: int = 8) -> list[str]:
+    """Convert square ids back to standard notation in bulk.
+
+    Args:
+        square_ids (Iterable[int]): Square ids, as produced by `parse_squares`.
+        board_size (int, optional): Size of the board. Defaults to 8.
+
+    Returns:
+        list[str]: The notation of every square, as `Coordinate.__str__` prints it.
+
+    Raises:
+        ValueError: If any id is off the board, reporting how many and where.
+    """
+    _, names = square_tables(board_size)
+    formatted = []
+    invalid = []
+    for row, square in enumerate(square_ids):
+        if 0 <= square < len(names):
+            formatted.append(names[square])
+        else:
+            invalid.append(f"row {row}: {square}")
+    if invalid:
+        shown = ", ".join(invalid[:10]) + (", ..." if len(invalid) > 10 else "")
+        raise ValueError(
+            f"{len(invalid)} square ids are not on a {board_size}x{board_size} "
+            f"board: {shown}",
+        )
+    return formatted
+
 
 class PieceColor(Enum):
     """Enumeration of chess piece colors."""
@@ -195,83 +369,109 @@ class ChessPiece(ABC):
         return f"{self.color.value} {self.name}"
 
 
-class Rook(ChessPiece):
-    """Rook chess piece, moves horizontally or vertically."""
+class TablePiece(ChessPiece):
+    """Chess piece whose movement is described by a declarative `MoveSpec`.
 
-    def __init__(self, coordinate: Coordinate, color: PieceColor) -> None:
-        """Initialize a Rook.
+    The spec is compiled once per board size into an `AttackTable`, so capture
+    checks and moves are table lookups. Each subclass keeps its compiled tables
+    in a dict keyed by board size, which is cheaper to consult on every capture
+    check than `compile_spec`'s cache, whose key hashes the whole spec.
 
-        Args:
-            coordinate (Coordinate): Starting position.
-            color (PieceColor): Piece color.
-        """
-        super().__init__(coordinate, color)
+    Attributes:
+        move_spec (MoveSpec): How the piece moves and captures.
+    """
 
-    @property
-    def name(self) -> str:
-        """Name of the piece."""
-        return "Rook"
+    move_spec: ClassVar[MoveSpec]
+    _tables: ClassVar[dict[int, AttackTable]] = {}
 
-    @property
-    def emoji(self) -> str:
-        """Emoji representation of the rook."""
-        if self.color == PieceColor.WHITE:
-            return "\u2656"
-        else:
-            return "\u265c"
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Give every subclass its own table dict, as specs differ per class."""
+        super().__init_subclass__(**kwargs)
+        cls._tables = {}
+
+    def attack_table(self, board_size: int | None = None) -> AttackTable:
+        """Get the compiled attack table for a board size.
+
+        Args:
+            board_size (int | None, optional): Size of the board. Defaults to the
+                board size of the piece's coordinate.
+
+        Returns:
+            AttackTable: The cached table.
+        """
+        board_size = board_size or self.coordinate.board_size
+        table = self._tables.get(board_size)
+        if table is None:
+            table = self._tables[board_size] = compile_spec(self.move_spec, board_size)
+        return table
 
     def can_capture(self, target_coordinate: Coordinate) -> bool:
-        """Check if the rook can capture at the target coordinate.
+        """Check if the piece attacks the target coordinate.
 
         Args:
             target_coordinate (Coordinate): Position to test.
 
         Returns:
-            bool: True if same file or same rank.
+            bool: True if the target is in the piece's attack table.
         """
-        return (
-            self.coordinate.file == target_coordinate.file
-            or self.coordinate.rank == target_coordinate.rank
-        )
+        coordinate = self.coordinate
+        table = self._tables.get(coordinate.board_size) or self.attack_table()
+        return bool(table.attacks[coordinate.square] >> target_coordinate.square & 1)
+
+    def destinations(self) -> list[Coordinate]:
+        """List every square the piece can move to from its current position.
+
+        Returns:
+            list[Coordinate]: Reachable coordinates, ignoring other pieces.
+        """
+        board_size = self.coordinate.board_size
+        return [
+            Coordinate.from_square_id(square, board_size)
+            for square in self.attack_table().destinations[self.coordinate.square_id()]
+        ]
 
     def move(self, direction: MoveDirection, spaces: int, board_size: int) -> None:
-        """Move the rook in a given direction by a number of spaces.
+        """Move the piece in a given direction by a number of spaces.
 
         Args:
             direction (MoveDirection): UP or RIGHT.
             spaces (int): Number of spaces to move.
             board_size (int): Size of the board for wrapping.
+
+        Raises:
+            ValueError: If the piece cannot move that way.
         """
-        file_idx = self.coordinate.file_index()
-        rank_idx = self.coordinate.rank_index()
-
-        if direction == MoveDirection.UP:
-            new_rank_idx = (rank_idx - spaces) % board_size
-            self.coordinate = Coordinate.from_indexes(
-                file_idx,
-                new_rank_idx,
-                board_size,
-            )
-        elif direction == MoveDirection.RIGHT:
-            new_file_idx = (file_idx + spaces) % board_size
-            self.coordinate = Coordinate.from_indexes(
-                new_file_idx,
-                rank_idx,
-                board_size,
-            )
+        square = self.attack_table(board_size).step(
+            self.coordinate.square_id(),
+            direction.vector,
+            spaces,
+        )
+        self.coordinate = Coordinate.from_square_id(square, board_size)
 
 
-class Bishop(ChessPiece):
-    """Bishop chess piece, moves diagonally."""
+class Rook(TablePiece):
+    """Rook chess piece, moves horizontally or vertically, wrapping around the board."""
 
-    def __init__(self, coordinate: Coordinate, color: PieceColor) -> None:
-        """Initialize a Bishop.
+    move_spec = ROOK_SPEC
 
-        Args:
-            coordinate (Coordinate): Starting position.
-            color (PieceColor): Piece color.
-        """
-        super().__init__(coordinate, color)
+    @property
+    def name(self) -> str:
+        """Name of the piece."""
+        return "Rook"
+
+    @property
+    def emoji(self) -> str:
+        """Emoji representation of the rook."""
+        if self.color == PieceColor.WHITE:
+            return "\u2656"
+        else:
+            return "\u265c"
+
+
+class Bishop(TablePiece):
+    """Bishop chess piece, moves diagonally."""
+
+    move_spec = BISHOP_SPEC
 
     @property
     def name(self) -> str:
@@ -286,15 +486,40 @@ class Bishop(ChessPiece):
         else:
             return "\u265d"
 
-    def can_capture(self, target_coordinate: Coordinate) -> bool:
-        """Check if the bishop can capture at the target coordinate.
 
-        Args:
-            target_coordinate (Coordinate): Position to test.
+class Knight(TablePiece):
+    """Knight chess piece, leaps in an L shape."""
 
-        Returns:
-            bool: True if on the same diagonal.
-        """
-        return abs(
-            self.coordinate.file_index() - target_coordinate.file_index(),
-        ) == abs(self.coordinate.rank_index() - target_coordinate.rank_index())
+    move_spec = KNIGHT_SPEC
+
+    @property
+    def name(self) -> str:
+        """Name of the piece."""
+        return "Knight"
+
+    @property
+    def emoji(self) -> str:
+        """Emoji representation of the knight."""
+        if self.color == PieceColor.WHITE:
+            return "\u2658"
+        else:
+            return "\u265e"
+
+
+class Queen(TablePiece):
+    """Queen chess piece, moves horizontally, vertically or diagonally."""
+
+    move_spec = QUEEN_SPEC
+
+    @property
+    def name(self) -> str:
+        """Name of the piece."""
+        return "Queen"
+
+    @property
+    def emoji(self) -> str:
+        """Emoji representation of the queen."""
+        if self.color == PieceColor.WHITE:
+            return "\u2655"
+        else:
+            return "\u265b"
@@ -0,0 +1,620 @@
+import itertools
+import json
+import os
+import re
+import struct
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple
+
+from chess.game import Game
+from chess.move import MoveDirection
+from chess.pieces import format_squares, parse_squares
+from chess.rules import BISHOP_SPEC, ROOK_SPEC, compile_spec
+
+ROOK = "♖"
+BISHOP = "♝"
+EMPTY = "_"
+
+
+class ReplayFormat(Enum):
+    """Animation formats a replay is exported to; values are file extensions."""
+
+    CAST = "cast"
+    SVG = "svg"
+    GIF = "gif"
+
+
+class Change(NamedTuple):
+    """A square whose content changes in a frame.
+
+    Attributes:
+        square (int): Square id.
+        piece (str): Glyph of the piece now on the square, or `EMPTY`.
+    """
+
+    square: int
+    piece: str
+
+
+class RecordedGame(NamedTuple):
+    """Start squares and rook moves of a played game, enough to replay it.
+
+    Captures follow from the positions, so they are not recorded.
+
+    Attributes:
+        rook (int): Square id the rook started on.
+        bishop (int): Square id of the bishop.
+        moves (tuple[tuple[MoveDirection, int], ...]): Direction and spaces of the
+            rook's move in every turn it moved.
+        number_of_turns (int): Turn limit the game was played with.
+        board_size (int): Size of the board.
+        name (str): Name of the game, used for its file names.
+    """
+
+    rook: int
+    bishop: int
+    moves: tuple[tuple[MoveDirection, int], ...]
+    number_of_turns: int = 15
+    board_size: int = 8
+    name: str = ""
+
+    def frames(self) -> Iterator[list[Change]]:
+        """Replay the game as the squares each frame changes.
+
+        The first frame places both pieces on an empty board. Every turn the rook
+        moves adds a frame in which it leaves its square and lands on another, and
+        a capture adds one in which the capturing piece takes its opponent's
+        square, following the turn rules of `Game._resolve_turn`.
+
+        Yields:
+            list[Change]: The changed squares of a frame, never empty.
+        """
+        rook_table = compile_spec(ROOK_SPEC, self.board_size)
+        bishop_table = compile_spec(BISHOP_SPEC, self.board_size)
+        rook, bishop = self.rook, self.bishop
+        yield [Change(rook, ROOK), Change(bishop, BISHOP)]
+        for turn in range(1, self.number_of_turns + 1):
+            if rook_table.can_attack(rook, bishop):
+                yield [Change(rook, EMPTY), Change(bishop, ROOK)]
+                return
+            if turn > len(self.moves):
+                return
+            direction, spaces = self.moves[turn - 1]
+            target = rook_table.step(rook, direction.vector, spaces)
+            if target == rook:
+                yield [Change(rook, ROOK)]
+            else:
+                yield [Change(rook, EMPTY), Change(target, ROOK)]
+            rook = target
+            if bishop_table.can_attack(bishop, rook):
+                yield [Change(bishop, EMPTY), Change(rook, BISHOP)]
+                return
+
+    def to_json(self) -> str:
+        """Serialize the game as one line of JSON with squares in notation."""
+        rook, bishop = format_squares([self.rook, self.bishop], self.board_size)
+        return json.dumps(
+            {
+                "name": self.name,
+                "rook": rook,
+                "bishop": bishop,
+                "moves": [
+                    [direction.value, spaces] for direction, spaces in self.moves
+                ],
+                "number_of_turns": self.number_of_turns,
+                "board_size": self.board_size,
+            },
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "RecordedGame":
+        """Parse a line written by `to_json`.
+
+        Args:
+            line (str): The JSON line.
+
+        Returns:
+            RecordedGame: The recorded game.
+
+        Raises:
+            ValueError: If a square or a move direction is invalid.
+        """
+        state = json.loads(line)
+        board_size = state.get("board_size", 8)
+        parsed = parse_squares([state["rook"], state["bishop"]], board_size)
+        if parsed.errors:
+            raise ValueError(f"invalid squares in recording: {parsed.errors}")
+        return cls(
+            rook=parsed.square_ids[0],
+            bishop=parsed.square_ids[1],
+            moves=tuple(
+                (MoveDirection(direction), int(spaces))
+                for direction, spaces in state["moves"]
+            ),
+            number_of_turns=state.get("number_of_turns", 15),
+            board_size=board_size,
+            name=state.get("name", ""),
+        )
+
+
+def record_game(game: Game, number_of_turns: int, name: str = "") -> RecordedGame:
+    """Play a game turn by turn, recording the rook's moves.
+
+    Args:
+        game (Game): A game that has not been played yet.
+        number_of_turns (int): Maximum number of turns to play.
+        name (str, optional): Name of the recording. Defaults to "".
+
+    Returns:
+        RecordedGame: The start squares and moves of the game.
+    """
+    rook = game.rook.coordinate.square_id()
+    bishop = game.bishop.coordinate.square_id()
+    moves = [
+        game.last_move
+        for _ in game.turns(number_of_turns)
+        if game.last_move is not None
+    ]
+    return RecordedGame(
+        rook=rook,
+        bishop=bishop,
+        moves=tuple(moves),
+        number_of_turns=number_of_turns,
+        board_size=game.board_size,
+        name=name,
+    )
+
+
+def save_recordings(
+    path: str,
+    games: Iterable[RecordedGame],
+    buffer_size: int = 1 << 16,
+) -> int:
+    """Write recorded games to a JSON lines file as they come.
+
+    Args:
+        path (str): Destination file.
+        games (Iterable[RecordedGame]): The games, consumed lazily.
+        buffer_size (int, optional): Bytes buffered per write. Defaults to 64 KiB.
+
+    Returns:
+        int: Number of games written.
+    """
+    count = 0
+    with open(path, "w", buffering=buffer_size) as recordings:
+        for game in games:
+            recordings.write(game.to_json() + "\n")
+            count += 1
+    return count
+
+
+def load_recordings(path: str) -> Iterator[RecordedGame]:
+    """Read recorded games from a JSON lines file one line at a time.
+
+    Args:
+        path (str): File written by `save_recordings`.
+
+    Yields:
+        RecordedGame: Every game in the file, skipping blank lines.
+    """
+    with open(path) as recordings:
+        for line in recordings:
+            if line.strip():
+                yield RecordedGame.from_json(line)
+
+
+_LIGHT, _DARK, _WHITE, _BLACK, _CLEAR = range(5)
+_PALETTE = bytes(
+    (240, 217, 181, 181, 136, 99, 250, 250, 250, 20, 20, 20) + (0, 0, 0) * 4,
+)
+_SVG_COLORS = {_LIGHT: "#f0d9b5", _DARK: "#b58863"}
+
+
+def _background(square: int, board_size: int) -> int:
+    """Palette index of a square's color; a1 is dark on even boards."""
+    rank_index, file_index = divmod(square, board_size)
+    return _DARK if (rank_index + file_index) % 2 else _LIGHT
+
+
+@lru_cache(maxsize=64)
+def _sprite(piece: str, background: int, cell_size: int) -> bytes:
+    """Palette indexes of a square with a piece drawn on it, row by row.
+
+    The rook is a white block with a black outline, the bishop a black diamond.
+    """
+    pixels = bytearray([background]) * (cell_size * cell_size)
+    low, high = cell_size // 4, cell_size - cell_size // 4
+    center, radius = (cell_size - 1) / 2, cell_size / 3
+    for y in range(cell_size):
+        for x in range(cell_size):
+            if piece == ROOK and low <= x < high and low <= y < high:
+                edge = x in (low, high - 1) or y in (low, high - 1)
+                pixels[y * cell_size + x] = _BLACK if edge else _WHITE
+            elif piece == BISHOP and abs(x - center) + abs(y - center) <= radius:
+                pixels[y * cell_size + x] = _BLACK
+    return bytes(pixels)
+
+
+def _lzw(pixels: bytes, min_code_size: int) -> bytes:
+    """Compress palette indexes with GIF's variable-width LZW, in sub-blocks.
+
+    Strings in the code table are keyed by the code of their prefix and their
+    last pixel, so extending the current string is one integer lookup.
+    """
+    clear = 1 << min_code_size
+    end = clear + 1
+    codes: dict[int, int] = {}
+    next_code, code_size = end + 1, min_code_size + 1
+    packed = bytearray()
+    bits = count = 0
+
+    def emit(code: int) -> None:
+        nonlocal bits, count
+        bits |= code << count
+        count += code_size
+        while count >= 8:
+            packed.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+
+    emit(clear)
+    if not pixels:
+        emit(end)
+    else:
+        lookup = codes.get
+        prefix = pixels[0]
+        for pixel in pixels[1:]:
+            key = prefix << 8 | pixel
+            code = lookup(key)
+            if code is not None:
+                prefix = code
+                continue
+            emit(prefix)
+            if next_code >= 1 << code_size and code_size < 12:
+                code_size += 1
+            if next_code >= 4095:
+                emit(clear)
+                codes.clear()
+                next_code, code_size = end + 1, min_code_size + 1
+            else:
+                codes[key] = next_code
+                next_code += 1
+            prefix = pixel
+        emit(prefix)
+        if next_code >= 1 << code_size and code_size < 12:
+            code_size += 1
+        emit(end)
+    if count:
+        packed.append(bits & 0xFF)
+    blocks = b"".join(
+        bytes((len(packed[start : start + 255]),)) + packed[start : start + 255]
+        for start in range(0, len(packed), 255)
+    )
+    return bytes((min_code_size,)) + blocks + b"\x00"
+
+
+def _gif_image(
+    squares: dict[int, str],
+    region: tuple[int, int, int, int],
+    board_size: int,
+    cell_size: int,
+    delay: int,
+) -> bytes:
+    """Encode one frame: the squares in `squares`, transparent elsewhere in region.
+
+    Args:
+        squares (dict[int, str]): Squares to draw and the glyph on each.
+        region (tuple[int, int, int, int]): First and last rank and file indexes
+            of the rectangle of squares the image covers.
+        board_size (int): Size of the board.
+        cell_size (int): Pixels per square side.
+        delay (int): Hundredths of a second the frame is shown.
+
+    Returns:
+        bytes: Graphic control extension, image descriptor and image data.
+    """
+    top, bottom, left, right = region
+    rows: list[bytes] = []
+    blank = bytes((_CLEAR,)) * cell_size
+    for rank_index in range(top, bottom + 1):
+        sprites: list[bytes | None] = []
+        for file_index in range(left, right + 1):
+            square = rank_index * board_size + file_index
+            piece = squares.get(square)
+            sprites.append(
+                (
+                    None
+                    if piece is None
+                    else _sprite(piece, _background(square, board_size), cell_size)
+                ),
+            )
+        for y in range(cell_size):
+            rows.extend(
+                blank if sprite is None else sprite[y * cell_size : (y + 1) * cell_size]
+                for sprite in sprites
+            )
+    control = b"!\xf9\x04" + struct.pack("<BHB", 0x05, delay, _CLEAR) + b"\x00"
+    descriptor = b"," + struct.pack(
+        "<HHHHB",
+        left * cell_size,
+        top * cell_size,
+        (right - left + 1) * cell_size,
+        (bottom - top + 1) * cell_size,
+        0,
+    )
+    return control + descriptor + _lzw(b"".join(rows), 3)
+
+
+@lru_cache(maxsize=256)
+def _opening_image(
+    placed: tuple[Change, ...],
+    board_size: int,
+    cell_size: int,
+    delay: int,
+) -> bytes:
+    """Encode the first frame, the whole board; games with the same start share it."""
+    squares = dict.fromkeys(range(board_size * board_size), EMPTY)
+    squares.update(placed)
+    region = (0, board_size - 1, 0, board_size - 1)
+    return _gif_image(squares, region, board_size, cell_size, delay)
+
+
+def _gif_chunks(
+    game: RecordedGame,
+    frame_seconds: float,
+    cell_size: int,
+) -> Iterator[bytes]:
+    """Stream a looping GIF of the game.
+
+    The first image draws the whole board and is encoded once per start
+    position. Every later image covers only the rectangle around the squares its
+    frame changes, with the squares in between transparent, so each frame costs
+    the size of its change rather than a board.
+    """
+    size = game.board_size
+    side = size * cell_size
+    yield (
+        b"GIF89a"
+        + struct.pack("<HHBBB", side, side, 0xF2, 0, 0)
+        + _PALETTE
+        + b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00"
+    )
+    delay = round(frame_seconds * 100)
+    frames = game.frames()
+    yield _opening_image(tuple(next(frames)), size, cell_size, delay)
+    for changes in frames:
+        squares = dict(changes)
+        ranks = [square // size for square in squares]
+        files = [square % size for square in squares]
+        region = (min(ranks), max(ranks), min(files), max(files))
+        yield _gif_image(squares, region, size, cell_size, delay)
+    yield b";"
+
+
+def _svg_chunks(
+    game: RecordedGame,
+    frame_seconds: float,
+    cell_size: int,
+) -> Iterator[bytes]:
+    """Stream an SVG that draws the board once and animates the pieces with SMIL.
+
+    Each frame only adds `<set>` elements for the pieces its changes move or
+    remove, timed from the start of the document.
+    """
+    size = game.board_size
+    side = size * cell_size
+    yield (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{side}" height="{side}" viewBox="0 0 {side} {side}">\n'
+        f'<rect width="{side}" height="{side}" fill="{_SVG_COLORS[_LIGHT]}"/>\n'
+    ).encode()
+    yield "".join(
+        f'<rect x="{square % size * cell_size}" y="{square // size * cell_size}" '
+        f'width="{cell_size}" height="{cell_size}" fill="{_SVG_COLORS[_DARK]}"/>\n'
+        for square in range(size * size)
+        if _background(square, size) == _DARK
+    ).encode()
+
+    def center(square: int) -> tuple[float, float]:
+        rank_index, file_index = divmod(square, size)
+        return (file_index + 0.5) * cell_size, (rank_index + 0.5) * cell_size
+
+    names = {ROOK: "rook", BISHOP: "bishop"}
+    board: dict[int, str] = {}
+    positions: dict[str, int] = {}
+    for index, changes in enumerate(game.frames()):
+        for square, piece in changes:
+            if piece == EMPTY:
+                board.pop(square, None)
+            else:
+                board[square] = piece
+        current = {piece: square for square, piece in board.items()}
+        begin = f"{index * frame_seconds:g}s"
+        elements = []
+        for piece, square in current.items():
+            x, y = center(square)
+            if piece not in positions:
+                elements.append(
+                    f'<text id="{names[piece]}" x="{x:g}" y="{y:g}" '
+                    f'font-size="{cell_size * 0.8:g}" text-anchor="middle" '
+                    f'dominant-baseline="central">{piece}</text>\n',
+                )
+            elif positions[piece] != square:
+                elements.extend(
+                    f'<set xlink:href="#{names[piece]}" attributeName="{axis}" '
+                    f'to="{value:g}" begin="{begin}" fill="freeze"/>\n'
+                    for axis, value in (("x", x), ("y", y))
+                )
+        elements.extend(
+            f'<set xlink:href="#{names[piece]}" attributeName="visibility" '
+            f'to="hidden" begin="{begin}" fill="freeze"/>\n'
+            for piece in positions
+            if piece not in current
+        )
+        positions = current
+        yield "".join(elements).encode()
+    yield b"</svg>\n"
+
+
+def _cast_chunks(
+    game: RecordedGame,
+    frame_seconds: float,
+    cell_size: int,
+) -> Iterator[bytes]:
+    """Stream an asciinema v2 terminal cast of the board as `ChessBoard` renders it.
+
+    The first event clears the screen and prints the board; every later event
+    moves the cursor to the changed squares and overwrites only those.
+    """
+    size = game.board_size
+    header = {"version": 2, "width": 3 * size, "height": size + 1, "title": game.name}
+    yield (json.dumps(header) + "\n").encode()
+    park = f"\x1b[{size + 1};1H"
+    seconds = 0.0
+    for index, changes in enumerate(game.frames()):
+        if index == 0:
+            rows: list[list[str]] = [[EMPTY] * size for _ in range(size)]
+            for square, piece in changes:
+                rows[square // size][square % size] = piece
+            text = "\x1b[2J\x1b[H" + "\r\n".join("  ".join(row) for row in rows)
+        else:
+            text = "".join(
+                f"\x1b[{square // size + 1};{square % size * 3 + 1}H{piece}"
+                for square, piece in changes
+            )
+        yield (json.dumps([round(seconds, 3), "o", text + park]) + "\n").encode()
+        seconds += frame_seconds
+    yield (json.dumps([round(seconds, 3), "o", ""]) + "\n").encode()
+
+
+_ENCODERS: dict[
+    ReplayFormat,
+    Callable[[RecordedGame, float, int], Iterator[bytes]],
+] = {
+    ReplayFormat.CAST: _cast_chunks,
+    ReplayFormat.SVG: _svg_chunks,
+    ReplayFormat.GIF: _gif_chunks,
+}
+
+
+def export_replay(
+    game: RecordedGame,
+    path: str,
+    replay_format: ReplayFormat,
+    frame_seconds: float = 0.5,
+    cell_size: int = 32,
+    buffer_size: int = 1 << 16,
+) -> int:
+    """Write an animation of a recorded game, streaming it frame by frame.
+
+    Frames go through a buffered file as they are encoded, so the animation is
+    never held in memory. Each call writes its own temporary file next to the
+    destination, so the file appears under its name only once complete, even
+    when several exports target the same path.
+
+    Args:
+        game (RecordedGame): The game to animate.
+        path (str): Destination file.
+        replay_format (ReplayFormat): Animation format.
+        frame_seconds (float, optional): Seconds per frame. Defaults to 0.5.
+        cell_size (int, optional): Pixels per square side in images.
+            Defaults to 32.
+        buffer_size (int, optional): Bytes buffered per write. Defaults to 64 KiB.
+
+    Returns:
+        int: Bytes written.
+    """
+    descriptor, partial = tempfile.mkstemp(
+        suffix=".partial",
+        prefix=f".{os.path.basename(path)}.",
+        dir=os.path.dirname(os.path.abspath(path)),
+    )
+    written = 0
+    try:
+        with open(descriptor, "wb", buffering=buffer_size) as animation:
+            for chunk in _ENCODERS[replay_format](game, frame_seconds, cell_size):
+                written += animation.write(chunk)
+        # mkstemp creates the file readable by its owner only.
+        os.chmod(partial, 0o644)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.unlink(partial)
+        raise
+    return written
+
+
+def _file_names(games: Iterable[RecordedGame], extension: str) -> list[str]:
+    """Name one file per game, appending the input index to names already taken."""
+    names: list[str] = []
+    taken: set[str] = set()
+    for index, game in enumerate(games):
+        stem = re.sub(r"[^\w.-]", "_", game.name or f"game-{index:05d}")
+        name = f"{stem}.{extension}"
+        candidates = (
+            f"{stem}-{index}{f'-{attempt}' if attempt else ''}.{extension}"
+            for attempt in itertools.count()
+        )
+        # Compared case-insensitively, as some file systems are.
+        while name.casefold() in taken:
+            name = next(candidates)
+        taken.add(name.casefold())
+        names.append(name)
+    return names
+
+
+def export_replays(
+    games: Iterable[RecordedGame],
+    directory: str,
+    replay_format: ReplayFormat,
+    workers: int | None = None,
+    frame_seconds: float = 0.5,
+    cell_size: int = 32,
+) -> list[str]:
+    """Export animations of many games in parallel, one file per game.
+
+    Files are named after the games, with characters other than letters, digits,
+    dots and dashes replaced; unnamed games are numbered in input order. A name
+    already taken by an earlier game gets the game's input index appended.
+
+    Args:
+        games (Iterable[RecordedGame]): The games to animate.
+        directory (str): Output directory, created if missing.
+        replay_format (ReplayFormat): Animation format.
+        workers (int | None, optional): Worker threads. Defaults to the
+            executor's default.
+        frame_seconds (float, optional): Seconds per frame. Defaults to 0.5.
+        cell_size (int, optional): Pixels per square side. Defaults to 32.
+
+    Returns:
+        list[str]: Paths of the animations, in input order.
+    """
+    os.makedirs(directory, exist_ok=True)
+    games = list(games)
+    jobs = [
+        (game, os.path.join(directory, name))
+        for game, name in zip(
+            games,
+            _file_names(games, replay_format.value),
+            strict=True,
+        )
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(
+            executor.map(
+                lambda job: export_replay(
+                    job[0],
+                    job[1],
+                    replay_format,
+                    frame_seconds,
+                    cell_size,
+                ),
+                jobs,
+            ),
+        )
+    return [path for _, path in jobs]
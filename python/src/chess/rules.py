@@ -0,0 +1,191 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+Vector = tuple[int, int]
+"""A step on the board as (files to the right, ranks up)."""
+
+ORTHOGONAL: tuple[Vector, ...] = ((0, 1), (1, 0), (0, -1), (-1, 0))
+DIAGONAL: tuple[Vector, ...] = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+KNIGHT_LEAPS: tuple[Vector, ...] = (
+    (1, 2),
+    (2, 1),
+    (2, -1),
+    (1, -2),
+    (-1, -2),
+    (-2, -1),
+    (-2, 1),
+    (-1, 2),
+)
+
+
+class MoveSpec(NamedTuple):
+    """Declarative description of how a piece moves and captures.
+
+    Attributes:
+        rays (tuple[Vector, ...]): Directions the piece slides along.
+        leaps (tuple[Vector, ...]): Offsets the piece jumps to directly.
+        wrap (bool): Whether rays and leaps wrap around the board edges.
+        max_range (int | None): Longest slide along a ray, or None for unlimited.
+    """
+
+    rays: tuple[Vector, ...] = ()
+    leaps: tuple[Vector, ...] = ()
+    wrap: bool = False
+    max_range: int | None = None
+
+
+ROOK_SPEC = MoveSpec(rays=ORTHOGONAL, wrap=True)
+BISHOP_SPEC = MoveSpec(rays=DIAGONAL)
+KNIGHT_SPEC = MoveSpec(leaps=KNIGHT_LEAPS)
+QUEEN_SPEC = MoveSpec(rays=ORTHOGONAL + DIAGONAL)
+
+
+class AttackTable:
+    """Per-square attack masks, destinations and rays of a compiled `MoveSpec`.
+
+    Squares are identified by their row-major id, `rank_index * board_size +
+    file_index`. Attack masks are integers with bit `target` set for every
+    attacked square; the origin is always included, matching the convention that
+    a piece can capture on the square it stands on.
+
+    Attributes:
+        spec (MoveSpec): The compiled spec.
+        board_size (int): Size of the board the table was compiled for.
+        attacks (tuple[int, ...]): Attack bitmask per square.
+        destinations (tuple[tuple[int, ...], ...]): Squares reachable in one move,
+            per square, in spec order without duplicates.
+    """
+
+    def __init__(self, spec: MoveSpec, board_size: int) -> None:
+        """Compile a spec for a board size.
+
+        Args:
+            spec (MoveSpec): The spec to compile.
+            board_size (int): Size of the board.
+
+        Raises:
+            ValueError: If the board size is not positive.
+        """
+        if board_size < 1:
+            raise ValueError(f"board_size: {board_size} must be positive")
+        self.spec = spec
+        self.board_size = board_size
+
+        squares = range(board_size * board_size)
+        self._rays: dict[Vector, tuple[tuple[int, ...], ...]] = {
+            direction: tuple(self._trace_ray(square, direction) for square in squares)
+            for direction in spec.rays
+        }
+
+        attacks = []
+        destinations = []
+        for square in squares:
+            reachable = [
+                target
+                for direction in spec.rays
+                for target in self._rays[direction][square][1:]
+            ]
+            for leap in spec.leaps:
+                target = self._offset(square, leap)
+                if target is not None:
+                    reachable.append(target)
+
+            unique = tuple(
+                dict.fromkeys(target for target in reachable if target != square),
+            )
+            mask = 1 << square
+            for target in unique:
+                mask |= 1 << target
+            attacks.append(mask)
+            destinations.append(unique)
+
+        self.attacks: tuple[int, ...] = tuple(attacks)
+        self.destinations: tuple[tuple[int, ...], ...] = tuple(destinations)
+
+    def _offset(self, square: int, step: Vector) -> int | None:
+        """Apply a single step to a square.
+
+        Returns:
+            int | None: The square reached, or None if the step leaves a
+            non-wrapping board.
+        """
+        file_index = square % self.board_size + step[0]
+        rank_index = square // self.board_size - step[1]
+        if self.spec.wrap:
+            file_index %= self.board_size
+            rank_index %= self.board_size
+        elif not (
+            0 <= file_index < self.board_size and 0 <= rank_index < self.board_size
+        ):
+            return None
+        return rank_index * self.board_size + file_index
+
+    def _trace_ray(self, square: int, direction: Vector) -> tuple[int, ...]:
+        """Follow a ray from a square, starting with the square itself.
+
+        The ray stops at the board edge, at `max_range`, or, on a wrapping board,
+        just before it would return to its origin.
+        """
+        ray = [square]
+        limit = self.spec.max_range
+        while limit is None or len(ray) <= limit:
+            current = self._offset(ray[-1], direction)
+            if current is None or current == square:
+                break
+            ray.append(current)
+        return tuple(ray)
+
+    def can_attack(self, origin: int, target: int) -> bool:
+        """Check whether a piece on `origin` attacks `target`.
+
+        Args:
+            origin (int): Square id of the piece.
+            target (int): Square id to test.
+
+        Returns:
+            bool: True if the target bit is set in the origin's attack mask.
+        """
+        return bool(self.attacks[origin] >> target & 1)
+
+    def step(self, origin: int, direction: Vector, spaces: int) -> int:
+        """Slide a number of spaces along a ray.
+
+        When the ray closes into a cycle around a wrapping board, the slide keeps
+        going round it, so any number of spaces is valid.
+
+        Args:
+            origin (int): Square id to start from.
+            direction (Vector): One of the spec's ray directions.
+            spaces (int): Number of spaces to slide.
+
+        Returns:
+            int: The square id reached.
+
+        Raises:
+            ValueError: If the direction is not a ray of the spec, or the slide
+                leaves a non-wrapping board.
+        """
+        if direction not in self._rays:
+            raise ValueError(f"direction: {direction} is not a ray of this piece")
+        ray = self._rays[direction][origin]
+        if self._offset(ray[-1], direction) == origin:
+            return ray[spaces % len(ray)]
+        if not 0 <= spaces < len(ray):
+            raise ValueError(
+                f"cannot move {spaces} spaces along {direction} from square {origin}",
+            )
+        return ray[spaces]
+
+
+@lru_cache(maxsize=None)
+def compile_spec(spec: MoveSpec, board_size: int) -> AttackTable:
+    """Compile a spec into an attack table, once per spec and board size.
+
+    Args:
+        spec (MoveSpec): The spec to compile.
+        board_size (int): Size of the board.
+
+    Returns:
+        AttackTable: The shared, cached table.
+    """
+    return AttackTable(spec, board_size)
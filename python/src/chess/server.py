@@ -0,0 +1,461 @@
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+from collections.abc import Iterator
+from logging import Logger, getLogger
+from typing import Any
+
+from chess.game import Game
+from chess.pieces import Bishop, ChessPiece, Coordinate, PieceColor, Rook
+
+Message = dict[str, Any]
+
+LINE_LIMIT = 1 << 16
+"""Longest request line a connection accepts, in bytes."""
+
+
+class SessionError(Exception):
+    """Raised when a protocol request cannot be applied to a session."""
+
+
+def parse_square(square: str, board_size: int) -> Coordinate:
+    """Parse a square in standard notation (e.g. 'C3') into a Coordinate.
+
+    Args:
+        square (str): File letter followed by rank number.
+        board_size (int): Size of the board the square belongs to.
+
+    Returns:
+        Coordinate: The parsed coordinate.
+
+    Raises:
+        SessionError: If the square is malformed or off the board.
+    """
+    try:
+        return Coordinate(square[:1], int(square[1:]), board_size=board_size)
+    except (ValueError, TypeError) as error:
+        raise SessionError(f"invalid square: {square!r}") from error
+
+
+def integer_field(request: Message, name: str, default: int) -> int:
+    """Read an integer field of a request, rejecting any other JSON value.
+
+    Args:
+        request (Message): The decoded request.
+        name (str): Field name.
+        default (int): Value when the field is absent.
+
+    Returns:
+        int: The field's value.
+
+    Raises:
+        SessionError: If the field is not an integer, e.g. a float such as 1e999.
+    """
+    value: object = request.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise SessionError(f"{name} must be an integer, got {value!r}")
+    return value
+
+
+class GameSession:
+    """A single game hosted by the server, advanced one turn per request.
+
+    Attributes:
+        session_id (int): Identifier clients use to address the session.
+        game (Game): The wrapped game.
+        number_of_turns (int): Maximum number of turns before the rook wins by default.
+        current_turn (int): The last turn played, 0 before the first step.
+        winner (ChessPiece | None): The winning piece once the session is finished.
+    """
+
+    def __init__(
+        self,
+        session_id: int,
+        game: Game,
+        number_of_turns: int,
+        publish_timeout: float,
+    ) -> None:
+        """Initialize a session around a game that has not started yet.
+
+        Args:
+            session_id (int): Identifier clients use to address the session.
+            game (Game): The game to advance.
+            number_of_turns (int): Maximum number of turns to play.
+            publish_timeout (float): Seconds to wait for a full observer queue before
+                dropping that observer.
+        """
+        self.session_id = session_id
+        self.game = game
+        self.number_of_turns = number_of_turns
+        self.current_turn = 0
+        self.winner: ChessPiece | None = None
+        self._publish_timeout = publish_timeout
+        self._turns: Iterator[tuple[int, ChessPiece | None]] = game.turns(
+            number_of_turns,
+        )
+        self._observers: set[asyncio.Queue[Message]] = set()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the game has a winner and no more turns can be played."""
+        return self.winner is not None
+
+    def state(self) -> Message:
+        """Describe the session as a protocol message.
+
+        Returns:
+            Message: Session id, turn, piece positions and the winner, if any.
+        """
+        return {
+            "session": self.session_id,
+            "turn": self.current_turn,
+            "rook": str(self.game.rook.coordinate),
+            "bishop": str(self.game.bishop.coordinate),
+            "winner": str(self.winner) if self.winner else None,
+            "finished": self.finished,
+        }
+
+    def subscribe(self, queue: asyncio.Queue[Message]) -> None:
+        """Register an observer queue that receives every turn event.
+
+        Args:
+            queue (asyncio.Queue[Message]): Bounded queue owned by the observer.
+        """
+        self._observers.add(queue)
+
+    def unsubscribe(self, queue: asyncio.Queue[Message]) -> None:
+        """Stop delivering events to an observer queue.
+
+        Args:
+            queue (asyncio.Queue[Message]): A previously subscribed queue.
+        """
+        self._observers.discard(queue)
+
+    async def step(self) -> Message:
+        """Play the next turn and publish it to every observer.
+
+        Returns:
+            Message: The session state after the turn.
+
+        Raises:
+            SessionError: If the session is already finished.
+        """
+        if self.finished:
+            raise SessionError(f"session {self.session_id} is finished")
+
+        self.current_turn, maybe_winner = next(self._turns)
+        if maybe_winner:
+            self.winner = maybe_winner
+        elif self.current_turn >= self.number_of_turns:
+            self.winner = self.game.rook
+
+        event = {"event": "turn", **self.state()}
+        await self._publish(event)
+        return event
+
+    async def _publish(self, event: Message) -> None:
+        """Deliver an event to all observers, applying backpressure when they lag.
+
+        A full observer queue suspends the step until the observer catches up; an
+        observer that stays full for longer than the publish timeout is dropped.
+
+        Args:
+            event (Message): The event to deliver.
+        """
+        for queue in list(self._observers):
+            if queue.full():
+                await self._publish_when_ready(queue, event)
+            else:
+                queue.put_nowait(event)
+
+    async def _publish_when_ready(
+        self,
+        queue: asyncio.Queue[Message],
+        event: Message,
+    ) -> None:
+        """Wait for room in a full observer queue, dropping the observer on timeout.
+
+        Args:
+            queue (asyncio.Queue[Message]): The full observer queue.
+            event (Message): The event to deliver.
+        """
+        try:
+            await asyncio.wait_for(queue.put(event), self._publish_timeout)
+        except TimeoutError:
+            self.unsubscribe(queue)
+
+
+class GameServer:
+    """Asyncio TCP server speaking a line-delimited JSON protocol.
+
+    Every request is a JSON object on its own line with an ``op`` field and an
+    optional ``id`` that is echoed back in the response:
+
+    - ``create``: start a session from ``rook``, ``bishop``, ``turns`` and ``board_size``
+    - ``step``: play one turn of ``session``
+    - ``watch`` / ``unwatch``: stream (or stop streaming) turn events of ``session``
+    - ``close``: discard ``session``
+
+    Sessions created over a connection are discarded when it disconnects. A
+    request line longer than `LINE_LIMIT` gets an error response and ends the
+    connection.
+
+    Attributes:
+        sessions (dict[int, GameSession]): Live sessions by id.
+        logger (Logger): Logger for connection-level messages.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        session_logger: Logger | None = None,
+        queue_size: int = 256,
+        publish_timeout: float = 5.0,
+    ) -> None:
+        """Initialize an empty server.
+
+        Args:
+            logger (Logger): Logger for connection-level messages.
+            session_logger (Logger | None, optional): Logger handed to every hosted
+                game. Defaults to the ``chess.server.session`` logger.
+            queue_size (int, optional): Bound of each connection's outgoing queue.
+                Defaults to 256.
+            publish_timeout (float, optional): Seconds a session waits on a full
+                observer queue before dropping it. Defaults to 5.0.
+        """
+        self.sessions: dict[int, GameSession] = {}
+        self.logger = logger
+        self._session_logger = session_logger or getLogger(f"{__name__}.session")
+        self._queue_size = queue_size
+        self._publish_timeout = publish_timeout
+        self._ids = itertools.count(1)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Start listening for connections.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to localhost.
+            port (int, optional): Port to bind, 0 picks a free one. Defaults to 0.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        return await asyncio.start_server(
+            self._handle_connection,
+            host,
+            port,
+            limit=LINE_LIMIT,
+        )
+
+    def create_session(
+        self,
+        rook: str,
+        bishop: str,
+        number_of_turns: int = 15,
+        board_size: int = 8,
+    ) -> GameSession:
+        """Create and register a new session.
+
+        Args:
+            rook (str): Starting square of the white rook.
+            bishop (str): Starting square of the black bishop.
+            number_of_turns (int, optional): Maximum number of turns. Defaults to 15.
+            board_size (int, optional): Size of the board. Defaults to 8.
+
+        Returns:
+            GameSession: The new session.
+
+        Raises:
+            SessionError: If the squares or the turn limit are invalid.
+        """
+        if number_of_turns < 1:
+            raise SessionError("turns must be at least 1")
+        try:
+            game = Game(
+                rook=Rook(parse_square(rook, board_size), PieceColor.WHITE),
+                bishop=Bishop(parse_square(bishop, board_size), PieceColor.BLACK),
+                logger=self._session_logger,
+                board_size=board_size,
+            )
+        except ValueError as error:
+            raise SessionError(str(error)) from error
+
+        session = GameSession(
+            next(self._ids),
+            game,
+            number_of_turns,
+            self._publish_timeout,
+        )
+        self.sessions[session.session_id] = session
+        return session
+
+    def _get_session(self, request: Message) -> GameSession:
+        """Look up the session addressed by a request.
+
+        Raises:
+            SessionError: If the request names no live session.
+        """
+        session = self.sessions.get(request.get("session", -1))
+        if session is None:
+            raise SessionError(f"unknown session: {request.get('session')!r}")
+        return session
+
+    async def _dispatch(
+        self,
+        request: Message,
+        outgoing: asyncio.Queue[Message],
+        watched: set[GameSession],
+        owned: set[int],
+    ) -> Message:
+        """Apply a single request and build its response payload.
+
+        Raises:
+            SessionError: If the request is invalid.
+        """
+        op = request.get("op")
+        if op == "create":
+            session = self.create_session(
+                rook=str(request.get("rook", "H1")),
+                bishop=str(request.get("bishop", "C3")),
+                number_of_turns=integer_field(request, "turns", 15),
+                board_size=integer_field(request, "board_size", 8),
+            )
+            owned.add(session.session_id)
+            return {"state": session.state()}
+        if op == "step":
+            return {"state": await self._get_session(request).step()}
+        if op == "watch":
+            session = self._get_session(request)
+            session.subscribe(outgoing)
+            watched.add(session)
+            return {"state": session.state()}
+        if op == "unwatch":
+            session = self._get_session(request)
+            session.unsubscribe(outgoing)
+            watched.discard(session)
+            return {}
+        if op == "close":
+            session = self._get_session(request)
+            del self.sessions[session.session_id]
+            owned.discard(session.session_id)
+            return {}
+        raise SessionError(f"unknown op: {op!r}")
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve one client until it disconnects."""
+        outgoing: asyncio.Queue[Message] = asyncio.Queue(maxsize=self._queue_size)
+        watched: set[GameSession] = set()
+        owned: set[int] = set()
+        writer_task = asyncio.create_task(self._write_messages(outgoing, writer))
+        try:
+            while line := await reader.readline():
+                response = await self._respond(line, outgoing, watched, owned)
+                await outgoing.put(response)
+        except ValueError:
+            # readline raises ValueError once a line outgrows the stream limit.
+            await outgoing.put(
+                {
+                    "id": None,
+                    "ok": False,
+                    "error": f"request line longer than {LINE_LIMIT} bytes",
+                },
+            )
+        except ConnectionError:
+            self.logger.debug("Client disconnected")
+        finally:
+            for session in watched:
+                session.unsubscribe(outgoing)
+            for session_id in owned:
+                self.sessions.pop(session_id, None)
+            await outgoing.join()
+            writer_task.cancel()
+            writer.close()
+
+    async def _respond(
+        self,
+        line: bytes,
+        outgoing: asyncio.Queue[Message],
+        watched: set[GameSession],
+        owned: set[int],
+    ) -> Message:
+        """Decode a request line and turn it into a response message."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise SessionError("request must be a JSON object")
+            request_id = request.get("id")
+            payload = await self._dispatch(request, outgoing, watched, owned)
+        except (SessionError, TypeError, ValueError) as error:
+            return {"id": request_id, "ok": False, "error": str(error)}
+        return {"id": request_id, "ok": True, **payload}
+
+    async def _write_messages(
+        self,
+        outgoing: asyncio.Queue[Message],
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Drain a connection's outgoing queue onto the socket.
+
+        Waiting on ``drain`` lets a slow client fill its bounded queue, which in turn
+        suspends the sessions publishing to it.
+        """
+        while True:
+            message = await outgoing.get()
+            try:
+                writer.write(json.dumps(message).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                self.logger.debug("Dropping message for disconnected client")
+            finally:
+                outgoing.task_done()
+
+
+async def serve(host: str, port: int, logger: Logger) -> None:
+    """Run a game server until cancelled.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind.
+        logger (Logger): Logger for server messages.
+    """
+    server = await GameServer(logger=logger).start(host, port)
+    for socket in server.sockets:
+        logger.info(f"Serving games on {socket.getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point for ``python -m chess.server``.
+
+    Args:
+        argv (list[str] | None, optional): Arguments to parse. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Serve special chess game sessions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="log every turn of every session",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(name)s [%(levelname)s] %(message)s",
+    )
+    if not args.verbose:
+        getLogger(f"{__name__}.session").setLevel(logging.WARNING)
+    asyncio.run(serve(args.host, args.port, getLogger("ChessServer")))
+
+
+if __name__ == "__main__":
+    main()
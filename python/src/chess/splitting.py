@@ -0,0 +1,387 @@
+import math
+import random
+from functools import lru_cache
+from statistics import NormalDist
+from typing import NamedTuple
+
+import numpy as np
+
+from chess.move import dice_sum_distribution, roll_dice, toss_coin
+
+
+class SplittingEstimate(NamedTuple):
+    """Bishop-win probability estimated by splitting.
+
+    Attributes:
+        probability (float): Unbiased estimate of the probability that the bishop
+            wins within the turn limit.
+        standard_error (float): Standard error of the estimate.
+        low (float): Lower end of the confidence interval, at least 0.
+        high (float): Upper end of the confidence interval.
+        roots (int): Independent games started.
+        hits (int): Trajectories, clones included, that ended in a bishop win.
+        turns_simulated (int): Turns played over all trajectories.
+        naive_turns (float): Turns plain Monte Carlo would need for the same
+            standard error, or NaN if no bishop win was seen.
+    """
+
+    probability: float
+    standard_error: float
+    low: float
+    high: float
+    roots: int
+    hits: int
+    turns_simulated: int
+    naive_turns: float
+
+    @property
+    def speedup(self) -> float:
+        """How many times fewer turns splitting needed than plain sampling."""
+        return self.naive_turns / max(self.turns_simulated, 1)
+
+
+class _Trajectory(NamedTuple):
+    """A game in progress waiting on the stack: its state and weight."""
+
+    file_index: int
+    rank_index: int
+    turn: int
+    weight: float
+
+
+@lru_cache(maxsize=16)
+def _line_hits(
+    board_size: int,
+    number_of_turns: int,
+) -> tuple[tuple[list[float], ...], tuple[list[float], ...]]:
+    """Chances that the rook lands on a wrapped diagonal line within some turns.
+
+    Seen along a diagonal line wrapped around the board, a rook move changes the
+    rook's gap to the line by the dice total. On a line where file minus rank is
+    constant both directions close the gap; on one where file plus rank is
+    constant, moving right closes it and moving up widens it, each half the time.
+
+    Args:
+        board_size (int): Size of the board, which is the length of the lines.
+        number_of_turns (int): Most turns left.
+
+    Returns:
+        tuple[tuple[list[float], ...], tuple[list[float], ...]]: For lines
+        approached by both moves and for lines crossed both ways, the chance of
+        landing on the line indexed by turns left and then by the gap.
+    """
+    dice = dice_sum_distribution()
+    one_way = [np.zeros(board_size)]
+    both_ways = [np.zeros(board_size)]
+    for _ in range(number_of_turns):
+        closer, crossing = one_way[-1].copy(), both_ways[-1].copy()
+        closer[0] = crossing[0] = 1.0
+        next_closer, next_crossing = np.zeros(board_size), np.zeros(board_size)
+        for spaces, probability in dice.items():
+            next_closer += probability * np.roll(closer, spaces)
+            next_crossing += (
+                probability
+                / 2
+                * (np.roll(crossing, spaces) + np.roll(crossing, -spaces))
+            )
+        one_way.append(next_closer)
+        both_ways.append(next_crossing)
+    return (
+        tuple(hits.tolist() for hits in one_way),
+        tuple(hits.tolist() for hits in both_ways),
+    )
+
+
+class BishopWinSplitter:
+    """Splitting estimator for rare bishop wins against a moving rook.
+
+    Each game carries a weight, and its importance is how likely a bishop win
+    still looks from where the rook stands with the turns it has left: the chance
+    of landing on either of the bishop's diagonals, each followed as a line
+    wrapped around the board and weighted by the share of it on the board. After
+    every move the weight times the importance is compared with the importance
+    of the start. Once it is `splits` times larger, the game is cloned into that
+    many copies, which continue with independent dice and share its weight; once
+    it is `splits` times smaller, the game plays Russian roulette, surviving with
+    probability equal to the ratio and its weight divided by it. Both keep the
+    expected weight, so the weighted number of bishop wins of each started game is
+    an unbiased estimate of the probability, and the started games are
+    independent of each other.
+
+    Games on which time runs out lose importance rather than gain it, so effort
+    follows the rare games that can still win. A game from which no diagonal can
+    be reached in time has no importance and is dropped, and no more than
+    `max_population` games are started per root, bounding the cost of each root
+    at `max_population` times the turn limit.
+
+    Like `RookBishopChain`, the estimator works on square indexes rather than
+    `Coordinate` objects, so board sizes are not limited by the file letters. The
+    turn rules are those of `Game._resolve_turn`.
+
+    Attributes:
+        board_size (int): Size of the board.
+        bishop (tuple[int, int]): Bishop position as (file_index, rank_index).
+        splits (int): Factor by which a game's weighted importance must rise
+            before it is split, or fall before it plays roulette; 1 plays plain
+            games.
+        max_population (int): Most games started per root, the root included.
+    """
+
+    def __init__(
+        self,
+        board_size: int,
+        bishop: tuple[int, int],
+        splits: int = 2,
+        max_population: int = 64,
+    ) -> None:
+        """Initialize the estimator for a bishop standing on a square.
+
+        Args:
+            board_size (int): Size of the board.
+            bishop (tuple[int, int]): Bishop position as (file_index, rank_index).
+            splits (int, optional): Factor of the weight window. Defaults to 2.
+            max_population (int, optional): Most games started per root.
+                Defaults to 64.
+
+        Raises:
+            ValueError: If the bishop is off the board or a parameter is invalid.
+        """
+        file_index, rank_index = bishop
+        if not (0 <= file_index < board_size and 0 <= rank_index < board_size):
+            raise ValueError(f"bishop: {bishop} is not on a {board_size} board")
+        if splits < 1:
+            raise ValueError(f"splits: {splits} must be positive")
+        if max_population < 1:
+            raise ValueError(f"max_population: {max_population} must be positive")
+        self.board_size = board_size
+        self.bishop = bishop
+        self.splits = splits
+        self.max_population = max_population
+        self._closing = file_index - rank_index
+        self._crossing = file_index + rank_index
+        self._closing_share = (board_size - abs(self._closing)) / board_size
+        self._crossing_share = (
+            board_size - abs(self._crossing - board_size + 1)
+        ) / board_size
+
+    def importance(self, file_index: int, rank_index: int, turns_left: int) -> float:
+        """How likely a bishop win looks for a rook on a square.
+
+        The chance of landing on each diagonal, followed as a wrapped line, is
+        exact for the rook's moves and scaled by the share of the line on the
+        board; the two are combined as if independent. Rook wins are ignored.
+        The result is 0 exactly when no diagonal can be reached in time.
+
+        Args:
+            file_index (int): Rook file index.
+            rank_index (int): Rook rank index.
+            turns_left (int): Turns the rook still has.
+
+        Returns:
+            float: The importance, between 0 and 1.
+        """
+        one_way, both_ways = _line_hits(self.board_size, turns_left)
+        return self._importance(
+            one_way[turns_left],
+            both_ways[turns_left],
+            file_index,
+            rank_index,
+        )
+
+    def _importance(
+        self,
+        one_way: list[float],
+        both_ways: list[float],
+        file_index: int,
+        rank_index: int,
+    ) -> float:
+        """Importance of a square from the line hits for the turns left."""
+        size = self.board_size
+        closing = (
+            self._closing_share
+            * one_way[(self._closing - file_index + rank_index) % size]
+        )
+        crossing = (
+            self._crossing_share
+            * both_ways[(self._crossing - file_index - rank_index) % size]
+        )
+        return closing + crossing - closing * crossing
+
+    def _bishop_wins(self, file_index: int, rank_index: int) -> bool:
+        """Whether the bishop can capture a rook on a square."""
+        bishop_file, bishop_rank = self.bishop
+        return abs(file_index - bishop_file) == abs(rank_index - bishop_rank)
+
+    def _rook_wins(self, file_index: int, rank_index: int) -> bool:
+        """Whether a rook on a square can capture the bishop."""
+        bishop_file, bishop_rank = self.bishop
+        return file_index == bishop_file or rank_index == bishop_rank
+
+    def _window(
+        self,
+        weight: float,
+        ratio: float,
+        room: int,
+        rng: random.Random,
+    ) -> tuple[float, int]:
+        """Split a game or play roulette once its weighted importance leaves the window.
+
+        Returns:
+            tuple[float, int]: The weight of the game and of each of its copies,
+            and how many copies continue: more than one after a split, none after
+            losing at roulette, in which case the weight is 0.
+        """
+        if ratio >= self.splits and room > 0:
+            copies = min(int(ratio), room + 1)
+            return weight / copies, copies
+        if ratio * self.splits < 1:
+            if rng.random() < ratio:
+                return weight / ratio, 1
+            return 0.0, 0
+        return weight, 1
+
+    def _play_root(
+        self,
+        rook: tuple[int, int],
+        number_of_turns: int,
+        rng: random.Random,
+    ) -> tuple[float, int, int, int]:
+        """Play one started game and all of its clones, depth first.
+
+        Returns:
+            tuple[float, int, int, int]: Weighted bishop wins, bishop-win
+            trajectories, turns played, and turns of the original game. The
+            original keeps going past every split, and with no weight once it
+            loses at roulette, so it is distributed like a plain game.
+        """
+        one_way, both_ways = _line_hits(self.board_size, number_of_turns)
+        start = self._importance(
+            one_way[number_of_turns],
+            both_ways[number_of_turns],
+            *rook,
+        )
+        scale = 1 / start if start else 0.0
+        splitting = self.splits > 1
+        stack = [_Trajectory(rook[0], rook[1], 0, 1.0)]
+        started = 1
+        weighted, hits, turns = 0.0, 0, 0
+        original_turns = 0
+        size = self.board_size
+        while stack:
+            file_index, rank_index, turn, weight = stack.pop()
+            original = turns == 0
+            won = False
+            while turn < number_of_turns:
+                turn += 1
+                turns += 1
+                if self._rook_wins(file_index, rank_index):
+                    break
+                step_file, step_rank = toss_coin(rng).vector
+                spaces = roll_dice(rng) + roll_dice(rng)
+                file_index = (file_index + step_file * spaces) % size
+                rank_index = (rank_index - step_rank * spaces) % size
+                if self._bishop_wins(file_index, rank_index):
+                    won = True
+                    break
+                if not (splitting and weight):
+                    continue
+                turns_left = number_of_turns - turn
+                ratio = (
+                    weight
+                    * scale
+                    * self._importance(
+                        one_way[turns_left],
+                        both_ways[turns_left],
+                        file_index,
+                        rank_index,
+                    )
+                )
+                weight, copies = self._window(
+                    weight,
+                    ratio,
+                    self.max_population - started,
+                    rng,
+                )
+                if copies > 1:
+                    started += copies - 1
+                    clone = _Trajectory(file_index, rank_index, turn, weight)
+                    stack.extend([clone] * (copies - 1))
+                elif not (copies or original):
+                    break
+            if won and weight:
+                weighted += weight
+                hits += 1
+            if original:
+                original_turns = turn
+        return weighted, hits, turns, original_turns
+
+    def estimate(
+        self,
+        rook: tuple[int, int],
+        number_of_turns: int,
+        roots: int = 10_000,
+        seed: int | None = None,
+        confidence: float = 0.95,
+    ) -> SplittingEstimate:
+        """Estimate the probability that the bishop wins within a turn limit.
+
+        The confidence interval is the normal interval over the independent
+        started games. The compute saved is measured in turns: plain sampling
+        needs p (1 - p) / se^2 games for standard error se, each as long as the
+        unsplit original games, which are plain games themselves.
+
+        Args:
+            rook (tuple[int, int]): Rook start as (file_index, rank_index).
+            number_of_turns (int): Maximum number of turns, as in `Game.play_game`.
+            roots (int, optional): Independent games to start. Defaults to 10_000.
+            seed (int | None, optional): Seed of the dice. Defaults to None.
+            confidence (float, optional): Confidence level. Defaults to 0.95.
+
+        Returns:
+            SplittingEstimate: The estimate and its cost.
+
+        Raises:
+            ValueError: If the rook is off the board or there are too few roots.
+        """
+        file_index, rank_index = rook
+        if not (
+            0 <= file_index < self.board_size and 0 <= rank_index < self.board_size
+        ):
+            raise ValueError(f"rook: {rook} is not on a {self.board_size} board")
+        if roots < 2:
+            raise ValueError(f"roots: {roots} must be at least 2")
+
+        rng = random.Random(seed)
+        total = total_squares = 0.0
+        hits = turns = original_turns = 0
+        for _ in range(roots):
+            weighted, root_hits, root_turns, root_original = self._play_root(
+                rook,
+                number_of_turns,
+                rng,
+            )
+            total += weighted
+            total_squares += weighted * weighted
+            hits += root_hits
+            turns += root_turns
+            original_turns += root_original
+
+        probability = total / roots
+        variance = max(0.0, (total_squares - roots * probability**2) / (roots - 1))
+        standard_error = math.sqrt(variance / roots)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        if standard_error > 0:
+            naive_games = probability * (1 - probability) / standard_error**2
+            naive_turns = naive_games * original_turns / roots
+        else:
+            naive_turns = math.nan
+        return SplittingEstimate(
+            probability=probability,
+            standard_error=standard_error,
+            low=max(0.0, probability - z * standard_error),
+            high=probability + z * standard_error,
+            roots=roots,
+            hits=hits,
+            turns_simulated=turns,
+            naive_turns=naive_turns,
+        )
@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+TABLE_CACHE_ENV = "CHESS_TABLE_CACHE"
+"""Environment variable overriding the directory tables are cached in."""
+
+TABLE_FORMAT_VERSION = 1
+"""Bumped whenever the layout of a cached table changes, invalidating old files."""
+
+Arrays = Mapping[str, npt.NDArray[np.generic]]
+
+
+def table_directory() -> Path:
+    """Directory precomputed tables are cached in.
+
+    Returns:
+        Path: `$CHESS_TABLE_CACHE` if set, otherwise a folder under the user's cache
+        directory.
+    """
+    configured = os.environ.get(TABLE_CACHE_ENV)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "special-chess-game"
+
+
+def _load(directory: Path, names: list[str]) -> dict[str, npt.NDArray[np.generic]]:
+    """Memory-map every array of a cached table."""
+    return {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in names}
+
+
+def cached_arrays(key: str, build: Callable[[], Arrays]) -> Arrays:
+    """Load a table from the cache, building and saving it on a miss.
+
+    Each array is stored as its own `.npy` file in a directory named after the key
+    and returned memory-mapped read-only, so a warm start costs a few page faults
+    instead of a rebuild, and processes sharing a table share its pages. A table
+    is written to a temporary directory and renamed into place, so concurrent
+    builders never see a partial table. If the cache cannot be written, the freshly
+    built arrays are returned as they are.
+
+    Args:
+        key (str): Name identifying the table and its parameters.
+        build (Callable[[], Arrays]): Computes the arrays on a cache miss.
+
+    Returns:
+        Arrays: The table's arrays by name.
+    """
+    root = table_directory()
+    directory = root / f"v{TABLE_FORMAT_VERSION}" / key
+    index = directory / "arrays.txt"
+    if index.exists():
+        try:
+            return _load(directory, index.read_text().split())
+        except (OSError, ValueError):
+            pass
+
+    arrays = build()
+    try:
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=directory.parent, prefix=f".{key}."))
+    except OSError:
+        return arrays
+    try:
+        for name, array in arrays.items():
+            np.save(staging / f"{name}.npy", np.ascontiguousarray(array))
+        (staging / "arrays.txt").write_text("\n".join(arrays))
+        if directory.exists():
+            shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not index.exists():
+            return arrays
+    return _load(directory, list(arrays))
@@ -0,0 +1,322 @@
+import gzip
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable
+from enum import Enum
+from typing import BinaryIO, cast
+
+
+class QueuePolicy(Enum):
+    """What a transcript handler does when its queue is full."""
+
+    BLOCK = "block"
+    DROP = "drop"
+
+
+class Compression(Enum):
+    """Compression applied to transcript files."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+_STOP = object()
+_LIVENESS_POLL = 0.1
+
+
+def _compressor(compression: Compression) -> Callable[[BinaryIO], BinaryIO]:
+    """Find how to wrap a raw file in a writer applying some compression.
+
+    The writers leave the raw file open when they are closed.
+
+    Args:
+        compression (Compression): Compression to apply.
+
+    Returns:
+        Callable[[BinaryIO], BinaryIO]: Wraps a raw file; the identity without
+        compression.
+
+    Raises:
+        ValueError: If zstd is requested but no zstd implementation is installed.
+    """
+    if compression is Compression.NONE:
+        return lambda raw: raw
+    if compression is Compression.GZIP:
+        return lambda raw: cast(
+            BinaryIO,
+            gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6),
+        )
+    try:
+        from compression import zstd
+    except ImportError:
+        pass
+    else:
+        return lambda raw: cast(BinaryIO, zstd.ZstdFile(raw, mode="w"))
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ValueError(
+            "zstd compression needs Python 3.14 or the zstandard package",
+        ) from error
+    return lambda raw: cast(
+        BinaryIO,
+        zstandard.ZstdCompressor().stream_writer(raw, closefd=False),
+    )
+
+
+class TranscriptHandler(logging.Handler):
+    """Logging handler that writes records from a background thread.
+
+    `emit` formats the record and puts the line on a bounded queue, so the thread
+    that logs never waits on the disk. A writer thread drains the queue and writes
+    each batch of lines as a single buffered write, optionally compressed, rotating
+    the file once it reaches `max_bytes` on disk. When the queue is full, the
+    policy decides whether the logging thread waits for room or the record is
+    dropped and counted. Errors in the writer are reported through `handleError`
+    and the lines of a failed write are counted, but the writer keeps draining;
+    once it has stopped, records are dropped even under `BLOCK`.
+
+    Attributes:
+        path (str): Transcript file; rotated files get a `.1`, `.2`, ... suffix.
+        policy (QueuePolicy): Behavior when the queue is full.
+        compression (Compression): Compression of the transcript files.
+        max_bytes (int): On-disk size that triggers a rotation, 0 for never.
+        backup_count (int): Rotated files kept.
+        batch_size (int): Most lines joined into one write.
+        flush_interval (float): Idle seconds after which buffered bytes are flushed.
+        dropped (int): Records dropped because the queue was full or the writer
+            had stopped.
+        failed (int): Lines lost because their write failed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        queue_size: int = 65_536,
+        policy: QueuePolicy = QueuePolicy.BLOCK,
+        compression: Compression = Compression.NONE,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        batch_size: int = 4096,
+        buffer_size: int = 1 << 20,
+        flush_interval: float = 1.0,
+        level: int = logging.NOTSET,
+    ) -> None:
+        """Open the transcript and start the writer thread.
+
+        Args:
+            path (str): Transcript file, appended to if it exists.
+            queue_size (int, optional): Records the queue holds. Defaults to 65_536.
+            policy (QueuePolicy, optional): Behavior when the queue is full.
+                Defaults to blocking.
+            compression (Compression, optional): Compression of the files.
+                Defaults to none.
+            max_bytes (int, optional): On-disk size that triggers a rotation.
+                Defaults to 0, which never rotates.
+            backup_count (int, optional): Rotated files kept. Defaults to 5.
+            batch_size (int, optional): Most records per write. Defaults to 4096.
+            buffer_size (int, optional): Bytes buffered before the file is written.
+                Defaults to 1 MiB.
+            flush_interval (float, optional): Idle seconds before a flush.
+                Defaults to 1.0.
+            level (int, optional): Handler level. Defaults to logging.NOTSET.
+
+        Raises:
+            ValueError: If the queue size or flush interval is not positive, or
+                zstd is unavailable.
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size: {queue_size} must be positive")
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval: {flush_interval} must be positive")
+        self._compress = _compressor(compression)
+        super().__init__(level)
+        self.path = os.path.abspath(path)
+        self.policy = policy
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.failed = 0
+        self._buffer_size = buffer_size
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        self._raw, self._stream = self._open()
+        self._writer = threading.Thread(
+            target=self._run,
+            name=f"transcript-writer-{os.path.basename(path)}",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _open(self) -> tuple[BinaryIO, BinaryIO]:
+        """Open the transcript file and its compressing writer."""
+        raw: BinaryIO = open(self.path, "ab", buffering=self._buffer_size)
+        return raw, self._compress(raw)
+
+    def _close_stream(self) -> None:
+        """Finish the compressed stream, if any, and close the file."""
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+
+    def _rotate(self) -> None:
+        """Move the current file to `.1`, shifting older backups up by one.
+
+        The transcript is reopened even if moving it fails, so later lines are
+        appended to the current file rather than lost.
+        """
+        self._close_stream()
+        try:
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = f"{self.path}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+        finally:
+            self._raw, self._stream = self._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and queue the line for the writer thread.
+
+        Formatting here rather than in the writer keeps each call's cost steady:
+        a writer formatting whole batches would hold the GIL for milliseconds at
+        a time, which is exactly the stall the sink exists to avoid. It also fixes
+        the line before the record's arguments can change.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        try:
+            line = self.format(record)
+            if self.policy is QueuePolicy.BLOCK:
+                queued = self._put(line)
+            else:
+                queued = self._offer(line)
+            if not queued:
+                self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _put(self, item: object) -> bool:
+        """Put an item on the queue, waiting for room while the writer runs."""
+        if self._offer(item):
+            return True
+        while self._writer.is_alive():
+            try:
+                self._queue.put(item, timeout=_LIVENESS_POLL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _offer(self, item: object) -> bool:
+        """Put an item on the queue if there is room, without waiting."""
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            return False
+        return True
+
+    def _next(self, timeout: float | None) -> object | None:
+        """Take the next item off the queue, or None if none arrives in time."""
+        try:
+            return (
+                self._queue.get_nowait()
+                if timeout is None
+                else self._queue.get(timeout=timeout)
+            )
+        except queue.Empty:
+            return None
+
+    def _report_error(self) -> None:
+        """Report the exception being handled in the writer through `handleError`."""
+        self.handleError(
+            logging.makeLogRecord(
+                {"msg": "transcript writer failed on %s", "args": (self.path,)},
+            ),
+        )
+
+    def _run(self) -> None:
+        """Drain the queue in batches until the handler is closed."""
+        stopping = False
+        while not stopping:
+            item = self._next(self.flush_interval)
+            if item is None:
+                try:
+                    self._stream.flush()
+                except Exception:
+                    self._report_error()
+                continue
+            batch, waiters, stopping = self._collect(item)
+            try:
+                if batch:
+                    self._write_batch(batch)
+                if waiters:
+                    self._stream.flush()
+            except Exception:
+                self.failed += len(batch)
+                self._report_error()
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+        try:
+            self._close_stream()
+        except Exception:
+            self._report_error()
+
+    def _collect(self, item: object) -> tuple[list[str], list[threading.Event], bool]:
+        """Take a batch of lines off the queue, starting from an item taken already.
+
+        Returns:
+            tuple[list[str], list[threading.Event], bool]: The lines, the flush
+            requests among them, and whether the handler is being closed.
+        """
+        batch: list[str] = []
+        waiters: list[threading.Event] = []
+        while item is not None:
+            if item is _STOP:
+                return batch, waiters, True
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                batch.append(cast(str, item))
+            if len(batch) >= self.batch_size:
+                break
+            item = self._next(None)
+        return batch, waiters, False
+
+    def _write_batch(self, batch: list[str]) -> None:
+        """Write a batch of formatted lines in one call."""
+        self._stream.write(("\n".join(batch) + "\n").encode())
+        if self.max_bytes and self._raw.tell() >= self.max_bytes:
+            self._rotate()
+
+    def flush(self, timeout: float | None = 10.0) -> None:
+        """Wait until every record queued so far has been written out.
+
+        Args:
+            timeout (float | None, optional): Most seconds to wait. Defaults to 10.
+        """
+        if not self._writer.is_alive():
+            return
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def close(self) -> None:
+        """Write out every queued record, stop the writer and close the file."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        super().close()
@@ -0,0 +1,160 @@
+import random
+from collections.abc import Callable
+from functools import lru_cache
+from typing import NamedTuple
+
+from chess.rules import BISHOP_SPEC, ORTHOGONAL, ROOK_SPEC, Vector, compile_spec
+
+PlayFunction = Callable[[int, int, random.Random], tuple[bool, int]]
+"""Plays a game from the rook's and bishop's square ids with a generator, and
+returns whether the rook won and the turn count."""
+
+
+class Variant(NamedTuple):
+    """Rules of a game variant; the defaults are the rules of `Game`.
+
+    Attributes:
+        board_size (int): Size of the board.
+        dice (int): Dice rolled for the rook's move.
+        sides (int): Sides on each die.
+        directions (tuple[Vector, ...]): Orthogonal directions the rook picks
+            from uniformly, in draw order, as (files to the right, ranks up).
+        rook_captures_first (bool): Whether the rook tries to capture before it
+            moves and the bishop after, or the other way round.
+        number_of_turns (int): Maximum number of turns.
+    """
+
+    board_size: int = 8
+    dice: int = 2
+    sides: int = 6
+    directions: tuple[Vector, ...] = ((0, 1), (1, 0))
+    rook_captures_first: bool = True
+    number_of_turns: int = 15
+
+    def validate(self) -> None:
+        """Check that the variant can be played.
+
+        Raises:
+            ValueError: If a field is out of range or a direction is not orthogonal.
+        """
+        if self.board_size < 1:
+            raise ValueError(f"board_size: {self.board_size} must be positive")
+        if self.dice < 1 or self.sides < 1:
+            raise ValueError(f"cannot roll {self.dice} dice with {self.sides} sides")
+        if not self.directions or not set(self.directions) <= set(ORTHOGONAL):
+            raise ValueError(f"directions: {self.directions} must be orthogonal")
+        if self.number_of_turns < 0:
+            raise ValueError(
+                f"number_of_turns: {self.number_of_turns} must not be negative",
+            )
+
+
+def _captures(variant: Variant, by_rook: bool, rook: int, bishop: int) -> bool:
+    """Whether one of the pieces can capture the other where they stand."""
+    if by_rook:
+        return compile_spec(ROOK_SPEC, variant.board_size).can_attack(rook, bishop)
+    return compile_spec(BISHOP_SPEC, variant.board_size).can_attack(bishop, rook)
+
+
+def play_variant(
+    variant: Variant,
+    rook: int,
+    bishop: int,
+    rng: random.Random,
+) -> tuple[bool, int]:
+    """Play a game of any variant, interpreting its rules turn by turn.
+
+    This is the generic path the kernels of `build_kernel` are specialized from
+    and checked against: every turn reads the variant's fields and looks the
+    tables up again.
+
+    Args:
+        variant (Variant): Rules of the game.
+        rook (int): Square id the rook starts on.
+        bishop (int): Square id of the bishop.
+        rng (random.Random): Generator for the direction and the dice.
+
+    Returns:
+        tuple[bool, int]: Whether the rook won, and the turn count; on a timeout
+        the rook wins with one more turn than the limit, as in `Game.play_game`.
+    """
+    variant.validate()
+    for turn in range(1, variant.number_of_turns + 1):
+        first = variant.rook_captures_first
+        if _captures(variant, first, rook, bishop):
+            return first, turn
+        direction = rng.choice(variant.directions)
+        spaces = sum(rng.randint(1, variant.sides) for _ in range(variant.dice))
+        rook = compile_spec(ROOK_SPEC, variant.board_size).step(
+            rook,
+            direction,
+            spaces,
+        )
+        if _captures(variant, not first, rook, bishop):
+            return not first, turn
+    return True, variant.number_of_turns + 1
+
+
+@lru_cache(maxsize=64)
+def build_kernel(variant: Variant) -> PlayFunction:
+    """Build a game function specialized to a variant, once per variant.
+
+    Everything that does not change between turns is resolved here: the rook's
+    destination for every direction, dice total and square is tabulated, the
+    capture tables are compiled, and the order of the capture checks is fixed by
+    binding which piece's table is consulted first. Both capture relations are
+    symmetric, so the bishop's square indexes either table. The returned function
+    only looks up the two capture masks of that square before its loop, which
+    then draws the direction and dice, indexes the move table and tests two bits
+    per turn.
+
+    Draws are made in the same order as `Game` makes them, so with the default
+    variant a kernel replays `Game.play_game` exactly for the same generator.
+
+    Args:
+        variant (Variant): Rules to specialize for.
+
+    Returns:
+        PlayFunction: The specialized game function, shared by every caller.
+
+    Raises:
+        ValueError: If the variant cannot be played.
+    """
+    variant.validate()
+    squares = range(variant.board_size * variant.board_size)
+    rook_table = compile_spec(ROOK_SPEC, variant.board_size)
+    bishop_table = compile_spec(BISHOP_SPEC, variant.board_size)
+    moves = tuple(
+        tuple(
+            tuple(rook_table.step(square, direction, total) for square in squares)
+            for total in range(variant.dice * variant.sides + 1)
+        )
+        for direction in variant.directions
+    )
+    rook_attacks, bishop_attacks = rook_table.attacks, bishop_table.attacks
+    first = variant.rook_captures_first
+    second = not first
+    rolls = range(variant.dice)
+    sides = variant.sides
+    turns = range(1, variant.number_of_turns + 1)
+    timeout = variant.number_of_turns + 1
+    first_table, second_table = (
+        (rook_attacks, bishop_attacks) if first else (bishop_attacks, rook_attacks)
+    )
+
+    def play(rook: int, bishop: int, rng: random.Random) -> tuple[bool, int]:
+        first_mask, second_mask = first_table[bishop], second_table[bishop]
+        choice, randint = rng.choice, rng.randint
+        for turn in turns:
+            if first_mask >> rook & 1:
+                return first, turn
+            row = choice(moves)
+            total = 0
+            for _ in rolls:
+                total += randint(1, sides)
+            rook = row[total][rook]
+            if second_mask >> rook & 1:
+                return second, turn
+        return True, timeout
+
+    return play
@@ -1,22 +1,302 @@
 import logging
-from logging import getLogger
+import sys
+from typing import TYPE_CHECKING
 
-from chess.game import Game
-from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+if TYPE_CHECKING:
+    from argparse import ArgumentParser, Namespace
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(name)s [%(levelname)s] %(message)s",
-    force=True,
-)
+    from chess.pieces import Coordinate
 
-if __name__ == "__main__":
-    game_logger = getLogger("ChessGame")
-    rook = Rook(coordinate=Coordinate("H", 1), color=PieceColor.WHITE)
-    bishop = Bishop(coordinate=Coordinate("C", 3), color=PieceColor.BLACK)
-    number_of_turns = 15
+LOG_FORMAT = "%(asctime)s %(name)s [%(levelname)s] %(message)s"
+
+
+def _square(text: str, board_size: int) -> "Coordinate":
+    """Parse a square such as 'H1' into a coordinate.
+
+    Args:
+        text (str): File letter followed by the rank number.
+        board_size (int): Size of the board.
+
+    Returns:
+        Coordinate: The parsed square.
+
+    Raises:
+        ValueError: If the square is malformed or off the board.
+    """
+    from chess.pieces import Coordinate
+
+    if len(text) < 2 or not text[1:].isdigit():
+        raise ValueError(f"square: {text} is not a file letter and a rank")
+    return Coordinate(text[:1].upper(), int(text[1:]), board_size)
 
-    game = Game(rook=rook, bishop=bishop, logger=game_logger)
-    result, number_of_turns = game.play_game(number_of_turns=number_of_turns)
+
+def _play(args: "Namespace") -> None:
+    """Play a single game and log every turn."""
+    from chess.game import Game
+    from chess.pieces import Bishop, PieceColor, Rook
+
+    game_logger = logging.getLogger("ChessGame")
+    rook = Rook(_square(args.rook, args.board_size), PieceColor.WHITE)
+    bishop = Bishop(_square(args.bishop, args.board_size), PieceColor.BLACK)
+    game = Game(
+        rook=rook,
+        bishop=bishop,
+        logger=game_logger,
+        board_size=args.board_size,
+    )
+    result, number_of_turns = game.play_game(number_of_turns=args.turns)
 
     game_logger.info(f"The {result} wins in {number_of_turns} turns")
+
+
+def _heatmap(args: "Namespace") -> None:
+    """Print, and optionally save, the rook occupancy and capture heatmaps."""
+    from chess.heatmap import exact_heatmaps, sampled_heatmaps
+
+    rook = _square(args.rook, args.board_size)
+    bishop = _square(args.bishop, args.board_size)
+    if args.samples:
+        heatmaps = sampled_heatmaps(rook, bishop, args.turns, args.samples, args.seed)
+    else:
+        heatmaps = exact_heatmaps(rook, bishop, args.turns)
+    for grid in ("occupancy", "rook_captures", "bishop_captures"):
+        print(f"{grid}:\n{heatmaps.render_ascii(grid)}")
+    print(f"timeout probability: {heatmaps.timeout_probability:.6f}")
+    if args.png:
+        heatmaps.write_png(args.png)
+
+
+def _solve(args: "Namespace") -> None:
+    """Print exact outcome probabilities from the absorbing Markov chain."""
+    from chess.markov import RookBishopChain
+
+    rook = _square(args.rook, args.board_size)
+    bishop = _square(args.bishop, args.board_size)
+    chain = RookBishopChain.for_bishop(bishop, cache=True)
+    start = (rook.file_index(), rook.rank_index())
+    if args.turns is None:
+        absorption = chain.absorption()
+        square = rook.square_id()
+        print(f"rook wins: {absorption.rook_wins[square]:.6f}")
+        print(f"bishop wins: {absorption.bishop_wins[square]:.6f}")
+        print(f"expected turns: {absorption.expected_turns[square]:.6f}")
+    else:
+        outcome = chain.horizon(start, args.turns)
+        print(f"rook wins: {outcome.rook_wins:.6f}")
+        print(f"bishop wins: {outcome.bishop_wins:.6f}")
+        print(f"timeouts: {outcome.timeouts:.6f}")
+
+
+def _memory(args: "Namespace") -> None:
+    """Report the memory held by many games, optionally against a baseline."""
+    from chess.memory import MemoryReport, memory_report
+
+    report = memory_report(
+        games=args.games,
+        rook=_square(args.rook, args.board_size),
+        bishop=_square(args.bishop, args.board_size),
+        number_of_turns=args.turns,
+        label=args.label,
+    )
+    print(report.render())
+    if args.compare:
+        print(report.compare(MemoryReport.load(args.compare)))
+    if args.save:
+        report.save(args.save)
+
+
+def _tables(args: "Namespace") -> None:
+    """Build the cached lookup tables for some board sizes ahead of time."""
+    from chess.heatmap import rook_move_table
+    from chess.tables import table_directory
+
+    for board_size in args.board_sizes:
+        rook_move_table(board_size)
+    print(f"tables cached in {table_directory()}")
+
+
+def _record(args: "Namespace") -> None:
+    """Play seeded games and save their recordings for replay."""
+    import random
+
+    from chess.game import Game
+    from chess.pieces import Bishop, PieceColor, Rook
+    from chess.replay import record_game, save_recordings
+
+    rook = _square(args.rook, args.board_size)
+    bishop = _square(args.bishop, args.board_size)
+    rng = random.Random(args.seed)
+    sink = logging.Logger("ChessGame.record", level=logging.WARNING)
+    games = (
+        record_game(
+            Game(
+                rook=Rook(rook, PieceColor.WHITE),
+                bishop=Bishop(bishop, PieceColor.BLACK),
+                logger=sink,
+                board_size=args.board_size,
+                metrics=None,
+                rng=rng,
+            ),
+            args.turns,
+            name=f"game-{index:05d}",
+        )
+        for index in range(args.games)
+    )
+    print(f"recorded {save_recordings(args.output, games)} games to {args.output}")
+
+
+def _replay(args: "Namespace") -> None:
+    """Export an animation of every recorded game in a file."""
+    from chess.replay import ReplayFormat, export_replays, load_recordings
+
+    paths = export_replays(
+        load_recordings(args.recordings),
+        args.output_dir,
+        ReplayFormat(args.format),
+        workers=args.workers,
+        frame_seconds=args.frame_seconds,
+        cell_size=args.cell_size,
+    )
+    print(f"exported {len(paths)} {args.format} replays to {args.output_dir}")
+
+
+def _serve(args: "Namespace") -> None:
+    """Hand over to the session server's own command line."""
+    from chess.server import main as serve_main
+
+    serve_main(args.server_args)
+
+
+def _add_game_arguments(
+    parser: "ArgumentParser",
+    turns: int | None = 15,
+) -> None:
+    """Add the start position options shared by several subcommands."""
+    parser.add_argument("--rook", default="H1", help="rook start square")
+    parser.add_argument("--bishop", default="C3", help="bishop square")
+    parser.add_argument("--turns", type=int, default=turns, help="turn limit")
+    parser.add_argument("--board-size", type=int, default=8)
+
+
+def build_parser() -> "ArgumentParser":
+    """Create the argument parser with one subparser per command.
+
+    Returns:
+        ArgumentParser: The parser; running without a command plays one game.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main", description="Special chess game")
+    parser.set_defaults(
+        handler=_play,
+        rook="H1",
+        bishop="C3",
+        turns=15,
+        board_size=8,
+    )
+    transcript = parser.add_argument_group("transcripts")
+    transcript.add_argument("--transcript", help="write the log to this file")
+    transcript.add_argument(
+        "--transcript-compression",
+        choices=["none", "gzip", "zstd"],
+        default="none",
+    )
+    transcript.add_argument(
+        "--transcript-max-bytes",
+        type=int,
+        default=0,
+        help="rotate the transcript at this size",
+    )
+    transcript.add_argument(
+        "--transcript-drop",
+        action="store_true",
+        help="drop records instead of waiting when the writer falls behind",
+    )
+    commands = parser.add_subparsers(title="commands")
+
+    play = commands.add_parser("play", help="play one game (the default)")
+    _add_game_arguments(play)
+    play.set_defaults(handler=_play)
+
+    heatmap = commands.add_parser("heatmap", help="per-square outcome heatmaps")
+    _add_game_arguments(heatmap)
+    heatmap.add_argument("--samples", type=int, default=0, help="sample, not exact")
+    heatmap.add_argument("--seed", type=int, default=0)
+    heatmap.add_argument("--png", help="write the occupancy heatmap to a PNG")
+    heatmap.set_defaults(handler=_heatmap)
+
+    solve = commands.add_parser("solve", help="exact outcome probabilities")
+    _add_game_arguments(solve, turns=None)
+    solve.set_defaults(handler=_solve)
+
+    memory = commands.add_parser("memory", help="per-object memory report")
+    _add_game_arguments(memory)
+    memory.add_argument("--games", type=int, default=10_000)
+    memory.add_argument("--label", default="", help="name of this run")
+    memory.add_argument("--save", help="write the report to a JSON file")
+    memory.add_argument("--compare", help="JSON report of a baseline run")
+    memory.set_defaults(handler=_memory)
+
+    tables = commands.add_parser("tables", help="prebuild cached lookup tables")
+    tables.add_argument("board_sizes", type=int, nargs="*", default=[8])
+    tables.set_defaults(handler=_tables)
+
+    record = commands.add_parser("record", help="record games for replay")
+    _add_game_arguments(record)
+    record.add_argument("output", help="JSON lines file of recorded games")
+    record.add_argument("--games", type=int, default=100)
+    record.add_argument("--seed", type=int, default=0)
+    record.set_defaults(handler=_record)
+
+    replay = commands.add_parser("replay", help="export animated replays")
+    replay.add_argument("recordings", help="JSON lines file of recorded games")
+    replay.add_argument("--format", choices=["cast", "svg", "gif"], default="svg")
+    replay.add_argument("--output-dir", default="replays")
+    replay.add_argument("--workers", type=int, help="export threads")
+    replay.add_argument("--frame-seconds", type=float, default=0.5)
+    replay.add_argument("--cell-size", type=int, default=32, help="image pixels")
+    replay.set_defaults(handler=_replay)
+
+    serve = commands.add_parser("serve", help="serve game sessions over TCP")
+    serve.add_argument("server_args", nargs=argparse.REMAINDER)
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a command, playing one game from H1 against C3 by default.
+
+    Importing this module stays cheap: each command imports what it needs when it
+    runs, so playing a single game never loads NumPy, SciPy, asyncio or the HTTP
+    server, and logging is only configured once a command actually runs. With
+    `--transcript`, log records go to a file from a background writer thread
+    instead of the console.
+
+    Args:
+        argv (list[str] | None, optional): Arguments to parse. Defaults to sys.argv.
+    """
+    args = build_parser().parse_args(sys.argv[1:] if argv is None else argv)
+    if args.transcript:
+        from chess.transcripts import Compression, QueuePolicy, TranscriptHandler
+
+        handler: logging.Handler = TranscriptHandler(
+            args.transcript,
+            policy=QueuePolicy.DROP if args.transcript_drop else QueuePolicy.BLOCK,
+            compression=Compression(args.transcript_compression),
+            max_bytes=args.transcript_max_bytes,
+        )
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logging.basicConfig(level=logging.INFO, handlers=[handler], force=True)
+        try:
+            args.handler(args)
+        finally:
+            logging.root.removeHandler(handler)
+            handler.close()
+        return
+    if args.handler is not _serve:
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, force=True)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
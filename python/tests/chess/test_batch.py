@@ -0,0 +1,147 @@
+import pytest
+
+from chess.batch import (
+    BatchCheckpoint,
+    BatchJob,
+    Chunk,
+    JobResult,
+    chunk_rng,
+    play_chunk,
+    run_batch,
+    split_into_chunks,
+)
+from chess.heatmap import exact_heatmaps
+from chess.pieces import Coordinate
+
+
+def test_split_into_chunks() -> None:
+    jobs = [BatchJob("H1", "C3", games=5), BatchJob("A1", "C3", games=2)]
+    assert split_into_chunks(jobs, 2) == [
+        Chunk(0, 0, 2),
+        Chunk(0, 1, 2),
+        Chunk(0, 2, 1),
+        Chunk(1, 0, 2),
+    ]
+    with pytest.raises(ValueError):
+        split_into_chunks(jobs, 0)
+
+
+def test_chunk_rng_depends_only_on_seed_and_position() -> None:
+    chunk = Chunk(1, 2, 10)
+    assert chunk_rng(3, chunk).random() == chunk_rng(3, Chunk(1, 2, 99)).random()
+    assert chunk_rng(3, chunk).random() != chunk_rng(4, chunk).random()
+    assert chunk_rng(3, chunk).random() != chunk_rng(3, Chunk(2, 1, 10)).random()
+
+
+def test_play_chunk_immediate_rook_capture() -> None:
+    result = play_chunk(BatchJob("H1", "H3"), Chunk(0, 0, 7), seed=0)
+    assert result == JobResult(games=7, rook_wins=7, total_turns=7)
+    assert result.mean_turns == 1.0
+
+
+def test_run_batch_is_independent_of_thread_count() -> None:
+    jobs = [BatchJob("H1", "C3", games=300), BatchJob("A1", "D5", games=120)]
+    single = run_batch(jobs, workers=1, chunk_size=50, seed=11)
+    threaded = run_batch(jobs, workers=4, chunk_size=50, seed=11)
+
+    assert single == threaded
+    assert [result.games for result in single] == [300, 120]
+    for result in single:
+        assert result.rook_wins + result.bishop_wins == result.games
+        assert result.timeouts <= result.rook_wins
+    assert run_batch(jobs, workers=2, chunk_size=50, seed=12) != single
+
+
+def test_run_batch_matches_exact_probabilities() -> None:
+    [result] = run_batch([BatchJob("H1", "C3", games=6000)], chunk_size=500)
+    exact = exact_heatmaps(Coordinate("H", 1), Coordinate("C", 3), 15)
+    assert result.bishop_wins / result.games == pytest.approx(
+        exact.bishop_captures.sum(), abs=0.03
+    )
+    assert result.timeouts / result.games == pytest.approx(
+        exact.timeout_probability, abs=0.03
+    )
+
+
+class _Preempted(Exception):
+    """Stands in for the scheduler killing a run."""
+
+
+def test_checkpoint_save_and_load_round_trip(tmp_path) -> None:
+    jobs = [BatchJob("H1", "C3", games=5)]
+    progress = BatchCheckpoint(jobs, chunk_size=2, seed=4)
+    progress.complete(Chunk(0, 1, 2), JobResult(2, 1, 1, 0, 7))
+    path = str(tmp_path / "batch.json")
+
+    progress.save(path)
+    loaded = BatchCheckpoint.load(path)
+
+    assert loaded.jobs == jobs
+    assert loaded.results == [JobResult(2, 1, 1, 0, 7)]
+    assert list(loaded.pending) == [Chunk(0, 0, 2), Chunk(0, 2, 1)]
+    assert loaded.matches(jobs, 2, 4)
+    assert not loaded.matches(jobs, 2, 5)
+    assert [p.name for p in tmp_path.iterdir()] == ["batch.json"]
+
+
+def test_resume_after_preemption_matches_uninterrupted_run(
+    tmp_path, monkeypatch
+) -> None:
+    jobs = [BatchJob("H1", "C3", games=200), BatchJob("A1", "D5", games=90)]
+    expected = run_batch(jobs, workers=1, chunk_size=20, seed=9)
+    path = str(tmp_path / "batch.json")
+
+    calls = 0
+
+    def flaky_play_chunk(job, chunk, seed):
+        nonlocal calls
+        calls += 1
+        if calls > 6:
+            raise _Preempted
+        return play_chunk(job, chunk, seed)
+
+    monkeypatch.setattr("chess.batch.play_chunk", flaky_play_chunk)
+    with pytest.raises(_Preempted):
+        run_batch(
+            jobs,
+            workers=1,
+            chunk_size=20,
+            seed=9,
+            checkpoint_path=path,
+            checkpoint_interval=0,
+        )
+    monkeypatch.undo()
+
+    saved = BatchCheckpoint.load(path)
+    assert sum(result.games for result in saved.results) == 6 * 20
+    assert len(saved.pending) == len(split_into_chunks(jobs, 20)) - 6
+
+    resumed = run_batch(
+        jobs,
+        workers=3,
+        chunk_size=20,
+        seed=9,
+        checkpoint_path=path,
+        resume=True,
+    )
+    assert resumed == expected
+    assert not BatchCheckpoint.load(path).pending
+
+
+def test_resume_rejects_checkpoint_of_another_batch(tmp_path) -> None:
+    path = str(tmp_path / "batch.json")
+    run_batch([BatchJob("H1", "C3", games=4)], chunk_size=2, checkpoint_path=path)
+    with pytest.raises(ValueError):
+        run_batch(
+            [BatchJob("H1", "C3", games=4)],
+            chunk_size=2,
+            seed=1,
+            checkpoint_path=path,
+            resume=True,
+        )
+
+
+def test_resume_without_checkpoint_starts_fresh(tmp_path) -> None:
+    path = str(tmp_path / "missing.json")
+    jobs = [BatchJob("H1", "C3", games=10)]
+    assert run_batch(jobs, checkpoint_path=path, resume=True) == run_batch(jobs)
@@ -1,5 +1,6 @@
 import pytest
 import logging
+from unittest.mock import MagicMock
 from chess.board import ChessBoard
 from chess.pieces import Coordinate, PieceColor
 
@@ -59,3 +60,17 @@ def test_render_logs_board(create_piece_at_index, caplog, logger) -> None:
 
     expected = "\nD  _\n_  D\n"
     assert any(rec.message.strip() == expected.strip() for rec in caplog.records)
+
+
+def test_render_skips_work_when_info_disabled(create_piece_at_index) -> None:
+    """render() must not build the board when INFO messages would be discarded."""
+    quiet = logging.getLogger(f"{__name__}.quiet")
+    quiet.setLevel(logging.WARNING)
+    board = ChessBoard(
+        pieces=[create_piece_at_index(0, 0, 2)], board_size=2, logger=quiet
+    )
+    board._populate_board = MagicMock()
+
+    board.render()
+
+    board._populate_board.assert_not_called()
@@ -0,0 +1,28 @@
+from unittest.mock import patch
+
+import pytest
+
+from chess.files import write_atomically
+
+
+@pytest.mark.parametrize("durable", [False, True])
+def test_write_atomically_replaces_content(tmp_path, durable: bool) -> None:
+    path = tmp_path / "state.txt"
+    path.write_text("old")
+
+    write_atomically(str(path), "new", durable=durable)
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.txt"]
+
+
+def test_write_atomically_keeps_old_content_on_failure(tmp_path) -> None:
+    path = tmp_path / "state.txt"
+    path.write_text("old")
+
+    with patch("chess.files.os.replace", side_effect=OSError("disk gone")):
+        with pytest.raises(OSError):
+            write_atomically(str(path), "new")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.txt"]
@@ -1,8 +1,10 @@
+import random
 import pytest
 from unittest.mock import MagicMock, patch
 from logging import Logger
 
 from chess.game import Game
+from chess.metrics import GameMetrics, MetricsRegistry
 from chess.pieces import Rook, Bishop
 from chess.move import MoveDirection
 
@@ -135,3 +137,70 @@ def test_play_game_stops_on_capture(
     assert turns == 3
     # initial render + one per turn
     assert board_instance.render.call_count == 4
+
+
+@patch("chess.game.ChessBoard")
+def test_play_game_records_metrics(
+    mock_board_cls: MagicMock,
+    rook: MagicMock,
+    bishop: MagicMock,
+    logger: MagicMock,
+) -> None:
+    metrics = GameMetrics(MetricsRegistry())
+    game = Game(rook=rook, bishop=bishop, logger=logger, metrics=metrics)
+    game._resolve_turn = MagicMock(side_effect=[None, bishop])
+
+    winner, turns = game.play_game(number_of_turns=5)
+
+    assert winner is bishop
+    assert metrics.games.value == 1
+    assert metrics.turns.value == 2
+    assert metrics.bishop_wins.value == 1
+    assert metrics.rook_wins.value == 0
+    assert metrics.timeouts.value == 0
+    assert metrics.game_length.sum == turns == 2
+    assert metrics.turn_latency.count == 2
+
+
+@patch("chess.game.ChessBoard")
+def test_play_game_records_timeout_as_rook_win(
+    mock_board_cls: MagicMock,
+    rook: MagicMock,
+    bishop: MagicMock,
+    logger: MagicMock,
+) -> None:
+    metrics = GameMetrics(MetricsRegistry())
+    game = Game(rook=rook, bishop=bishop, logger=logger, metrics=metrics)
+    game._resolve_turn = MagicMock(return_value=None)
+
+    winner, turns = game.play_game(number_of_turns=3)
+
+    assert winner is rook
+    assert turns == 4
+    assert metrics.rook_wins.value == 1
+    assert metrics.timeouts.value == 1
+    assert metrics.turns.value == 3
+
+
+@patch("chess.game.ChessBoard")
+@patch("chess.game.roll_dice")
+@patch("chess.game.toss_coin")
+def test_play_turn_draws_from_game_rng(
+    mock_toss: MagicMock,
+    mock_roll: MagicMock,
+    mock_board_cls: MagicMock,
+    rook: MagicMock,
+    bishop: MagicMock,
+    logger: MagicMock,
+) -> None:
+    rook.can_capture.return_value = False
+    bishop.can_capture.return_value = False
+    mock_toss.return_value = MoveDirection.UP
+    mock_roll.return_value = 1
+    rng = random.Random(0)
+
+    game = Game(rook=rook, bishop=bishop, logger=logger, rng=rng)
+    game._play_turn()
+
+    mock_toss.assert_called_once_with(rng)
+    assert mock_roll.call_args_list == [((rng,),), ((rng,),)]
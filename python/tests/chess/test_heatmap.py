@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from chess.heatmap import exact_heatmaps, rook_move_table, sampled_heatmaps
+from chess.move import dice_sum_distribution
+from chess.pieces import Coordinate
+
+
+def test_dice_sum_distribution() -> None:
+    distribution = dice_sum_distribution()
+    assert list(distribution) == list(range(2, 13))
+    assert distribution[7] == pytest.approx(6 / 36)
+    assert sum(distribution.values()) == pytest.approx(1.0)
+    assert dice_sum_distribution(dice=1, sides=4) == {t: 0.25 for t in range(1, 5)}
+
+
+def test_rook_move_table_matches_rook_move() -> None:
+    moves, weights = rook_move_table(8)
+    assert moves.shape == (22, 64)
+    assert weights.sum() == pytest.approx(1.0)
+    h1 = Coordinate("H", 1).square_id()
+    # first row is UP by 2, first row of RIGHT is RIGHT by 2
+    assert moves[0, h1] == Coordinate("H", 3).square_id()
+    assert moves[11, h1] == Coordinate("B", 1).square_id()
+    for row in moves:
+        assert sorted(row) == list(range(64))
+
+
+def test_exact_heatmaps_conserve_probability() -> None:
+    heatmaps = exact_heatmaps(Coordinate("H", 1), Coordinate("C", 3), 15)
+
+    assert heatmaps.occupancy.shape == (16, 8, 8)
+    assert heatmaps.occupancy[0, 7, 7] == 1.0
+    rook = heatmaps.rook_captures.sum()
+    bishop = heatmaps.bishop_captures.sum()
+    assert rook + bishop + heatmaps.timeout_probability == pytest.approx(1.0)
+    # rook captures always happen on the bishop's square
+    assert heatmaps.rook_captures.sum(axis=0)[5, 2] == pytest.approx(rook)
+    # games alive at the start of a turn end it somewhere on the board
+    alive = 1.0
+    for turn in range(1, 16):
+        assert heatmaps.occupancy[turn].sum() == pytest.approx(alive)
+        alive -= (
+            heatmaps.rook_captures[turn].sum() + heatmaps.bishop_captures[turn].sum()
+        )
+
+
+def test_exact_heatmaps_immediate_rook_capture() -> None:
+    heatmaps = exact_heatmaps(Coordinate("H", 1), Coordinate("H", 3), 5)
+    assert heatmaps.rook_captures[1].sum() == pytest.approx(1.0)
+    assert heatmaps.bishop_captures.sum() == 0.0
+    assert heatmaps.occupancy[2:].sum() == 0.0
+
+
+def test_sampled_heatmaps_agree_with_exact() -> None:
+    rook, bishop = Coordinate("H", 1), Coordinate("C", 3)
+    exact = exact_heatmaps(rook, bishop, 15)
+    sampled = sampled_heatmaps(rook, bishop, 15, samples=40_000, seed=7)
+
+    assert sampled.occupancy.shape == exact.occupancy.shape
+    assert np.abs(sampled.occupancy - exact.occupancy).max() < 0.02
+    assert np.abs(sampled.bishop_captures - exact.bishop_captures).max() < 0.02
+    assert sampled.rook_captures.sum() == pytest.approx(
+        exact.rook_captures.sum(), abs=0.01
+    )
+
+
+def test_render_ascii_and_png(tmp_path) -> None:
+    heatmaps = exact_heatmaps(Coordinate("A", 1, 4), Coordinate("C", 3, 4), 3)
+
+    ascii_map = heatmaps.render_ascii(turn=0)
+    assert ascii_map.splitlines() == ["        "] * 3 + ["@@      "]
+
+    path = tmp_path / "occupancy.png"
+    heatmaps.write_png(str(path), grid="bishop_captures", cell_size=2)
+    data = path.read_bytes()
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    assert data[16:24] == (8).to_bytes(4, "big") * 2
+
+    with pytest.raises(ValueError):
+        heatmaps.render_ascii(grid="nonsense")
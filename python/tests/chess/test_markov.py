@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from chess.heatmap import exact_heatmaps
+from chess.markov import RookBishopChain, _power_times
+from chess.pieces import Coordinate
+
+
+def test_power_times_matches_repeated_products() -> None:
+    matrix = np.array([[0.5, 0.5], [0.25, 0.75]])
+    vector = np.array([1.0, 0.0])
+    expected = vector
+    for _ in range(13):
+        expected = expected @ matrix
+    assert np.allclose(_power_times(vector, matrix, 13), expected)
+    assert np.array_equal(_power_times(vector, matrix, 0), vector)
+
+
+def test_chain_excludes_rook_lines_from_transient_states() -> None:
+    chain = RookBishopChain.for_bishop(Coordinate("C", 3))
+    assert len(chain.transient) == 64 - 15
+    rows = np.asarray(chain.transitions.sum(axis=1)).ravel()
+    assert np.allclose(rows + chain.to_bishop + chain.to_rook, 1.0)
+
+
+@pytest.mark.parametrize(
+    "rook,bishop,turns",
+    [("H1", "C3", 15), ("A1", "D5", 7), ("B2", "C3", 1), ("H1", "H3", 4)],
+)
+def test_horizon_matches_exact_heatmaps(rook: str, bishop: str, turns: int) -> None:
+    rook_start = Coordinate(rook[0], int(rook[1:]))
+    bishop_square = Coordinate(bishop[0], int(bishop[1:]))
+    chain = RookBishopChain.for_bishop(bishop_square)
+    outcome = chain.horizon(
+        (rook_start.file_index(), rook_start.rank_index()),
+        turns,
+    )
+    heatmaps = exact_heatmaps(rook_start, bishop_square, turns)
+
+    assert outcome.rook_wins == pytest.approx(heatmaps.rook_captures.sum())
+    assert outcome.bishop_wins == pytest.approx(heatmaps.bishop_captures.sum())
+    assert outcome.timeouts == pytest.approx(heatmaps.timeout_probability, abs=1e-9)
+
+
+def test_absorption_matches_long_horizons() -> None:
+    bishop = Coordinate("B", 4, board_size=5)
+    chain = RookBishopChain.for_bishop(bishop)
+    absorption = chain.absorption()
+    rook = Coordinate("E", 1, board_size=5)
+    square = rook.square_id()
+
+    heatmaps = exact_heatmaps(rook, bishop, 600)
+    per_turn = (heatmaps.rook_captures + heatmaps.bishop_captures).sum(axis=(1, 2))
+    assert absorption.expected_turns[square] == pytest.approx(
+        np.dot(np.arange(601), per_turn)
+    )
+    assert absorption.bishop_wins[square] == pytest.approx(
+        heatmaps.bishop_captures.sum()
+    )
+
+    huge = chain.horizon((rook.file_index(), rook.rank_index()), 10**18)
+    assert huge.bishop_wins == pytest.approx(absorption.bishop_wins[square])
+    assert huge.rook_wins == pytest.approx(absorption.rook_wins[square])
+
+
+def test_absorption_on_rook_lines_is_immediate() -> None:
+    chain = RookBishopChain(6, (2, 3))
+    absorption = chain.absorption()
+    on_line = 3 * 6 + 5
+    assert absorption.rook_wins[on_line] == 1.0
+    assert absorption.expected_turns[on_line] == 1.0
+    assert np.all((absorption.bishop_wins >= 0) & (absorption.bishop_wins <= 1))
+
+
+def test_large_board_beyond_file_letters() -> None:
+    chain = RookBishopChain(60, (20, 30))
+    absorption = chain.absorption()
+    assert absorption.expected_turns.shape == (3600,)
+    assert np.all(absorption.expected_turns >= 1)
+
+    outcome = chain.horizon((59, 59), 50)
+    assert outcome.rook_wins + outcome.bishop_wins + outcome.timeouts == (
+        pytest.approx(1.0)
+    )
+
+
+def test_invalid_positions() -> None:
+    with pytest.raises(ValueError):
+        RookBishopChain(8, (8, 0))
+    chain = RookBishopChain(8, (2, 5))
+    with pytest.raises(ValueError):
+        chain.horizon((0, 8), 3)
+    with pytest.raises(ValueError):
+        chain.horizon((0, 0), -1)
@@ -0,0 +1,72 @@
+import logging
+import random
+
+from chess.game import Game
+from chess.memory import (
+    OTHER,
+    Footprint,
+    MemoryReport,
+    measure_footprint,
+    memory_report,
+    trace_play_game,
+)
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+
+
+def _game() -> Game:
+    return Game(
+        rook=Rook(Coordinate("H", 1), PieceColor.WHITE),
+        bishop=Bishop(Coordinate("C", 3), PieceColor.BLACK),
+        logger=logging.Logger("memory-test", level=logging.WARNING),
+        metrics=None,
+        rng=random.Random(0),
+    )
+
+
+def test_footprint_attributes_objects_to_their_types() -> None:
+    footprint = measure_footprint([_game(), _game()])
+
+    assert footprint["Game"].objects == 2
+    assert footprint["ChessBoard"].objects == 2
+    assert footprint["ChessPiece"].objects == 4
+    assert footprint["Coordinate"].objects == 4
+    assert footprint[OTHER] == Footprint(0, 0)
+    assert all(size > 0 for name, (_, size) in footprint.items() if name != OTHER)
+
+
+def test_footprint_counts_shared_objects_once() -> None:
+    coordinate = Coordinate("A", 1)
+    alone = measure_footprint([coordinate])
+    twice = measure_footprint([coordinate, [coordinate]])
+
+    assert twice["Coordinate"] == alone["Coordinate"]
+    assert twice[OTHER].objects == 0
+    assert twice[OTHER].bytes > 0
+
+
+def test_footprint_skips_loggers_and_generators() -> None:
+    with_shared = measure_footprint([_game()])
+    game = _game()
+    game.logger = None  # type: ignore[assignment]
+    game.rng = None
+    assert measure_footprint([game])["Game"] == with_shared["Game"]
+
+
+def test_trace_play_game_reports_a_peak() -> None:
+    usage = trace_play_game(_game(), 15)
+    assert usage.peak >= max(usage.retained, 0)
+    assert usage.peak > 0
+
+
+def test_report_round_trips_and_compares(tmp_path) -> None:
+    report = memory_report(games=50, label="after", traced_plays=5)
+    path = tmp_path / "report.json"
+    report.save(str(path))
+    baseline = MemoryReport.load(str(path))
+    baseline.label = "before"
+
+    assert baseline.footprint == report.footprint
+    assert "Coordinate" in report.render()
+    comparison = report.compare(baseline).splitlines()
+    assert comparison[0] == "'before' -> 'after', bytes per game"
+    assert all(line.split()[-1] in ("+0.0", "+0") for line in comparison[2:])
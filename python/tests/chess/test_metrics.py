@@ -0,0 +1,98 @@
+import urllib.request
+
+import pytest
+
+from chess.metrics import Counter, GameMetrics, Histogram, MetricsRegistry
+
+
+def test_counter_increments_and_renders() -> None:
+    counter = Counter("things_total", "Things.")
+    counter.inc()
+    counter.inc(2)
+    assert counter.value == 3
+    assert counter.render() == (
+        "# HELP things_total Things.\n# TYPE things_total counter\nthings_total 3\n"
+    )
+
+
+def test_counter_rejects_negative_increment() -> None:
+    with pytest.raises(ValueError):
+        Counter("things_total", "Things.").inc(-1)
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = Histogram("length", "Length.", buckets=[5, 1])
+    for value in (0.5, 1, 3, 7):
+        histogram.observe(value)
+
+    assert histogram.buckets == (1, 5)
+    assert histogram.count == 4
+    assert histogram.sum == 11.5
+    rendered = histogram.render()
+    assert 'length_bucket{le="1"} 2\n' in rendered
+    assert 'length_bucket{le="5"} 3\n' in rendered
+    assert 'length_bucket{le="+Inf"} 4\n' in rendered
+    assert "length_sum 11.5\n" in rendered
+    assert "length_count 4\n" in rendered
+
+
+def test_histogram_requires_buckets() -> None:
+    with pytest.raises(ValueError):
+        Histogram("empty", "Empty.", buckets=[])
+
+
+def test_registry_returns_existing_metrics_and_checks_types() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("a_total", "A.")
+    assert registry.counter("a_total", "Other help.") is counter
+    histogram = registry.histogram("b", "B.", [1])
+    assert registry.histogram("b", "B.", [2]) is histogram
+
+    with pytest.raises(ValueError):
+        registry.histogram("a_total", "A.", [1])
+    with pytest.raises(ValueError):
+        registry.counter("b", "B.")
+
+
+def test_game_metrics_record_outcomes() -> None:
+    registry = MetricsRegistry()
+    metrics = GameMetrics(registry)
+    metrics.record_turn(0.001)
+    metrics.record_game(rook_won=True, turns=16, timed_out=True)
+    metrics.record_game(rook_won=False, turns=3, timed_out=False)
+
+    assert metrics.games.value == 2
+    assert metrics.turns.value == 1
+    assert metrics.rook_wins.value == 1
+    assert metrics.bishop_wins.value == 1
+    assert metrics.timeouts.value == 1
+    assert metrics.game_length.count == 2
+    assert "chess_games_total 2\n" in registry.render()
+
+
+def test_write_textfile_replaces_previous_dump(tmp_path) -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("runs_total", "Runs.")
+    path = tmp_path / "metrics.prom"
+
+    registry.write_textfile(str(path))
+    counter.inc()
+    registry.write_textfile(str(path))
+
+    assert "runs_total 1\n" in path.read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics.prom"]
+
+
+def test_serve_exposes_metrics_over_http() -> None:
+    registry = MetricsRegistry()
+    registry.counter("served_total", "Served.").inc()
+    server = registry.serve(port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "served_total 1\n" in body
@@ -1,3 +1,4 @@
+import random
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -37,3 +38,19 @@ def test_roll_dice_range() -> None:
     result = roll_dice()
     assert isinstance(result, int)
     assert 1 <= result <= 6
+
+
+def test_toss_coin_and_roll_dice_use_given_rng() -> None:
+    """Passing a generator makes draws reproducible and leaves random untouched."""
+    first = [(toss_coin(random.Random(5)), roll_dice(random.Random(5)))]
+    second = [(toss_coin(random.Random(5)), roll_dice(random.Random(5)))]
+    assert first == second
+
+    with patch("chess.move.random.choice") as mock_choice, patch(
+        "chess.move.random.randint"
+    ) as mock_randint:
+        rng = random.Random(1)
+        toss_coin(rng)
+        roll_dice(rng)
+    mock_choice.assert_not_called()
+    mock_randint.assert_not_called()
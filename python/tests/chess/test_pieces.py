@@ -6,6 +6,11 @@ from chess.pieces import (
     ChessPiece,
     Rook,
     Bishop,
+    Knight,
+    Queen,
+    format_squares,
+    parse_squares,
+    square_tables,
 )
 from chess.move import MoveDirection
 
@@ -118,3 +123,101 @@ def test_dummy_piece_str_and_capture(dummy_piece_class) -> None:
     p = dummy_piece_class(coord, PieceColor.BLACK, emoji="X", can_capture_result=True)
     assert str(p) == "Black Dummy"
     assert p.can_capture(Coordinate("E", 5, board_size=8))
+
+
+def test_coordinate_square_id_round_trip() -> None:
+    assert Coordinate("A", 8).square_id() == 0
+    assert Coordinate("H", 8).square_id() == 7
+    assert Coordinate("A", 1).square_id() == 56
+    assert Coordinate("C", 3, board_size=5).square_id() == 2 * 5 + 2
+    for square in range(25):
+        coordinate = Coordinate.from_square_id(square, board_size=5)
+        assert coordinate.square_id() == coordinate.square == square
+
+
+@pytest.mark.parametrize("square", [-1, 64])
+def test_coordinate_from_square_id_invalid(square: int) -> None:
+    with pytest.raises(ValueError):
+        Coordinate.from_square_id(square, board_size=8)
+
+
+def test_knight_and_queen() -> None:
+    knight = Knight(Coordinate("B", 1), PieceColor.WHITE)
+    assert str(knight) == "White Knight"
+    assert knight.emoji == "♘"
+    assert sorted(str(c) for c in knight.destinations()) == ["A3", "C3", "D2"]
+    assert knight.can_capture(Coordinate("C", 3))
+    assert not knight.can_capture(Coordinate("C", 2))
+
+    queen = Queen(Coordinate("D", 4), PieceColor.BLACK)
+    assert queen.emoji == "♛"
+    assert len(queen.destinations()) == 27
+    assert queen.can_capture(Coordinate("H", 8))
+    assert queen.can_capture(Coordinate("D", 1))
+    assert not queen.can_capture(Coordinate("E", 6))
+
+
+def test_bishop_cannot_move_like_a_rook() -> None:
+    bishop = Bishop(Coordinate("C", 1), PieceColor.BLACK)
+    with pytest.raises(ValueError):
+        bishop.move(direction=MoveDirection.UP, spaces=1, board_size=8)
+
+
+def test_rook_and_bishop_capture_match_geometry() -> None:
+    for origin in range(25):
+        start = Coordinate.from_square_id(origin, board_size=5)
+        rook = Rook(start, PieceColor.WHITE)
+        bishop = Bishop(start, PieceColor.BLACK)
+        for target in range(25):
+            end = Coordinate.from_square_id(target, board_size=5)
+            assert rook.can_capture(end) is (
+                start.file == end.file or start.rank == end.rank
+            )
+            assert bishop.can_capture(end) is (
+                abs(start.file_index() - end.file_index())
+                == abs(start.rank_index() - end.rank_index())
+            )
+
+
+def test_parse_squares_in_bulk() -> None:
+    parsed = parse_squares(["A8", "h1", " c3 ", "C3"])
+    assert list(parsed.square_ids) == [0, 63, 42, 42]
+    assert parsed.errors == []
+
+
+def test_parse_squares_reports_all_invalid_entries() -> None:
+    parsed = parse_squares(["A1", "I1", "", "A9", "E5"], board_size=8)
+    assert list(parsed.square_ids) == [56, -1, -1, -1, 28]
+    assert parsed.errors == [(1, "I1"), (2, ""), (3, "A9")]
+
+
+@pytest.mark.parametrize("board_size", [3, 8, 26])
+def test_format_squares_matches_coordinate_str(board_size: int) -> None:
+    ids = range(board_size * board_size)
+    expected = [str(Coordinate.from_square_id(i, board_size)) for i in ids]
+    assert format_squares(ids, board_size) == expected
+    assert list(parse_squares(expected, board_size).square_ids) == list(ids)
+
+
+def test_format_squares_reports_all_invalid_ids() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        format_squares([0, -1, 9, 4], board_size=3)
+    assert "2 square ids" in str(excinfo.value)
+    assert "row 1: -1" in str(excinfo.value)
+    assert "row 2: 9" in str(excinfo.value)
+
+
+def test_square_tables_are_shared() -> None:
+    assert square_tables(8) is square_tables(8)
+    assert square_tables(5) is square_tables(5)
+
+
+def test_attack_tables_are_kept_per_piece_class() -> None:
+    rook = Rook(Coordinate("A", 1, board_size=5), PieceColor.WHITE)
+    other = Rook(Coordinate("C", 3, board_size=5), PieceColor.BLACK)
+    bishop = Bishop(Coordinate("A", 1, board_size=5), PieceColor.WHITE)
+    assert rook.attack_table() is other.attack_table()
+    assert rook.attack_table() is not bishop.attack_table()
+    assert rook.can_capture(Coordinate("A", 4, board_size=5))
+    assert not bishop.can_capture(Coordinate("A", 4, board_size=5))
+    assert bishop.can_capture(Coordinate("D", 4, board_size=5))
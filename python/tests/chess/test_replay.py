@@ -0,0 +1,249 @@
+import json
+import logging
+import random
+import struct
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from chess.game import Game
+from chess.move import MoveDirection
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.replay import (
+    BISHOP,
+    EMPTY,
+    ROOK,
+    Change,
+    RecordedGame,
+    ReplayFormat,
+    _background,
+    _lzw,
+    _sprite,
+    export_replay,
+    export_replays,
+    load_recordings,
+    record_game,
+    save_recordings,
+)
+
+# Rook from H1 up to H8, onto the diagonal of the bishop on C3.
+BISHOP_WIN = RecordedGame(63, 42, ((MoveDirection.UP, 7),), name="bishop win")
+
+
+def _play(seed: int) -> Game:
+    logger = logging.getLogger("test_replay")
+    logger.disabled = True
+    return Game(
+        rook=Rook(Coordinate("h", 1), PieceColor.WHITE),
+        bishop=Bishop(Coordinate("c", 3), PieceColor.BLACK),
+        logger=logger,
+        metrics=None,
+        rng=random.Random(seed),
+    )
+
+
+def _decode_lzw(data: bytes, min_code_size: int) -> bytes:
+    """Decode GIF LZW data the way a viewer does, independently of the encoder."""
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    bits = int.from_bytes(data, "little")
+    position, output = 0, bytearray()
+    table: list[bytes] = []
+    size, previous = min_code_size + 1, None
+    while True:
+        code = bits >> position & ((1 << size) - 1)
+        position += size
+        if code == clear:
+            table = [bytes((index,)) for index in range(clear)] + [b"", b""]
+            size, previous = min_code_size + 1, None
+            continue
+        if code == end:
+            return bytes(output)
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else previous + previous[:1]
+            table.append(previous + entry[:1])
+        output += entry
+        previous = entry
+        if len(table) == 1 << size and size < 12:
+            size += 1
+
+
+def _decode_gif(data: bytes) -> list[bytes]:
+    """Composite every image of a GIF onto the canvas, as palette indexes."""
+    width, height = struct.unpack("<HH", data[6:10])
+    canvas = bytearray(width * height)
+    frames = []
+    position = 13 + 3 * 8
+    while data[position] != ord(";"):
+        if data[position] == ord("!"):
+            position += 2
+            transparent = data[position + 4] if data[position - 1] == 0xF9 else None
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+            continue
+        left, top, image_width, image_height = struct.unpack(
+            "<HHHH",
+            data[position + 1 : position + 9],
+        )
+        position += 10
+        min_code_size = data[position]
+        position += 1
+        blocks = bytearray()
+        while data[position]:
+            blocks += data[position + 1 : position + 1 + data[position]]
+            position += data[position] + 1
+        position += 1
+        pixels = _decode_lzw(bytes(blocks), min_code_size)
+        for y in range(image_height):
+            for x in range(image_width):
+                pixel = pixels[y * image_width + x]
+                if pixel != transparent:
+                    canvas[(top + y) * width + left + x] = pixel
+        frames.append(bytes(canvas))
+    return frames
+
+
+def _render(board: dict[int, str], board_size: int, cell_size: int) -> bytes:
+    """Draw a whole board from scratch, to compare the frames against."""
+    pixels = bytearray()
+    for rank_index in range(board_size):
+        sprites = [
+            _sprite(
+                board.get(square, EMPTY), _background(square, board_size), cell_size
+            )
+            for square in range(rank_index * board_size, (rank_index + 1) * board_size)
+        ]
+        for y in range(cell_size):
+            for sprite in sprites:
+                pixels += sprite[y * cell_size : (y + 1) * cell_size]
+    return bytes(pixels)
+
+
+def test_frames_follow_the_turn_rules() -> None:
+    assert list(BISHOP_WIN.frames()) == [
+        [Change(63, ROOK), Change(42, BISHOP)],
+        [Change(63, EMPTY), Change(7, ROOK)],
+        [Change(42, EMPTY), Change(7, BISHOP)],
+    ]
+    # A rook on A8 shares a rank with the bishop on C8 and captures first.
+    assert list(RecordedGame(0, 2, ()).frames())[-1] == [
+        Change(0, EMPTY),
+        Change(2, ROOK),
+    ]
+    # Moving a whole board length comes back to the same square.
+    stay = RecordedGame(63, 42, ((MoveDirection.RIGHT, 8),), number_of_turns=1)
+    assert list(stay.frames())[1:] == [[Change(63, ROOK)]]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_recordings_replay_the_game(seed: int) -> None:
+    recorded = record_game(_play(seed), 15)
+    winner, turns = _play(seed).play_game(15)
+    frames = list(recorded.frames())
+    captured = frames[-1][-1].piece if turns <= 15 else None
+    assert captured == (None if turns > 15 else winner.emoji)
+    assert RecordedGame.from_json(recorded.to_json()) == recorded
+
+
+def test_recordings_round_trip_through_a_file(tmp_path) -> None:
+    games = [record_game(_play(seed), 15, name=str(seed)) for seed in range(5)]
+    path = str(tmp_path / "games.jsonl")
+    assert save_recordings(path, iter(games)) == 5
+    assert list(load_recordings(path)) == games
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_gif_frames_match_full_renders(tmp_path, seed: int) -> None:
+    recorded = record_game(_play(seed), 15)
+    path = tmp_path / "replay.gif"
+    export_replay(recorded, str(path), ReplayFormat.GIF, cell_size=8)
+    frames = _decode_gif(path.read_bytes())
+    board: dict[int, str] = {}
+    expected = []
+    for changes in recorded.frames():
+        for square, piece in changes:
+            if piece == EMPTY:
+                board.pop(square, None)
+            else:
+                board[square] = piece
+        expected.append(_render(board, 8, 8))
+    assert frames == expected
+
+
+def test_lzw_restarts_full_code_tables() -> None:
+    # Random pixels produce far more than the 4096 codes a table holds.
+    rng = random.Random(0)
+    pixels = bytes(rng.randrange(5) for _ in range(20_000))
+    encoded = _lzw(pixels, 3)
+    assert encoded[0] == 3
+    blocks, position = bytearray(), 1
+    while encoded[position]:
+        blocks += encoded[position + 1 : position + 1 + encoded[position]]
+        position += encoded[position] + 1
+    assert position == len(encoded) - 1
+    assert _decode_lzw(bytes(blocks), 3) == pixels
+
+
+def test_svg_animates_moves_and_captures(tmp_path) -> None:
+    path = tmp_path / "replay.svg"
+    export_replay(BISHOP_WIN, str(path), ReplayFormat.SVG, frame_seconds=1.0)
+    root = ElementTree.parse(path).getroot()
+    sets = [
+        (element.get("attributeName"), element.get("to"), element.get("begin"))
+        for element in root.iter("{http://www.w3.org/2000/svg}set")
+    ]
+    assert sets == [
+        ("x", "240", "1s"),
+        ("y", "16", "1s"),
+        ("x", "240", "2s"),
+        ("y", "16", "2s"),
+        ("visibility", "hidden", "2s"),
+    ]
+
+
+def test_cast_redraws_only_changed_squares(tmp_path) -> None:
+    path = tmp_path / "replay.cast"
+    export_replay(BISHOP_WIN, str(path), ReplayFormat.CAST)
+    header, *events = (json.loads(line) for line in path.read_text().splitlines())
+    assert header["width"] == 24
+    assert [event[0] for event in events] == [0.0, 0.5, 1.0, 1.5]
+    assert events[1][2] == "\x1b[8;22H_\x1b[1;22H♖\x1b[9;1H"
+
+
+def test_export_replays_names_files_after_games(tmp_path) -> None:
+    games = [record_game(_play(seed), 15) for seed in range(20)]
+    games[0] = games[0]._replace(name="../first game")
+    paths = export_replays(games, str(tmp_path / "out"), ReplayFormat.GIF, workers=4)
+    assert [path.rsplit("/", 1)[-1] for path in paths[:2]] == [
+        ".._first_game.gif",
+        "game-00001.gif",
+    ]
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == sorted(
+        path.rsplit("/", 1)[-1] for path in paths
+    )
+
+
+def test_export_replays_keeps_colliding_names_apart(tmp_path) -> None:
+    games = [record_game(_play(seed), 15, name="game") for seed in range(16)]
+    games[1] = games[1]._replace(name="ga/me")
+    games[2] = games[2]._replace(name="ga_me")
+    games[3] = games[3]._replace(name="game-0")
+    games[4] = games[4]._replace(name="GAME")
+    paths = export_replays(games, str(tmp_path / "out"), ReplayFormat.CAST, workers=8)
+    assert [path.rsplit("/", 1)[-1] for path in paths[:6]] == [
+        "game.cast",
+        "ga_me.cast",
+        "ga_me-2.cast",
+        "game-0.cast",
+        "GAME-4.cast",
+        "game-5.cast",
+    ]
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == sorted(
+        path.rsplit("/", 1)[-1] for path in paths
+    )
+    for game, path in zip(games, paths, strict=True):
+        alone = tmp_path / "alone.cast"
+        export_replay(game, str(alone), ReplayFormat.CAST)
+        assert open(path, "rb").read() == alone.read_bytes()
@@ -0,0 +1,88 @@
+import pytest
+
+from chess.rules import (
+    BISHOP_SPEC,
+    KNIGHT_SPEC,
+    QUEEN_SPEC,
+    ROOK_SPEC,
+    AttackTable,
+    MoveSpec,
+    compile_spec,
+)
+
+
+def _square(file_index: int, rank_index: int, board_size: int = 8) -> int:
+    return rank_index * board_size + file_index
+
+
+def test_compile_spec_is_cached_per_board_size() -> None:
+    assert compile_spec(ROOK_SPEC, 8) is compile_spec(ROOK_SPEC, 8)
+    assert compile_spec(ROOK_SPEC, 8) is not compile_spec(ROOK_SPEC, 5)
+    assert compile_spec(MoveSpec(rays=((0, 1),)), 4) is compile_spec(
+        MoveSpec(rays=((0, 1),)), 4
+    )
+
+
+def test_invalid_board_size() -> None:
+    with pytest.raises(ValueError):
+        AttackTable(ROOK_SPEC, 0)
+
+
+def test_rook_attacks_whole_file_and_rank() -> None:
+    table = compile_spec(ROOK_SPEC, 8)
+    origin = _square(2, 5)
+    for target in range(64):
+        expected = target % 8 == 2 or target // 8 == 5
+        assert table.can_attack(origin, target) is expected
+    assert len(table.destinations[origin]) == 14
+
+
+def test_bishop_attacks_diagonals_without_wrapping() -> None:
+    table = compile_spec(BISHOP_SPEC, 8)
+    origin = _square(2, 5)
+    for target in range(64):
+        expected = abs(target % 8 - 2) == abs(target // 8 - 5)
+        assert table.can_attack(origin, target) is expected
+    corner = _square(0, 7)
+    assert len(table.destinations[corner]) == 7
+
+
+def test_knight_leaps() -> None:
+    table = compile_spec(KNIGHT_SPEC, 8)
+    assert len(table.destinations[_square(0, 0)]) == 2
+    assert len(table.destinations[_square(4, 4)]) == 8
+    assert table.can_attack(_square(4, 4), _square(5, 2))
+    assert not table.can_attack(_square(4, 4), _square(5, 3))
+
+
+def test_queen_combines_rook_and_bishop() -> None:
+    rook = compile_spec(ROOK_SPEC, 6)
+    bishop = compile_spec(BISHOP_SPEC, 6)
+    queen = compile_spec(QUEEN_SPEC, 6)
+    for square in range(36):
+        assert queen.attacks[square] == rook.attacks[square] | bishop.attacks[square]
+
+
+def test_wrapping_leaps() -> None:
+    table = compile_spec(MoveSpec(leaps=((1, 0),), wrap=True), 3)
+    assert table.destinations[_square(2, 1, 3)] == (_square(0, 1, 3),)
+
+
+def test_step_wraps_around_cycles() -> None:
+    table = compile_spec(ROOK_SPEC, 8)
+    origin = _square(7, 0)
+    assert table.step(origin, (0, 1), 2) == _square(7, 6)
+    assert table.step(origin, (1, 0), 5) == _square(4, 0)
+    assert table.step(origin, (1, 0), 8) == origin
+    with pytest.raises(ValueError):
+        table.step(origin, (1, 1), 1)
+
+
+def test_step_stops_at_edges_and_range() -> None:
+    table = compile_spec(MoveSpec(rays=((0, 1),), max_range=2), 8)
+    origin = _square(0, 7)
+    assert table.step(origin, (0, 1), 2) == _square(0, 5)
+    with pytest.raises(ValueError):
+        table.step(origin, (0, 1), 3)
+    with pytest.raises(ValueError):
+        compile_spec(BISHOP_SPEC, 8).step(origin, (1, 1), 8)
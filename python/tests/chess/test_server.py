@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+
+import pytest
+
+from chess.loadgen import run_load
+from chess.move import MoveDirection
+from chess.server import GameServer, SessionError, integer_field, parse_square
+
+
+async def _with_server(scenario, **server_kwargs):
+    """Run a client scenario against a server listening on a free local port."""
+    game_server = GameServer(logger=logging.getLogger(__name__), **server_kwargs)
+    server = await game_server.start()
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with server:
+            return await scenario(game_server, port)
+    finally:
+        server.close()
+
+
+@pytest.fixture
+def rook_steps_right_two(monkeypatch):
+    """Make every rook move two squares to the right."""
+    monkeypatch.setattr("chess.game.toss_coin", lambda rng=None: MoveDirection.RIGHT)
+    monkeypatch.setattr("chess.game.roll_dice", lambda rng=None: 1)
+
+
+async def _call(reader, writer, message):
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def test_parse_square() -> None:
+    assert str(parse_square("c3", 8)) == "C3"
+    with pytest.raises(SessionError):
+        parse_square("Z9", 8)
+    with pytest.raises(SessionError):
+        parse_square("", 8)
+
+
+def test_create_and_step_until_rook_captures() -> None:
+    async def scenario(game_server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        created = await _call(
+            reader,
+            writer,
+            {"id": 1, "op": "create", "rook": "H1", "bishop": "H3", "turns": 5},
+        )
+        session_id = created["state"]["session"]
+        stepped = await _call(
+            reader, writer, {"id": 2, "op": "step", "session": session_id}
+        )
+        again = await _call(
+            reader, writer, {"id": 3, "op": "step", "session": session_id}
+        )
+        writer.close()
+        return created, stepped, again
+
+    created, stepped, again = asyncio.run(_with_server(scenario))
+
+    assert created["ok"] and created["id"] == 1
+    assert created["state"]["turn"] == 0
+    assert stepped["ok"] and stepped["id"] == 2
+    assert stepped["state"]["turn"] == 1
+    assert stepped["state"]["winner"] == "White Rook"
+    assert stepped["state"]["finished"] is True
+    assert again["ok"] is False and "finished" in again["error"]
+
+
+def test_session_times_out_with_rook_win(rook_steps_right_two) -> None:
+    async def scenario(game_server, port):
+        # H1 wraps to B1, off the C3 bishop's diagonals.
+        session = game_server.create_session("H1", "C3", number_of_turns=1)
+        return await session.step()
+
+    event = asyncio.run(_with_server(scenario))
+    assert event["turn"] == 1
+    assert event["rook"] == "B1"
+    assert event["finished"] is True
+    assert event["winner"] == "White Rook"
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [
+        b"not json\n",
+        b"[1, 2]\n",
+        b'{"op": "explode"}\n',
+        b'{"op": "step", "session": 999}\n',
+        b'{"op": "create", "rook": "A1", "bishop": "A1"}\n',
+        b'{"op": "create", "turns": 0}\n',
+        b'{"op": "create", "turns": 1e999}\n',
+        b'{"op": "create", "board_size": "8"}\n',
+        pytest.param(
+            b'{"op": "create", "rook": "' + b"H" * 70_000 + b'"}\n',
+            id="line-too-long",
+        ),
+    ],
+)
+def test_invalid_requests_return_errors(request_line: bytes) -> None:
+    async def scenario(game_server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request_line)
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        writer.close()
+        return response
+
+    response = asyncio.run(_with_server(scenario))
+    assert response["ok"] is False
+    assert response["error"]
+
+
+def test_sessions_are_discarded_when_their_client_disconnects() -> None:
+    async def scenario(game_server, port):
+        kept = game_server.create_session("H1", "C3")
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        created = [await _call(reader, writer, {"op": "create"}) for _ in range(5)]
+        closed = created[0]["state"]["session"]
+        await _call(reader, writer, {"op": "close", "session": closed})
+        while_connected = set(game_server.sessions)
+        writer.close()
+        await writer.wait_closed()
+        while len(game_server.sessions) > 1:
+            await asyncio.sleep(0.01)
+        return kept, created, while_connected, set(game_server.sessions)
+
+    kept, created, while_connected, after = asyncio.run(
+        asyncio.wait_for(_with_server(scenario), timeout=10),
+    )
+    ids = {response["state"]["session"] for response in created}
+    assert while_connected == {kept.session_id} | ids - {min(ids)}
+    assert after == {kept.session_id}
+
+
+def test_watchers_receive_turn_events() -> None:
+    async def scenario(game_server, port):
+        session = game_server.create_session("H1", "C3", number_of_turns=3)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        watched = await _call(
+            reader, writer, {"op": "watch", "session": session.session_id}
+        )
+        steps = []
+        while not session.finished:
+            steps.append(await session.step())
+        events = [json.loads(await reader.readline()) for _ in steps]
+        writer.close()
+        return watched, steps, events
+
+    watched, steps, events = asyncio.run(_with_server(scenario))
+    assert watched["ok"] is True
+    assert events == steps
+    assert all(event["event"] == "turn" for event in events)
+
+
+def test_slow_observer_is_dropped_after_timeout(rook_steps_right_two) -> None:
+    async def scenario(game_server, port):
+        # H1 to B1 to D1: neither piece can capture in the first two turns.
+        session = game_server.create_session("H1", "C3", number_of_turns=15)
+        queue = asyncio.Queue(maxsize=1)
+        session.subscribe(queue)
+        await session.step()
+        subscribed = queue in session._observers
+        await session.step()
+        return session, queue, subscribed
+
+    session, queue, subscribed = asyncio.run(
+        _with_server(scenario, publish_timeout=0.01),
+    )
+    assert subscribed
+    assert not session.finished and session.current_turn == 2
+    assert queue not in session._observers
+    assert queue.qsize() == 1
+
+
+def test_integer_field() -> None:
+    assert integer_field({"turns": 4}, "turns", 15) == 4
+    assert integer_field({}, "turns", 15) == 15
+    for value in (1e999, 4.0, "4", True, None):
+        with pytest.raises(SessionError, match="must be an integer"):
+            integer_field({"turns": value}, "turns", 15)
+
+
+def test_load_generator_plays_all_sessions() -> None:
+    async def scenario(game_server, port):
+        report = await run_load("127.0.0.1", port, sessions=20, connections=4, turns=3)
+        return report, len(game_server.sessions)
+
+    report, remaining = asyncio.run(_with_server(scenario))
+    assert report.sessions == 20
+    assert 20 <= report.turns <= 60
+    assert len(report.latencies) == report.turns
+    assert remaining == 0
+    assert "20 sessions" in str(report)
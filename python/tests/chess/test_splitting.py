@@ -0,0 +1,88 @@
+import pytest
+
+from chess.markov import RookBishopChain
+from chess.splitting import BishopWinSplitter
+
+
+def test_importance_follows_the_turns_left() -> None:
+    splitter = BishopWinSplitter(200, (100, 100))
+    # (75, 25) is 150 squares from the diagonal both moves approach, and 100 either
+    # way from the other; a move covers at most 12.
+    assert splitter.importance(75, 25, 8) == 0
+    assert splitter.importance(75, 25, 9) > 0
+    chances = [splitter.importance(75, 25, turns) for turns in range(9, 30)]
+    assert chances == sorted(chances)
+    # From (95, 99) one move lands on the first diagonal with a total of 4, and on
+    # the second, 199 of whose 200 wrapped squares are on the board, moving right
+    # with a total of 6.
+    closing, crossing = 3 / 36, 199 / 200 * 5 / 72
+    assert splitter.importance(95, 99, 1) == pytest.approx(
+        closing + crossing - closing * crossing,
+    )
+
+
+def test_without_splitting_every_game_is_plain() -> None:
+    estimate = BishopWinSplitter(8, (2, 5), splits=1).estimate(
+        (7, 7),
+        15,
+        roots=2000,
+        seed=3,
+    )
+    assert estimate.probability == pytest.approx(estimate.hits / estimate.roots)
+    assert estimate.speedup == pytest.approx(1.0, rel=0.05)
+
+
+@pytest.mark.parametrize(
+    "board_size,bishop,rook,turns",
+    [
+        (8, (2, 5), (7, 7), 15),
+        (60, (30, 30), (0, 12), 4),
+        (200, (100, 100), (75, 25), 15),
+    ],
+)
+def test_estimate_covers_exact_probability(
+    board_size: int,
+    bishop: tuple[int, int],
+    rook: tuple[int, int],
+    turns: int,
+) -> None:
+    exact = RookBishopChain(board_size, bishop).horizon(rook, turns).bishop_wins
+    estimate = BishopWinSplitter(board_size, bishop).estimate(
+        rook,
+        turns,
+        roots=4000,
+        seed=11,
+        confidence=0.999,
+    )
+    assert estimate.low <= exact <= estimate.high
+
+
+@pytest.mark.parametrize("rook,turns", [((0, 50), 5), ((75, 25), 15)])
+def test_splitting_saves_turns_on_rare_wins(rook: tuple[int, int], turns: int) -> None:
+    estimate = BishopWinSplitter(200, (100, 100)).estimate(
+        rook,
+        turns,
+        roots=3000,
+        seed=5,
+    )
+    assert estimate.hits > estimate.roots * estimate.probability
+    assert estimate.speedup > 1
+    assert estimate.turns_simulated / estimate.roots < 2 * turns
+
+
+def test_population_per_root_is_bounded() -> None:
+    splitter = BishopWinSplitter(200, (100, 100), max_population=8)
+    estimate = splitter.estimate((75, 25), 15, roots=2000, seed=2)
+    assert estimate.hits > 0
+    assert estimate.turns_simulated <= 2000 * 8 * 15
+
+
+def test_invalid_arguments_are_rejected() -> None:
+    with pytest.raises(ValueError, match="bishop"):
+        BishopWinSplitter(8, (8, 0))
+    with pytest.raises(ValueError, match="splits"):
+        BishopWinSplitter(8, (2, 2), splits=0)
+    with pytest.raises(ValueError, match="max_population"):
+        BishopWinSplitter(8, (2, 2), max_population=0)
+    with pytest.raises(ValueError, match="rook"):
+        BishopWinSplitter(8, (2, 2)).estimate((0, 9), 5)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from chess.tables import TABLE_FORMAT_VERSION, cached_arrays, table_directory
+
+
+def test_table_directory_honours_the_environment(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("CHESS_TABLE_CACHE", str(tmp_path))
+    assert table_directory() == tmp_path
+
+
+def test_cached_arrays_builds_once_and_memory_maps(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("CHESS_TABLE_CACHE", str(tmp_path))
+    builds = []
+
+    def build() -> dict[str, np.ndarray]:
+        builds.append(1)
+        return {"squares": np.arange(6, dtype=np.int64), "weights": np.ones(3)}
+
+    first = cached_arrays("example", build)
+    second = cached_arrays("example", build)
+
+    assert len(builds) == 1
+    assert isinstance(second["squares"], np.memmap)
+    assert not second["squares"].flags.writeable
+    assert np.array_equal(first["squares"], np.arange(6))
+    assert np.array_equal(second["weights"], np.ones(3))
+    assert (tmp_path / f"v{TABLE_FORMAT_VERSION}" / "example").is_dir()
+
+
+def test_cached_arrays_rebuilds_a_corrupt_table(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("CHESS_TABLE_CACHE", str(tmp_path))
+    cached_arrays("example", lambda: {"values": np.arange(4)})
+    (tmp_path / f"v{TABLE_FORMAT_VERSION}" / "example" / "values.npy").write_bytes(
+        b"garbage",
+    )
+
+    rebuilt = cached_arrays("example", lambda: {"values": np.arange(4)})
+
+    assert np.array_equal(rebuilt["values"], np.arange(4))
+
+
+def test_cached_arrays_falls_back_when_the_cache_is_unwritable(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    monkeypatch.setenv("CHESS_TABLE_CACHE", str(blocker / "cache"))
+
+    arrays = cached_arrays("example", lambda: {"values": np.arange(3)})
+
+    assert np.array_equal(arrays["values"], np.arange(3))
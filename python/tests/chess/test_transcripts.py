@@ -0,0 +1,168 @@
+import gzip
+import logging
+import threading
+
+import pytest
+
+from chess.transcripts import Compression, QueuePolicy, TranscriptHandler
+
+
+def _logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.Logger("transcript-test", level=logging.INFO)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def test_records_are_written_in_order(tmp_path) -> None:
+    path = tmp_path / "game.log"
+    handler = TranscriptHandler(str(path), batch_size=7)
+    logger = _logger(handler)
+    for turn in range(100):
+        logger.info("turn %d", turn)
+    handler.close()
+
+    lines = path.read_text().splitlines()
+    assert lines == [f"INFO turn {turn}" for turn in range(100)]
+
+
+def test_flush_writes_out_queued_records(tmp_path) -> None:
+    path = tmp_path / "game.log"
+    handler = TranscriptHandler(str(path), flush_interval=60.0)
+    logger = _logger(handler)
+    logger.info("first")
+    handler.flush()
+    assert path.read_text() == "INFO first\n"
+    handler.close()
+
+
+def test_gzip_transcripts_round_trip(tmp_path) -> None:
+    path = tmp_path / "game.log.gz"
+    handler = TranscriptHandler(str(path), compression=Compression.GZIP)
+    logger = _logger(handler)
+    for turn in range(50):
+        logger.info(f"turn {turn}")
+    handler.close()
+
+    with gzip.open(path, "rt") as transcript:
+        assert transcript.read().splitlines()[-1] == "INFO turn 49"
+
+
+def test_transcripts_rotate_by_size(tmp_path) -> None:
+    path = tmp_path / "game.log"
+    handler = TranscriptHandler(
+        str(path),
+        max_bytes=200,
+        backup_count=2,
+        batch_size=1,
+        buffer_size=0,
+    )
+    logger = _logger(handler)
+    for turn in range(100):
+        logger.info("turn %03d", turn)
+    handler.close()
+
+    rotated = sorted(file.name for file in tmp_path.iterdir())
+    assert rotated == ["game.log", "game.log.1", "game.log.2"]
+    assert path.read_text().splitlines()[-1] == "INFO turn 099"
+    assert all(
+        (tmp_path / name).stat().st_size <= 200 + len("INFO turn 000\n")
+        for name in rotated
+    )
+
+
+class _StalledHandler(TranscriptHandler):
+    """Transcript handler whose writer waits until released."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.unblock = threading.Event()
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+    def _write_batch(self, batch: list[str]) -> None:
+        self.unblock.wait()
+        super()._write_batch(batch)
+
+
+def test_drop_policy_counts_records_that_do_not_fit(tmp_path) -> None:
+    path = tmp_path / "game.log"
+    handler = _StalledHandler(
+        str(path),
+        queue_size=4,
+        policy=QueuePolicy.DROP,
+        batch_size=1,
+    )
+    logger = _logger(handler)
+    for turn in range(50):
+        logger.info("turn %d", turn)
+    assert handler.dropped >= 50 - 4 - 1
+    handler.unblock.set()
+    handler.close()
+
+    written = path.read_text().splitlines()
+    assert len(written) == 50 - handler.dropped
+    assert written[0] == "INFO turn 0"
+
+
+class _ReportingHandler(TranscriptHandler):
+    """Transcript handler that keeps the records of reported errors."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.errors: list[logging.LogRecord] = []
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+    def handleError(self, record: logging.LogRecord) -> None:
+        self.errors.append(record)
+
+
+def _log_in_thread(logger: logging.Logger, records: int) -> bool:
+    """Log from another thread and return whether it finished in time."""
+    thread = threading.Thread(
+        target=lambda: [logger.info("turn %d", turn) for turn in range(records)],
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=10)
+    return not thread.is_alive()
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1 << 20])
+def test_write_errors_are_reported_and_the_writer_keeps_draining(
+    buffer_size: int,
+) -> None:
+    handler = _ReportingHandler(
+        "/dev/full",
+        queue_size=8,
+        batch_size=2,
+        buffer_size=buffer_size,
+        flush_interval=0.01,
+    )
+    logger = _logger(handler)
+    assert _log_in_thread(logger, 200)
+    handler.flush()
+    assert handler.errors
+    assert handler._writer.is_alive()
+    if not buffer_size:
+        assert handler.failed == 200
+    handler.close()
+    assert handler.dropped == 0
+
+
+def test_records_are_dropped_once_the_writer_has_stopped(tmp_path) -> None:
+    handler = TranscriptHandler(str(tmp_path / "game.log"), queue_size=2)
+    logger = _logger(handler)
+    handler.close()
+    assert _log_in_thread(logger, 10)
+    assert handler.dropped == 10 - 2
+
+
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [({"queue_size": 0}, "queue_size"), ({"flush_interval": 0}, "flush_interval")],
+)
+def test_invalid_arguments_are_rejected(
+    tmp_path,
+    arguments: dict[str, int],
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        TranscriptHandler(str(tmp_path / "game.log"), **arguments)
@@ -0,0 +1,82 @@
+import logging
+import random
+
+import pytest
+
+from chess.game import Game
+from chess.pieces import Bishop, Coordinate, PieceColor, Rook
+from chess.rules import ORTHOGONAL
+from chess.variants import Variant, build_kernel, play_variant
+
+VARIANTS = [
+    Variant(),
+    Variant(board_size=10, dice=3, sides=4, directions=ORTHOGONAL),
+    Variant(rook_captures_first=False, number_of_turns=30),
+    Variant(board_size=5, dice=1, sides=20, directions=((-1, 0),)),
+]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_default_kernel_replays_game(seed: int) -> None:
+    logger = logging.getLogger("test_variants")
+    logger.disabled = True
+    game = Game(
+        rook=Rook(Coordinate("h", 1), PieceColor.WHITE),
+        bishop=Bishop(Coordinate("c", 3), PieceColor.BLACK),
+        logger=logger,
+        metrics=None,
+        rng=random.Random(seed),
+    )
+    winner, turns = game.play_game(15)
+
+    rook = Coordinate("h", 1).square_id()
+    bishop = Coordinate("c", 3).square_id()
+    assert build_kernel(Variant())(rook, bishop, random.Random(seed)) == (
+        winner is game.rook,
+        turns,
+    )
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_kernel_matches_generic_path(variant: Variant) -> None:
+    kernel = build_kernel(variant)
+    squares = variant.board_size**2
+    for seed in range(200):
+        rook, bishop = seed % squares, (seed * 7 + 3) % squares
+        assert kernel(rook, bishop, random.Random(seed)) == play_variant(
+            variant,
+            rook,
+            bishop,
+            random.Random(seed),
+        )
+
+
+def test_capture_order() -> None:
+    # A rook on a8 sits on the diagonal of a bishop on b7 and the rank of one on
+    # c8, so whichever piece checks first can win before the rook moves.
+    rook = Coordinate("a", 8).square_id()
+    on_diagonal = Coordinate("b", 7).square_id()
+    on_rank = Coordinate("c", 8).square_id()
+    bishop_first = build_kernel(Variant(rook_captures_first=False))
+    assert bishop_first(rook, on_diagonal, random.Random(0)) == (False, 1)
+    assert build_kernel(Variant())(rook, on_rank, random.Random(0)) == (True, 1)
+
+
+def test_kernels_are_cached_per_variant() -> None:
+    assert build_kernel(Variant()) is build_kernel(Variant())
+    assert build_kernel(Variant()) is not build_kernel(Variant(number_of_turns=16))
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        Variant(board_size=0),
+        Variant(dice=0),
+        Variant(directions=()),
+        Variant(directions=((1, 1),)),
+        Variant(number_of_turns=-1),
+    ],
+)
+def test_invalid_variants_are_rejected(variant: Variant) -> None:
+    with pytest.raises(ValueError):
+        build_kernel(variant)
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def table_cache(tmp_path_factory, monkeypatch):
+    """Keep cached lookup tables out of the user's cache directory."""
+    directory = tmp_path_factory.getbasetemp() / "table-cache"
+    monkeypatch.setenv("CHESS_TABLE_CACHE", str(directory))
+    return directory
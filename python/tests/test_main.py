@@ -0,0 +1,73 @@
+import subprocess
+import sys
+
+import pytest
+
+import main
+
+
+def test_importing_main_stays_lightweight() -> None:
+    heavy = ("numpy", "scipy", "asyncio", "http.server", "chess.markov")
+    script = (
+        "import sys, main; "
+        f"print(sorted(m for m in sys.modules if m.startswith({heavy!r})))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed.stdout.strip() == "[]"
+
+
+def test_importing_main_leaves_logging_alone() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-c", "import logging, main; print(logging.root.handlers)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed.stdout.strip() == "[]"
+
+
+def test_play_logs_the_winner(capsys) -> None:
+    main.main(["play", "--rook", "C1", "--bishop", "C3", "--turns", "5"])
+    assert "ChessGame [INFO] The White Rook wins in 1 turns" in capsys.readouterr().err
+
+
+def test_solve_prints_exact_probabilities(capsys) -> None:
+    main.main(["solve", "--rook", "C1", "--bishop", "C3", "--turns", "5"])
+    assert capsys.readouterr().out.splitlines() == [
+        "rook wins: 1.000000",
+        "bishop wins: 0.000000",
+        "timeouts: 0.000000",
+    ]
+
+
+def test_invalid_square_is_rejected() -> None:
+    with pytest.raises(ValueError, match="file letter"):
+        main.main(["play", "--rook", "C"])
+
+
+def test_transcript_option_writes_the_log_to_a_file(tmp_path, capsys) -> None:
+    path = tmp_path / "game.log"
+    main.main(["--transcript", str(path), "play", "--rook", "C1", "--turns", "5"])
+    assert "The White Rook wins in 1 turns" in path.read_text()
+    assert "ChessGame" not in capsys.readouterr().err
+
+
+def test_record_and_replay_export_animations(tmp_path, capsys) -> None:
+    recordings = tmp_path / "games.jsonl"
+    main.main(["record", str(recordings), "--games", "3", "--seed", "1"])
+    main.main(
+        ["replay", str(recordings), "--format", "cast", "--output-dir", str(tmp_path)],
+    )
+    assert capsys.readouterr().out.splitlines()[-1] == (
+        f"exported 3 cast replays to {tmp_path}"
+    )
+    assert sorted(path.name for path in tmp_path.glob("*.cast")) == [
+        "game-00000.cast",
+        "game-00001.cast",
+        "game-00002.cast",
+    ]